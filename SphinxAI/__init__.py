@@ -12,18 +12,41 @@ combining Sphinx indexing with machine learning models for intelligent search re
 __version__ = "1.0.0"
 __author__ = "SMF Sphinx AI Team"
 
-# Import main components for easier access
-try:
-    from .utils.cache import SphinxAICache, get_cache_instance
-    from .utils.config_manager import ConfigManager
-
-    __all__ = [
-        "SphinxAICache",
-        "get_cache_instance",
-        "ConfigManager",
-        "__version__",
-        "__author__",
-    ]
-except ImportError:
-    # Allow package to be imported even if dependencies are missing
-    __all__ = ["__version__", "__author__"]
+import importlib
+from typing import Any, Dict, List
+
+# Main components resolved on first access (PEP 562), so importing the
+# package does not pull in the cache and configuration dependency trees
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "SphinxAICache": ".utils.cache",
+    "get_cache_instance": ".utils.cache",
+    "ConfigManager": ".utils.config_manager",
+}
+
+__all__ = [
+    "SphinxAICache",
+    "get_cache_instance",
+    "ConfigManager",
+    "__version__",
+    "__author__",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        # Allow package to be imported even if dependencies are missing
+        raise AttributeError(f"{name!r} is unavailable, missing dependency: {e}") from e
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
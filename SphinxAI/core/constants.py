@@ -9,8 +9,19 @@ used across different components of the Sphinx AI Search system.
 
 import configparser
 import json
+import re
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Version and metadata
 VERSION = "1.0.0"
@@ -20,99 +31,101 @@ PLUGIN_DESCRIPTION = (
 )
 
 # Polish language constants
-POLISH_STOPWORDS: Set[str] = {
-    "a",
-    "aby",
-    "ale",
-    "albo",
-    "am",
-    "an",
-    "ani",
-    "bardzo",
-    "bez",
-    "będzie",
-    "by",
-    "być",
-    "ci",
-    "co",
-    "czy",
-    "dla",
-    "do",
-    "gdy",
-    "go",
-    "i",
-    "ich",
-    "ile",
-    "im",
-    "ja",
-    "jak",
-    "jako",
-    "je",
-    "jego",
-    "jej",
-    "jeden",
-    "jednej",
-    "jedną",
-    "już",
-    "każdy",
-    "która",
-    "które",
-    "której",
-    "lub",
-    "ma",
-    "mają",
-    "może",
-    "my",
-    "na",
-    "nad",
-    "nasz",
-    "nasze",
-    "naszego",
-    "nie",
-    "niego",
-    "niej",
-    "nim",
-    "nimi",
-    "o",
-    "od",
-    "oraz",
-    "po",
-    "pod",
-    "przez",
-    "się",
-    "są",
-    "ta",
-    "tak",
-    "tam",
-    "te",
-    "tej",
-    "tem",
-    "temu",
-    "to",
-    "tu",
-    "ty",
-    "tym",
-    "w",
-    "we",
-    "właśnie",
-    "z",
-    "za",
-    "ze",
-    "że",
-    "żeby",
-    "tylko",
-    "także",
-    "więc",
-    "gdzie",
-    "kiedy",
-    "czyli",
-    "dlatego",
-    "jednak",
-    "między",
-    "przed",
-    "podczas",
-    "zatem",
-}
+POLISH_STOPWORDS: FrozenSet[str] = frozenset(
+    {
+        "a",
+        "aby",
+        "ale",
+        "albo",
+        "am",
+        "an",
+        "ani",
+        "bardzo",
+        "bez",
+        "będzie",
+        "by",
+        "być",
+        "ci",
+        "co",
+        "czy",
+        "dla",
+        "do",
+        "gdy",
+        "go",
+        "i",
+        "ich",
+        "ile",
+        "im",
+        "ja",
+        "jak",
+        "jako",
+        "je",
+        "jego",
+        "jej",
+        "jeden",
+        "jednej",
+        "jedną",
+        "już",
+        "każdy",
+        "która",
+        "które",
+        "której",
+        "lub",
+        "ma",
+        "mają",
+        "może",
+        "my",
+        "na",
+        "nad",
+        "nasz",
+        "nasze",
+        "naszego",
+        "nie",
+        "niego",
+        "niej",
+        "nim",
+        "nimi",
+        "o",
+        "od",
+        "oraz",
+        "po",
+        "pod",
+        "przez",
+        "się",
+        "są",
+        "ta",
+        "tak",
+        "tam",
+        "te",
+        "tej",
+        "tem",
+        "temu",
+        "to",
+        "tu",
+        "ty",
+        "tym",
+        "w",
+        "we",
+        "właśnie",
+        "z",
+        "za",
+        "ze",
+        "że",
+        "żeby",
+        "tylko",
+        "także",
+        "więc",
+        "gdzie",
+        "kiedy",
+        "czyli",
+        "dlatego",
+        "jednak",
+        "między",
+        "przed",
+        "podczas",
+        "zatem",
+    }
+)
 
 POLISH_DIACRITICS_MAP: Dict[str, str] = {
     "ą": "a",
@@ -135,15 +148,37 @@ POLISH_DIACRITICS_MAP: Dict[str, str] = {
     "Ż": "Z",
 }
 
+# Single-pass translation table for POLISH_DIACRITICS_MAP (use with str.translate)
+POLISH_DIACRITICS_TRANS: Dict[int, str] = str.maketrans(POLISH_DIACRITICS_MAP)
+
+# UTF-8 byte sequences of POLISH_DIACRITICS_MAP for normalizing encoded text
+POLISH_DIACRITICS_BYTES_MAP: Dict[bytes, bytes] = {
+    polish.encode("utf-8"): latin.encode("ascii")
+    for polish, latin in POLISH_DIACRITICS_MAP.items()
+}
+
+# Polish diacritic characters for set-based detection (see has_polish_chars)
+POLISH_CHARS: FrozenSet[str] = frozenset(POLISH_DIACRITICS_MAP)
+
 # Model configuration constants
 DEFAULT_EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
 DEFAULT_CHAT_MODEL = "TinyLlama/TinyLlama-1.1B-Chat-v1.0"
 MAX_CONTEXT_LENGTH = 4096
 MAX_SUMMARY_LENGTH = 200
 MAX_ANSWER_LENGTH = 150
+# Summary lengths are in characters; Polish text averages about three
+# characters per token, which bounds the tokens a summary may generate
+SUMMARY_CHARS_PER_TOKEN = 3
+# Summary generation stops once this multiple of max_length was produced
+SUMMARY_STOP_MARGIN = 1.2
 
 # Search configuration
 DEFAULT_MAX_RESULTS = 10
+# Queries answered without touching any handler: shorter than
+# MIN_QUERY_LENGTH (2 keeps steel grades like "D2" searchable), only
+# punctuation, or a bare one- or two-digit number
+MIN_QUERY_LENGTH = 2
+TRIVIAL_QUERY_REGEX = re.compile(r"^[\W_]+$|^\d{1,2}$")
 SIMILARITY_THRESHOLD = 0.1
 CONTENT_TRUNCATE_LENGTH = 500
 
@@ -155,6 +190,43 @@ COMPRESSED_DIR = "SphinxAI/models/compressed"
 GENAI_DIR = "SphinxAI/models/genai"
 CONFIG_DIR = "SphinxAI/config"
 
+# Embedding inference backend: "openvino-int8" loads the INT8-quantized
+# OpenVINO export of DEFAULT_EMBEDDING_MODEL, "torch" the original weights
+DEFAULT_EMBEDDING_BACKEND = "openvino-int8"
+OPENVINO_MODEL_PATH = f"{COMPRESSED_DIR}/paraphrase-multilingual-mpnet-base-v2"
+OPENVINO_INT8_MODEL_FILE = "openvino/openvino_model_qint8_quantized.xml"
+# Where the on-the-fly INT8 export is saved so it is only done once
+OPENVINO_INT8_CACHE_DIR = "~/.cache/sphinxai_ov_int8"
+# Subdirectory of the GenAI model where its INT8 weight-compressed copy is kept
+GENAI_INT8_SUBDIR = "int8"
+
+# Number of recently encoded texts whose embeddings are kept in memory
+EMBEDDING_LRU_SIZE = 10000
+
+# Texts encoded per forward pass of the embedding model
+EMBEDDING_BATCH_SIZE = 32
+# Devices on which the torch embedding backend runs in float16, mapped
+# from OpenVINO device names to torch device names
+TORCH_HALF_PRECISION_DEVICES: Dict[str, str] = {
+    "GPU": "cuda",
+    "CUDA": "cuda",
+    "XPU": "xpu",
+}
+
+# Number of classified contents whose category is kept in memory
+CATEGORY_LRU_SIZE = 8192
+
+# Seconds detected Sphinx index fields are reused before DESCRIBE runs again
+INDEX_FIELDS_TTL = 3600
+
+# KV cache size (GB) of the GenAI pipeline; prefix caching lets requests
+# sharing a prompt prefix reuse its KV blocks instead of re-running prefill
+GENAI_KV_CACHE_SIZE_GB = 1
+
+# Without continuous batching, batched prompts are padded to the longest
+# one; prompts are grouped into buckets of this many characters of length
+PROMPT_BUCKET_CHARS = 256
+
 # Logging configuration
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL = "INFO"
@@ -175,6 +247,19 @@ REGEX_PATTERNS = {
     "polish_chars": r"[ąćęłńóśźżĄĆĘŁŃÓŚŹŻ]",
 }
 
+# REGEX_PATTERNS compiled once at import so callers skip the re cache lookup
+COMPILED_REGEX_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    name: re.compile(pattern) for name, pattern in REGEX_PATTERNS.items()
+}
+
+# Patterns stripped from forum content, in removal priority order
+NOISE_PATTERN_NAMES: Tuple[str, ...] = ("bbcode", "html_tags", "url", "email")
+
+# All noise patterns as one alternation, removed in a single pass
+COMBINED_NOISE_REGEX: "re.Pattern[str]" = re.compile(
+    "|".join(f"(?:{REGEX_PATTERNS[name]})" for name in NOISE_PATTERN_NAMES)
+)
+
 
 # Enhanced Polish prompts for forum-specific content
 ENHANCED_POLISH_PROMPTS = {
@@ -212,8 +297,82 @@ Treść: {content}
 Kategoria:""",
 }
 
+# Prompt templates split into (literal text, field name) pairs, so backends
+# can tokenize the static instruction text once and encode only the fields
+ENHANCED_POLISH_PROMPT_PARTS: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {
+    name: tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+    for name, template in ENHANCED_POLISH_PROMPTS.items()
+}
+
+
+def _compile_prompt(parts: Tuple[Tuple[str, Optional[str]], ...]) -> Callable[..., str]:
+    """Build prompt function joining pre-parsed template parts"""
+
+    def render(**fields: str) -> str:
+        return "".join(
+            literal if field_name is None else literal + fields[field_name]
+            for literal, field_name in parts
+        )
+
+    return render
+
+
+# Precompiled prompt templates, equivalent to ENHANCED_POLISH_PROMPTS[name].format
+# without re-parsing the template on every call
+ENHANCED_POLISH_PROMPT_FNS: Dict[str, Callable[..., str]] = {
+    name: _compile_prompt(parts) for name, parts in ENHANCED_POLISH_PROMPT_PARTS.items()
+}
+
 
 # Configuration loading functionality
+# Parsed configuration files shared by all ConfigManager instances, keyed by
+# (path, st_mtime_ns, st_size) so that editing a file invalidates its entry
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _parse_ini_file(path: Path) -> Dict[str, Any]:
+    """Parse INI file into a dictionary of sections"""
+    ini_parser = configparser.ConfigParser()
+    ini_parser.read(path)
+    return {name: dict(ini_parser[name]) for name in ini_parser.sections()}
+
+
+def _parse_json_file(path: Path) -> Dict[str, Any]:
+    """Parse JSON file in one read, using orjson when installed"""
+    return _loads(path.read_bytes())
+
+
+def _load_cached_file(
+    path: Path, parser: Callable[[Path], Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Load configuration file through the shared mtime-keyed cache
+
+    Args:
+        path: Configuration file path
+        parser: Function parsing the file into a dictionary
+
+    Returns:
+        Parsed configuration, or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    parsed = _CONFIG_CACHE.get(key)
+    if parsed is None:
+        parsed = parser(path)
+        # Drop entries for previous versions of the same file
+        for stale_key in [k for k in _CONFIG_CACHE if k[0] == key[0]]:
+            del _CONFIG_CACHE[stale_key]
+        _CONFIG_CACHE[key] = parsed
+    return parsed
+
+
 class ConfigManager:
     """Manages configuration loading from INI and JSON files"""
 
@@ -228,6 +387,7 @@ class ConfigManager:
         self.json_config_path = self.base_dir / "config.json"
         self._config: Optional[Dict[str, Any]] = None
         self._json_config: Optional[Dict[str, Any]] = None
+        self._paths: Optional[Mapping[str, str]] = None
 
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from INI and JSON files
@@ -236,32 +396,30 @@ class ConfigManager:
             Combined configuration dictionary
         """
         if self._config is None:
-            self._config = {}
-
-            # Load INI configuration (sensitive settings like database)
-            if self.ini_config_path.exists():
-                ini_parser = configparser.ConfigParser()
-                ini_parser.read(self.ini_config_path)
-
-                for section_name in ini_parser.sections():
-                    self._config[section_name] = dict(ini_parser[section_name])
-
-            # Load JSON configuration (project settings)
-            if self.json_config_path.exists():
-                with open(self.json_config_path, "r", encoding="utf-8") as f:
-                    json_config = json.load(f)
-
-                # Merge JSON config, with INI taking precedence
-                for key, value in json_config.items():
-                    if key not in self._config:
-                        self._config[key] = value
-                    elif isinstance(value, dict) and isinstance(
-                        self._config[key], dict
-                    ):
-                        # Merge dictionaries, INI values take precedence
-                        merged = value.copy()
-                        merged.update(self._config[key])
-                        self._config[key] = merged
+            merged: Dict[str, Any] = {}
+
+            # Start from JSON configuration (project settings). Sections are
+            # copied since they are shared via the cache and getters adjust
+            # them in place.
+            json_config = _load_cached_file(self.json_config_path, _parse_json_file)
+            if json_config is not None:
+                merged = {
+                    key: dict(value) if isinstance(value, dict) else value
+                    for key, value in json_config.items()
+                }
+
+            # Overlay INI configuration (sensitive settings like database),
+            # INI values take precedence
+            ini_config = _load_cached_file(self.ini_config_path, _parse_ini_file)
+            if ini_config is not None:
+                for section_name, section in ini_config.items():
+                    base = merged.get(section_name)
+                    if isinstance(base, dict):
+                        base.update(section)
+                    else:
+                        merged[section_name] = dict(section)
+
+            self._config = merged
 
         return self._config
 
@@ -327,21 +485,28 @@ class ConfigManager:
         config = self.load_config()
         return config.get("logging", {})
 
-    def get_paths_config(self) -> Dict[str, str]:
+    def get_paths_config(self) -> Mapping[str, str]:
         """Get paths configuration with absolute paths
 
         Returns:
-            Paths configuration dictionary
+            Read-only paths configuration mapping
         """
-        config = self.load_config()
-        paths = config.get("paths", {})
-
-        # Convert relative paths to absolute
-        for key, path in paths.items():
-            if path and not Path(path).is_absolute():
-                paths[key] = str(self.base_dir.parent / path)
-
-        return paths
+        if self._paths is None:
+            config = self.load_config()
+
+            # Convert relative paths to absolute once
+            self._paths = MappingProxyType(
+                {
+                    key: (
+                        str(self.base_dir.parent / path)
+                        if path and not Path(path).is_absolute()
+                        else path
+                    )
+                    for key, path in config.get("paths", {}).items()
+                }
+            )
+
+        return self._paths
 
     def config_exists(self) -> bool:
         """Check if configuration files exist
@@ -351,42 +516,74 @@ class ConfigManager:
         """
         return self.ini_config_path.exists() or self.json_config_path.exists()
 
+    def reload(self) -> Dict[str, Any]:
+        """Discard loaded configuration and read the files again
+
+        Returns:
+            Combined configuration dictionary
+        """
+        self._config = None
+        self._paths = None
+        return self.load_config()
+
 
 # Global configuration manager instance
 config_manager = ConfigManager()
 
 
-# Convenience functions for backward compatibility
+# Convenience functions for backward compatibility, cached until reload_config()
+@lru_cache(maxsize=1)
 def get_database_config() -> Dict[str, Any]:
     """Get database configuration"""
     return config_manager.get_database_config()
 
 
+@lru_cache(maxsize=1)
 def get_model_config() -> Dict[str, Any]:
     """Get model configuration"""
     return config_manager.get_model_config()
 
 
+@lru_cache(maxsize=1)
 def get_sphinx_config() -> Dict[str, Any]:
     """Get Sphinx configuration"""
     return config_manager.get_sphinx_config()
 
 
+@lru_cache(maxsize=1)
 def get_cache_config() -> Dict[str, Any]:
     """Get cache configuration"""
     return config_manager.get_cache_config()
 
 
+@lru_cache(maxsize=1)
 def get_security_config() -> Dict[str, Any]:
     """Get security configuration"""
     return config_manager.get_security_config()
 
 
+@lru_cache(maxsize=1)
 def get_logging_config() -> Dict[str, Any]:
     """Get logging configuration"""
     return config_manager.get_logging_config()
 
 
-def get_paths_config() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def get_paths_config() -> Mapping[str, str]:
     """Get paths configuration"""
     return config_manager.get_paths_config()
+
+
+def reload_config() -> Dict[str, Any]:
+    """Reload configuration files and reset the cached convenience getters"""
+    for getter in (
+        get_database_config,
+        get_model_config,
+        get_sphinx_config,
+        get_cache_config,
+        get_security_config,
+        get_logging_config,
+        get_paths_config,
+    ):
+        getter.cache_clear()
+    return config_manager.reload()
@@ -6,12 +6,36 @@ This module defines the core interfaces that all handlers must implement,
 following the Interface Segregation Principle.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from ..utils.embedding_utils import EmbeddingDiskCache
+
+
+def _as_contig_f32(array: NDArray[np.float32]) -> NDArray[np.float32]:
+    """
+    Return embeddings as a C-contiguous float32 array.
+
+    AIHandler implementations should apply this once when embeddings are
+    produced or loaded, not per similarity call, so BLAS never has to copy
+    strided input. It is a no-op for arrays that already satisfy the contract.
+    """
+    return np.ascontiguousarray(array, dtype=np.float32)
+
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+# Keyword-only dataclass fields (Python 3.10+)
+_KW_ONLY: Dict[str, bool] = {"kw_only": True} if sys.version_info >= (3, 10) else {}
+
 
 class SearchHandler(ABC):
     """Abstract base class for search handlers."""
@@ -30,6 +54,25 @@ class SearchHandler(ABC):
         """
         ...
 
+    @abstractmethod
+    def search_batch(
+        self, queries: List[str], max_results: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Perform search operation for several queries at once.
+
+        Implementations should share per-call work (connections, embedding
+        forward passes, similarity matrix products) across the whole batch.
+
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        ...
+
     @abstractmethod
     def get_status(self) -> Dict[str, Any]:
         """Get handler status information."""
@@ -48,7 +91,43 @@ class AIHandler(ABC):
             texts: List of texts to embed
 
         Returns:
-            Embeddings array or None if failed
+            C-contiguous float32 array of shape (N, D) with L2-normalized
+            rows, or None if failed
+        """
+        ...
+
+    @abstractmethod
+    def generate_embeddings_cached(
+        self, texts: List[str], cache: "EmbeddingDiskCache"
+    ) -> Optional[NDArray[np.float32]]:
+        """
+        Generate embeddings, computing only texts missing from the cache.
+
+        Cache misses are encoded in one batch and written back, so rebuilding
+        embeddings for mostly unchanged content costs only the new texts.
+
+        Args:
+            texts: List of texts to embed
+            cache: Content-hash keyed embedding cache
+
+        Returns:
+            C-contiguous float32 array of shape (N, D) with L2-normalized
+            rows, or None if failed
+        """
+        ...
+
+    @abstractmethod
+    def generate_embeddings_int8(
+        self, texts: List[str]
+    ) -> Optional[Tuple[NDArray[np.int8], NDArray[np.float32]]]:
+        """
+        Generate int8-quantized embeddings for text list.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Tuple of (quantized rows, per-row float32 scales) or None if failed
         """
         ...
 
@@ -56,14 +135,23 @@ class AIHandler(ABC):
     def calculate_similarity(
         self,
         query_embedding: NDArray[np.float32],
-        content_embeddings: NDArray[np.float32],
+        content_embeddings: NDArray[Any],
+        content_scales: Optional[NDArray[np.float32]] = None,
     ) -> Optional[NDArray[np.float32]]:
         """
         Calculate similarity between query and content embeddings.
 
+        Both inputs are expected to be L2-normalized and C-contiguous (as
+        returned by generate_embeddings, see _as_contig_f32), so cosine
+        similarity reduces to a single ``content_embeddings @ query_embedding``
+        product without hidden copies. When
+        ``content_scales`` is given, ``content_embeddings`` holds int8 rows
+        from generate_embeddings_int8 and the product accumulates in int32.
+
         Args:
-            query_embedding: Query embedding
-            content_embeddings: Content embeddings
+            query_embedding: Query embedding of shape (D,)
+            content_embeddings: Content embeddings of shape (N, D), row-major
+            content_scales: Per-row scales of shape (N,) for int8 embeddings
 
         Returns:
             Similarity scores or None if failed
@@ -85,6 +173,26 @@ class AIHandler(ABC):
         """
         ...
 
+    @abstractmethod
+    def generate_summaries(
+        self, queries: List[str], contents: List[str], max_length: int = 200
+    ) -> List[str]:
+        """
+        Generate summaries for several contents in one batch.
+
+        Implementations should submit all prompts in a single generation call
+        so the backend can batch decoding and reuse the shared prompt prefix.
+
+        Args:
+            queries: Search query for each content
+            contents: Contents to summarize
+            max_length: Maximum summary length
+
+        Returns:
+            Generated summaries, in input order
+        """
+        ...
+
     @abstractmethod
     def preprocess_text(self, text: str) -> str:
         """
@@ -109,7 +217,13 @@ class TextProcessor(ABC):
 
     @abstractmethod
     def normalize_diacritics(self, text: str) -> str:
-        """Normalize diacritics in text."""
+        """
+        Normalize diacritics in text.
+
+        Implementations should map characters in a single pass with
+        ``text.translate(POLISH_DIACRITICS_TRANS)`` instead of looping
+        over ``POLISH_DIACRITICS_MAP`` with ``str.replace``.
+        """
         ...
 
     @abstractmethod
@@ -117,6 +231,17 @@ class TextProcessor(ABC):
         """Remove stopwords from word list."""
         ...
 
+    @abstractmethod
+    def remove_stopword_ids(self, ids: NDArray[np.int32]) -> NDArray[np.int32]:
+        """
+        Remove stopword token ids from a tokenized text.
+
+        Filtering works on integer ids with a vectorized ``np.isin`` against
+        the stopwords' ids in the active tokenizer vocabulary, so tokens
+        never go back to Python strings.
+        """
+        ...
+
     @abstractmethod
     def clean_forum_content(self, text: str) -> str:
         """Clean forum-specific content."""
@@ -196,27 +321,22 @@ class Logger(ABC):
 
 
 # Result data classes for type safety
+@dataclass(**_DATACLASS_SLOTS)
 class SearchResult:
     """Data class for search results."""
 
-    def __init__(
-        self,
-        result_id: str,
-        title: str,
-        content: str,
-        url: str,
-        *,  # Force keyword-only arguments
-        relevance_score: float = 0.0,
-        ai_summary: str = "",
-        metadata: Optional[Dict[str, Any]] = None
-    ):
-        self.id = result_id
-        self.title = title
-        self.content = content
-        self.url = url
-        self.relevance_score = relevance_score
-        self.ai_summary = ai_summary
-        self.metadata = metadata or {}
+    id: str
+    title: str
+    content: str
+    url: str
+    relevance_score: float = field(default=0.0, **_KW_ONLY)
+    ai_summary: str = field(default="", **_KW_ONLY)
+    metadata: Dict[str, Any] = field(default_factory=dict, **_KW_ONLY)
+
+    def __post_init__(self) -> None:
+        # metadata=None is accepted for an empty dict, as before
+        if self.metadata is None:
+            self.metadata = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -231,20 +351,19 @@ class SearchResult:
         }
 
 
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessingResult:
     """Data class for processing results."""
 
-    def __init__(
-        self,
-        success: bool,
-        message: str = "",
-        data: Optional[Any] = None,
-        errors: Optional[List[str]] = None,
-    ):
-        self.success = success
-        self.message = message
-        self.data = data
-        self.errors = errors or []
+    success: bool
+    message: str = ""
+    data: Optional[Any] = None
+    errors: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # errors=None is accepted for an empty list, as before
+        if self.errors is None:
+            self.errors = []
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
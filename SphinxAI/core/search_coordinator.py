@@ -6,13 +6,35 @@ This module implements the main search coordinator following SOLID principles
 and clean architecture patterns.
 """
 
+import asyncio
+import functools
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar
 
+from ..core.constants import MIN_QUERY_LENGTH, TRIVIAL_QUERY_REGEX
 from ..core.interfaces import AIHandler, ProcessingResult, SearchHandler, SearchResult
+from ..utils.cache import SphinxAICache
+from ..utils.semantic_cache import GenerativeCache, SemanticCache
+from ..utils.topk import topk
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Fallback forum summary texts
+_NO_RESULTS = "Nie znaleziono wyników dla podanego zapytania."
+_FORUM_SUMMARY_TMPL = (
+    "Znaleziono {count} wyników dla zapytania '{query}'. "
+    "Najbardziej pasujący wynik: {first}."
+)
+
+
+async def _run_in_thread(func: Callable[..., T], *args: Any) -> T:
+    """Run blocking call in the default executor (asyncio.to_thread on 3.9+)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
 
 class SearchCoordinator:
     """
@@ -28,6 +50,9 @@ class SearchCoordinator:
         ai_handler: Optional[AIHandler] = None,
         genai_handler: Optional[AIHandler] = None,
         max_results: int = 10,
+        response_cache: Optional[SemanticCache] = None,
+        summary_cache: Optional[GenerativeCache] = None,
+        semantic_cache: bool = False,
     ):
         """
         Initialize search coordinator with dependency injection.
@@ -37,12 +62,49 @@ class SearchCoordinator:
             ai_handler: Traditional AI handler (optional)
             genai_handler: GenAI handler (optional)
             max_results: Maximum results to return
+            response_cache: Cache for search responses; by default an exact
+                cache, with a semantic tier when semantic_cache is set
+            summary_cache: Generative cache for forum summaries; by default
+                created when semantic_cache is set
+            semantic_cache: Serve near-duplicate queries from cached responses
+                and summaries, using the handler's query embeddings
         """
         self.sphinx_handler = sphinx_handler
         self.ai_handler = ai_handler
         self.genai_handler = genai_handler
         self.max_results = max_results
 
+        # Query embeddings keep stopwords, so "nie działa wifi" and
+        # "działa wifi" do not match as near-duplicates
+        query_embedder: Optional[Callable[[List[str]], Any]] = None
+        if semantic_cache:
+            query_embedder = getattr(
+                genai_handler or ai_handler, "generate_query_embeddings", None
+            )
+
+        if response_cache is None:
+            response_cache = SemanticCache(embedder=query_embedder)
+        self.response_cache = response_cache
+
+        if (
+            summary_cache is None
+            and genai_handler is not None
+            and query_embedder is not None
+        ):
+            summary_cache = GenerativeCache(query_embedder)
+        self.summary_cache = summary_cache
+
+        # Optional handler capabilities, resolved once instead of per search
+        self._genai_forum_summary: Optional[Callable[..., str]] = getattr(
+            genai_handler, "generate_forum_summary", None
+        )
+        self._genai_summary_stream: Optional[Callable[..., str]] = getattr(
+            genai_handler, "summarize_content_stream", None
+        )
+        self._ai_summary_fn: Optional[Callable[..., str]] = getattr(
+            ai_handler, "generate_summary", None
+        )
+
         logger.info("Search coordinator initialized")
 
     def search(
@@ -59,28 +121,52 @@ class SearchCoordinator:
             Processing result with search data
         """
         if not query or not query.strip():
-            return ProcessingResult(
-                success=False,
-                message="Empty query provided",
-                errors=["Query cannot be empty"],
-            )
+            return self._empty_query_result()
+        trivial = self._trivial_response(query)
+        if trivial is not None:
+            return trivial
 
         options = search_options or {}
         search_type = options.get("type", "hybrid")
         use_ai_summary = options.get("use_ai_summary", True)
         use_genai = options.get("use_genai", True)
+        use_cache = options.get("use_cache", True)
+        cache_namespace = (search_type, self.max_results, use_ai_summary, use_genai)
 
         try:
             logger.info(f"Processing search: '{query}' (type: {search_type})")
 
-            # Step 1: Get basic search results from Sphinx
-            sphinx_results = self._get_sphinx_results(query)
+            # Step 0: Exact cache hits are served without querying Sphinx
+            if use_cache:
+                cached = self._get_cached_response(query, cache_namespace)
+                if cached is not None:
+                    return cached
+
+            # Steps 0-1: Sphinx works on the query while the semantic tier
+            # embeds it, when the handler can pipeline
+            pending = None
+            try:
+                if use_cache:
+                    if self.response_cache.can_match_similar(cache_namespace):
+                        pending = self._send_sphinx_search(query)
+                    cached = self._get_cached_response(
+                        query, cache_namespace, similar=True
+                    )
+                    if cached is not None:
+                        return cached
+
+                # Step 1: Get basic search results from Sphinx
+                sphinx_results = self._fetch_sphinx_results(query, pending)
+            finally:
+                # Returns the connection to the pool if the result was not read
+                if pending is not None:
+                    pending.cancel()
             if not sphinx_results:
                 return ProcessingResult(
                     success=True, message="No results found", data=[]
                 )
 
-            # Step 2: Enhance with AI if available
+            # Step 2: Rank results and enhance the returned ones with AI
             enhanced_results = self._enhance_results(
                 query,
                 sphinx_results,
@@ -88,33 +174,122 @@ class SearchCoordinator:
                 use_genai and self.genai_handler is not None,
             )
 
-            # Step 3: Generate forum summary
+            # Step 3: Generate forum summary from the serialized results
+            result_dicts = [result.to_dict() for result in enhanced_results]
             forum_summary = self._generate_forum_summary(
-                query, enhanced_results, use_genai
+                query, result_dicts, len(sphinx_results), use_genai
             )
 
             # Step 4: Compile response
-            response_data = {
-                "query": query,
-                "search_type": search_type,
-                "total_results": len(enhanced_results),
-                "results": [
-                    result.to_dict() for result in enhanced_results[: self.max_results]
-                ],
-                "forum_summary": forum_summary,
-                "ai_features_used": {
-                    "traditional_ai": self.ai_handler is not None,
-                    "genai": use_genai and self.genai_handler is not None,
-                    "ai_summaries": use_ai_summary,
-                },
-            }
+            result = self._compile_response(
+                query,
+                search_type,
+                result_dicts,
+                len(sphinx_results),
+                forum_summary,
+                use_ai_summary,
+                use_genai,
+            )
+            if use_cache:
+                self.response_cache.set(query, result, cache_namespace)
+            return result
 
-            logger.info(f"Search completed: {len(enhanced_results)} results")
+        except Exception as e:
+            logger.error(f"Search processing error: {e}")
             return ProcessingResult(
-                success=True,
-                message=f"Found {len(enhanced_results)} results",
-                data=response_data,
+                success=False, message="Search processing failed", errors=[str(e)]
+            )
+
+    async def search_async(
+        self, query: str, search_options: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """
+        Perform search without blocking the event loop.
+
+        Exact cache hits return before Sphinx is queried; otherwise Sphinx
+        retrieval and the semantic cache lookup (which may embed the query)
+        run concurrently, Sphinx natively async when the handler
+        supports it and in worker threads otherwise, so concurrent requests
+        overlap their I/O and model calls.
+
+        Args:
+            query: Search query
+            search_options: Additional search options
+
+        Returns:
+            Processing result with search data
+        """
+        if not query or not query.strip():
+            return self._empty_query_result()
+        trivial = self._trivial_response(query)
+        if trivial is not None:
+            return trivial
+
+        options = search_options or {}
+        search_type = options.get("type", "hybrid")
+        use_ai_summary = options.get("use_ai_summary", True)
+        use_genai = options.get("use_genai", True)
+        use_cache = options.get("use_cache", True)
+        cache_namespace = (search_type, self.max_results, use_ai_summary, use_genai)
+
+        try:
+            logger.info(f"Processing async search: '{query}' (type: {search_type})")
+
+            # Step 0: Exact cache hits are served without querying Sphinx
+            if use_cache:
+                cached = self._get_cached_response(query, cache_namespace)
+                if cached is not None:
+                    return cached
+
+            # Steps 0-1: Semantic cache lookup and Sphinx retrieval run
+            # concurrently
+            sphinx_task = asyncio.ensure_future(self._get_sphinx_results_async(query))
+            if use_cache:
+                cached = await self._get_similar_cached_response_async(
+                    query, cache_namespace
+                )
+                if cached is not None:
+                    sphinx_task.cancel()
+                    return cached
+
+            sphinx_results = await sphinx_task
+            if not sphinx_results:
+                return ProcessingResult(
+                    success=True, message="No results found", data=[]
+                )
+
+            # Step 2: Rank results and enhance the returned ones with AI
+            enhanced_results = await _run_in_thread(
+                self._enhance_results,
+                query,
+                sphinx_results,
+                use_ai_summary,
+                use_genai and self.genai_handler is not None,
+            )
+
+            # Step 3: Generate forum summary from the serialized results
+            result_dicts = [result.to_dict() for result in enhanced_results]
+            forum_summary = await _run_in_thread(
+                self._generate_forum_summary,
+                query,
+                result_dicts,
+                len(sphinx_results),
+                use_genai,
+            )
+
+            # Step 4: Compile response
+            result = self._compile_response(
+                query,
+                search_type,
+                result_dicts,
+                len(sphinx_results),
+                forum_summary,
+                use_ai_summary,
+                use_genai,
             )
+            if use_cache:
+                self.response_cache.set(query, result, cache_namespace)
+            return result
 
         except Exception as e:
             logger.error(f"Search processing error: {e}")
@@ -122,14 +297,310 @@ class SearchCoordinator:
                 success=False, message="Search processing failed", errors=[str(e)]
             )
 
+    async def search_stream(
+        self, query: str, search_options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Perform search, yielding events as parts of the response are ready.
+
+        Ranked results are sent before any summary is generated, and GenAI
+        summaries stream text chunks as they are decoded, so time to first
+        byte does not include generation.
+
+        Events are dictionaries with an ``event`` key: ``results``,
+        ``summary_chunk`` (``index``, ``text``), ``summary`` (``index``,
+        ``text``), ``forum_summary`` (``text``) and finally ``done`` with the
+        complete response data, or ``error``.
+
+        Args:
+            query: Search query
+            search_options: Additional search options
+
+        Yields:
+            Search events
+        """
+        if not query or not query.strip():
+            result = self._empty_query_result()
+            yield {"event": "error", "message": result.message, "errors": result.errors}
+            return
+        trivial = self._trivial_response(query)
+        if trivial is not None:
+            yield {
+                "event": "error",
+                "message": trivial.message,
+                "errors": trivial.errors,
+            }
+            return
+
+        options = search_options or {}
+        search_type = options.get("type", "hybrid")
+        use_ai_summary = options.get("use_ai_summary", True)
+        use_genai = options.get("use_genai", True)
+        use_cache = options.get("use_cache", True)
+        cache_namespace = (search_type, self.max_results, use_ai_summary, use_genai)
+
+        try:
+            logger.info(f"Processing streamed search: '{query}' (type: {search_type})")
+
+            if use_cache:
+                cached = self._get_cached_response(query, cache_namespace)
+                if cached is None:
+                    cached = await self._get_similar_cached_response_async(
+                        query, cache_namespace
+                    )
+                if cached is not None:
+                    yield {"event": "done", "data": cached.data}
+                    return
+
+            sphinx_results = await self._get_sphinx_results_async(query)
+            if not sphinx_results:
+                yield {"event": "done", "data": []}
+                return
+
+            # Send ranked results before generating any summary
+            top_results = await _run_in_thread(
+                self._enhance_results, query, sphinx_results, False, False
+            )
+            yield {
+                "event": "results",
+                "data": {
+                    "query": query,
+                    "search_type": search_type,
+                    "total_results": len(sphinx_results),
+                    "results": [result.to_dict() for result in top_results],
+                },
+            }
+
+            use_genai_stream = use_genai and self._genai_summary_stream is not None
+            if use_ai_summary and use_genai_stream:
+                for index, search_result in enumerate(top_results):
+                    async for event in self._stream_summary(
+                        query, index, search_result
+                    ):
+                        yield event
+            elif use_ai_summary:
+                await _run_in_thread(
+                    self._attach_summaries,
+                    query,
+                    top_results,
+                    True,
+                    use_genai and self.genai_handler is not None,
+                )
+                for index, search_result in enumerate(top_results):
+                    yield {
+                        "event": "summary",
+                        "index": index,
+                        "text": search_result.ai_summary,
+                    }
+
+            # Serialize again, results now carry their summaries
+            result_dicts = [result.to_dict() for result in top_results]
+            forum_summary = await _run_in_thread(
+                self._generate_forum_summary,
+                query,
+                result_dicts,
+                len(sphinx_results),
+                use_genai,
+            )
+            yield {"event": "forum_summary", "text": forum_summary}
+
+            result = self._compile_response(
+                query,
+                search_type,
+                result_dicts,
+                len(sphinx_results),
+                forum_summary,
+                use_ai_summary,
+                use_genai,
+            )
+            if use_cache:
+                self.response_cache.set(query, result, cache_namespace)
+            yield {"event": "done", "data": result.data}
+
+        except Exception as e:
+            logger.error(f"Search processing error: {e}")
+            yield {
+                "event": "error",
+                "message": "Search processing failed",
+                "errors": [str(e)],
+            }
+
+    async def _stream_summary(
+        self, query: str, index: int, search_result: SearchResult
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream GenAI summary chunks of one result from a worker thread."""
+        loop = asyncio.get_running_loop()
+        chunks: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+        def on_chunk(text: str) -> bool:
+            loop.call_soon_threadsafe(chunks.put_nowait, text)
+            return False  # Continue generation
+
+        full_content = (
+            f"{search_result.title} {search_result.content}"
+            if search_result.title
+            else search_result.content
+        )
+
+        def summarize() -> str:
+            try:
+                return self._genai_summary_stream(full_content, query, on_chunk)
+            finally:
+                loop.call_soon_threadsafe(chunks.put_nowait, None)
+
+        summary_future = loop.run_in_executor(None, summarize)
+        while True:
+            text = await chunks.get()
+            if text is None:
+                break
+            yield {"event": "summary_chunk", "index": index, "text": text}
+
+        search_result.ai_summary = await summary_future
+        yield {"event": "summary", "index": index, "text": search_result.ai_summary}
+
+    def _empty_query_result(self) -> ProcessingResult:
+        """Result returned for empty queries."""
+        return ProcessingResult(
+            success=False,
+            message="Empty query provided",
+            errors=["Query cannot be empty"],
+        )
+
+    @staticmethod
+    def is_trivial_query(query: str) -> bool:
+        """Check if a query cannot match anything useful."""
+        stripped = query.strip()
+        return (
+            len(stripped) < MIN_QUERY_LENGTH
+            or TRIVIAL_QUERY_REGEX.match(stripped) is not None
+        )
+
+    def _trivial_response(self, query: str) -> Optional[ProcessingResult]:
+        """Get response for trivial queries without calling any handler."""
+        if not self.is_trivial_query(query):
+            return None
+
+        logger.info(f"Trivial query rejected without search: '{query}'")
+        return self.trivial_query_result()
+
+    @staticmethod
+    def trivial_query_result() -> ProcessingResult:
+        """Result returned for trivial queries, as by API request validation."""
+        return ProcessingResult(
+            success=False,
+            message="Query too short",
+            errors=[
+                f"Query must have at least {MIN_QUERY_LENGTH} characters "
+                "and contain letters or a longer number"
+            ],
+        )
+
+    def _get_cached_response(
+        self, query: str, cache_namespace: Tuple[Any, ...], similar: bool = False
+    ) -> Optional[ProcessingResult]:
+        """Get cached response from the exact tier, or the semantic tier."""
+        if similar:
+            cached = self.response_cache.get_similar(query, cache_namespace)
+        else:
+            cached = self.response_cache.get_exact(query, cache_namespace)
+        if cached is None:
+            return None
+
+        # A semantic hit keeps the query it was computed for in data["query"]
+        logger.info(f"Search served from cache: '{query}'")
+        return cached
+
+    async def _get_similar_cached_response_async(
+        self, query: str, cache_namespace: Tuple[Any, ...]
+    ) -> Optional[ProcessingResult]:
+        """Get cached response from the semantic tier, embedding off the loop."""
+        if not self.response_cache.can_match_similar(cache_namespace):
+            # Nothing to embed for; only records the miss
+            return self._get_cached_response(query, cache_namespace, similar=True)
+        return await _run_in_thread(
+            self._get_cached_response, query, cache_namespace, True
+        )
+
+    def _compile_response(
+        self,
+        query: str,
+        search_type: str,
+        result_dicts: List[Dict[str, Any]],
+        total_results: int,
+        forum_summary: str,
+        use_ai_summary: bool,
+        use_genai: bool,
+    ) -> ProcessingResult:
+        """Compile search response from enhanced results."""
+        response_data = {
+            "query": query,
+            "search_type": search_type,
+            "total_results": total_results,
+            "results": result_dicts,
+            "forum_summary": forum_summary,
+            "ai_features_used": {
+                "traditional_ai": self.ai_handler is not None,
+                "genai": use_genai and self.genai_handler is not None,
+                "ai_summaries": use_ai_summary,
+            },
+        }
+
+        logger.info(f"Search completed: {total_results} results")
+        return ProcessingResult(
+            success=True,
+            message=f"Found {total_results} results",
+            data=response_data,
+        )
+
     def _get_sphinx_results(self, query: str) -> List[Dict[str, Any]]:
         """Get results from Sphinx handler."""
         try:
+            if self._lazy_content:
+                # Content is hydrated for the ranked survivors only
+                return self.sphinx_handler.search_ids(query, self.max_results * 2)
             return self.sphinx_handler.search(query, self.max_results * 2)
         except Exception as e:
             logger.error(f"Sphinx search error: {e}")
             return []
 
+    def _send_sphinx_search(self, query: str) -> Optional[Any]:
+        """Send the Sphinx search ahead of time if the handler supports it."""
+        if not hasattr(type(self.sphinx_handler), "send_search"):
+            return None
+
+        try:
+            return self.sphinx_handler.send_search(
+                query, self.max_results * 2, with_content=not self._lazy_content
+            )
+        except Exception as e:
+            logger.error(f"Sphinx search error: {e}")
+            return None
+
+    def _fetch_sphinx_results(
+        self, query: str, pending: Optional[Any]
+    ) -> List[Dict[str, Any]]:
+        """Read a search sent by _send_sphinx_search, resending on failure."""
+        if pending is not None:
+            try:
+                return pending.fetch()
+            except Exception as e:
+                logger.warning(f"Pipelined Sphinx search failed, retrying: {e}")
+        return self._get_sphinx_results(query)
+
+    async def _get_sphinx_results_async(self, query: str) -> List[Dict[str, Any]]:
+        """Get results from Sphinx handler, natively async when supported."""
+        search_async = getattr(self.sphinx_handler, "search_async", None)
+        if not asyncio.iscoroutinefunction(search_async):
+            return await _run_in_thread(self._get_sphinx_results, query)
+
+        try:
+            return await search_async(
+                query, self.max_results * 2, with_content=not self._lazy_content
+            )
+        except Exception as e:
+            logger.error(f"Sphinx search error: {e}")
+            return []
+
     def _enhance_results(
         self,
         query: str,
@@ -137,28 +608,88 @@ class SearchCoordinator:
         use_ai_summary: bool,
         use_genai: bool,
     ) -> List[SearchResult]:
-        """Enhance search results with AI summaries."""
-        enhanced_results = []
-
-        for result in sphinx_results:
-            search_result = SearchResult(
-                result.get("id", ""),  # result_id as positional argument
+        """Rank search results and add AI summaries to the returned ones."""
+        search_results = [
+            SearchResult(
+                result.get("id", ""),  # id as positional argument
                 result.get("title", ""),  # title as positional argument
                 result.get("content", ""),  # content as positional argument
                 result.get("url", ""),  # url as positional argument
                 relevance_score=result.get("weight", 0.0),
                 metadata=result,
             )
+            for result in sphinx_results
+        ]
+
+        # Rank first, so summaries are only generated for returned results
+        top_results = topk(
+            search_results, self.max_results, key=lambda result: result.relevance_score
+        )
+        if self._lazy_content:
+            self._hydrate_content(top_results)
+        self._attach_summaries(query, top_results, use_ai_summary, use_genai)
+        return top_results
+
+    @property
+    def _lazy_content(self) -> bool:
+        """Whether Sphinx returns content-less rows to be hydrated later."""
+        return getattr(self.sphinx_handler, "lazy_content", False) is True
+
+    def _hydrate_content(self, results: List[SearchResult]) -> None:
+        """Fill in content of ranked results from the SMF database."""
+        try:
+            self.sphinx_handler.hydrate_content([result.metadata for result in results])
+        except Exception as e:
+            logger.error(f"Content hydration error: {e}")
+            return
 
-            # Add AI summary if requested and available
-            if use_ai_summary:
-                search_result.ai_summary = self._generate_summary(
-                    query, search_result.content, search_result.title, use_genai
-                )
+        for result in results:
+            result.content = result.metadata.get("content", "")
 
-            enhanced_results.append(search_result)
+    def _attach_summaries(
+        self,
+        query: str,
+        results: List[SearchResult],
+        use_ai_summary: bool,
+        use_genai: bool,
+    ) -> None:
+        """Add AI summaries to results if requested and available."""
+        if not use_ai_summary:
+            return
 
-        return enhanced_results
+        summaries = self._generate_summaries(query, results, use_genai)
+        for search_result, summary in zip(results, summaries):
+            search_result.ai_summary = summary
+
+    def _generate_summaries(
+        self, query: str, results: List[SearchResult], use_genai: bool
+    ) -> List[str]:
+        """Generate AI summaries for all results in one batched GenAI call."""
+        if use_genai and self.genai_handler and results:
+            try:
+                contents = [
+                    (
+                        f"{result.title} {result.content}"
+                        if result.title
+                        else result.content
+                    )
+                    for result in results
+                ]
+                summaries = self.genai_handler.generate_summaries(
+                    [query] * len(results), contents
+                )
+                # Results the batch could not summarize use the per-item fallbacks
+                return [
+                    summary or self._generate_summary(query, content, use_genai=False)
+                    for summary, content in zip(summaries, contents)
+                ]
+            except Exception as e:
+                logger.error(f"Batch summary generation error: {e}")
+
+        return [
+            self._generate_summary(query, result.content, result.title, use_genai)
+            for result in results
+        ]
 
     def _generate_summary(
         self, query: str, content: str, title: str = "", use_genai: bool = True
@@ -174,8 +705,8 @@ class SearchCoordinator:
                     return summary
 
             # Fallback to traditional AI
-            if self.ai_handler:
-                return self.ai_handler.generate_summary(query, full_content)
+            if self._ai_summary_fn is not None:
+                return self._ai_summary_fn(query, full_content)
 
             # Simple fallback
             return self._simple_summary(full_content)
@@ -185,30 +716,40 @@ class SearchCoordinator:
             return "Nie udało się wygenerować streszczenia."
 
     def _generate_forum_summary(
-        self, query: str, results: List[SearchResult], use_genai: bool
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        total_results: int,
+        use_genai: bool,
     ) -> str:
-        """Generate overall forum summary."""
+        """Generate overall forum summary from the top serialized results."""
         if not results:
-            return "Nie znaleziono wyników dla podanego zapytania."
+            return _NO_RESULTS
 
         try:
             # Try GenAI forum summary if available
-            if (
-                use_genai
-                and self.genai_handler
-                and hasattr(self.genai_handler, "generate_forum_summary")
-            ):
-                result_dicts = [result.to_dict() for result in results[:5]]
-                summary = self.genai_handler.generate_forum_summary(query, result_dicts)
+            if use_genai and self._genai_forum_summary is not None:
+                # Combine cached summaries of related queries when possible
+                query_embedding = (
+                    self.summary_cache.embed(query) if self.summary_cache else None
+                )
+                if query_embedding is not None:
+                    cached_summary = self.summary_cache.lookup(query_embedding)
+                    if cached_summary:
+                        return cached_summary
+
+                summary = self._genai_forum_summary(query, results[:5])
                 if summary:
+                    if query_embedding is not None:
+                        self.summary_cache.set(query_embedding, summary)
                     return summary
 
             # Fallback summary
-            return self._simple_forum_summary(query, results)
+            return self._simple_forum_summary(query, results, total_results)
 
         except Exception as e:
             logger.error(f"Forum summary generation error: {e}")
-            return self._simple_forum_summary(query, results)
+            return self._simple_forum_summary(query, results, total_results)
 
     def _simple_summary(self, content: str, max_length: int = 200) -> str:
         """Simple text summarization fallback."""
@@ -218,33 +759,36 @@ class SearchCoordinator:
         if len(content) <= max_length:
             return content
 
-        # Find sentence boundaries
-        sentences = content.split(".")
-        summary = ""
-        for sentence in sentences:
-            if len(summary + sentence) <= max_length:
-                summary += sentence + ". "
-            else:
-                break
-
-        return summary.strip() or content[:max_length] + "..."
+        # Cut at the last sentence boundary that fits, scanning only the prefix
+        cut = content.rfind(".", 0, max_length)
+        return content[: cut + 1] if cut > 0 else content[:max_length] + "..."
 
-    def _simple_forum_summary(self, query: str, results: List[SearchResult]) -> str:
-        """Simple forum summary fallback."""
-        count = len(results)
-        summary = f"Znaleziono {count} wyników dla zapytania '{query}'. "
-
-        if results:
-            first_result = results[0]
-            summary += f"Najbardziej pasujący wynik: {first_result.title}."
+    def _simple_forum_summary(
+        self, query: str, results: List[Dict[str, Any]], total_results: int
+    ) -> str:
+        """Simple forum summary fallback, counting all matches."""
+        if not results:
+            return _NO_RESULTS
 
-        return summary
+        return _FORUM_SUMMARY_TMPL.format_map(
+            {
+                "count": total_results,
+                "query": query,
+                "first": results[0].get("title") or "—",
+            }
+        )
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get status of all system components."""
         status: Dict[str, Any] = {
             "coordinator": "active",
             "max_results": self.max_results,
+            "response_cache": {
+                "entries": len(self.response_cache),
+                "hits": self.response_cache.hits,
+                "semantic_hits": self.response_cache.semantic_hits,
+                "misses": self.response_cache.misses,
+            },
             "handlers": {},
         }
 
@@ -282,14 +826,21 @@ class SearchAPIHandler:
     This class handles API requests and delegates to the search coordinator.
     """
 
-    def __init__(self, coordinator: SearchCoordinator):
+    def __init__(
+        self, coordinator: SearchCoordinator, cache: Optional[SphinxAICache] = None
+    ):
         """
         Initialize API handler.
 
         Args:
             coordinator: Search coordinator instance
+            cache: Redis-backed cache sharing complete responses across
+                worker processes (optional)
         """
         self.coordinator = coordinator
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def handle_search_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -315,16 +866,77 @@ class SearchAPIHandler:
             query = request_data.get("query", "").strip()
             search_options = request_data.get("options", {})
 
+            cached = self._get_shared_response(query, search_options)
+            if cached is not None:
+                return cached
+
             # Perform search
             result = self.coordinator.search(query, search_options)
 
             # Format response
+            response = {
+                "success": result.success,
+                "message": result.message,
+                "data": result.data,
+                "errors": result.errors,
+            }
+            self._set_shared_response(query, search_options, response)
+            return response
+
+        except Exception as e:
+            logger.error(f"API request handling error: {e}")
             return {
+                "success": False,
+                "error": "Internal server error",
+                "errors": [str(e)],
+            }
+
+    async def handle_search_request_async(
+        self, request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Handle search API request without blocking the event loop.
+
+        Args:
+            request_data: Request data from API
+
+        Returns:
+            API response dictionary
+        """
+        try:
+            # Validate request
+            validation_result = self._validate_request(request_data)
+            if not validation_result.success:
+                return {
+                    "success": False,
+                    "error": validation_result.message,
+                    "errors": validation_result.errors,
+                }
+
+            # Extract parameters
+            query = request_data.get("query", "").strip()
+            search_options = request_data.get("options", {})
+
+            cached = await _run_in_thread(
+                self._get_shared_response, query, search_options
+            )
+            if cached is not None:
+                return cached
+
+            # Perform search
+            result = await self.coordinator.search_async(query, search_options)
+
+            # Format response
+            response = {
                 "success": result.success,
                 "message": result.message,
                 "data": result.data,
                 "errors": result.errors,
             }
+            await _run_in_thread(
+                self._set_shared_response, query, search_options, response
+            )
+            return response
 
         except Exception as e:
             logger.error(f"API request handling error: {e}")
@@ -334,10 +946,83 @@ class SearchAPIHandler:
                 "errors": [str(e)],
             }
 
+    async def handle_search_stream(
+        self, request_data: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Handle search API request as a stream of JSON lines.
+
+        Each line is one event from SearchCoordinator.search_stream, ready to
+        be written to a chunked or server-sent events response.
+
+        Args:
+            request_data: Request data from API
+
+        Yields:
+            JSON-encoded events, newline terminated
+        """
+        validation_result = self._validate_request(request_data)
+        if not validation_result.success:
+            yield json.dumps(
+                {
+                    "event": "error",
+                    "message": validation_result.message,
+                    "errors": validation_result.errors,
+                },
+                ensure_ascii=False,
+            ) + "\n"
+            return
+
+        query = request_data.get("query", "").strip()
+        search_options = request_data.get("options", {})
+
+        async for event in self.coordinator.search_stream(query, search_options):
+            yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+
+    def _get_shared_response(
+        self, query: str, search_options: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get response cached by any worker for the same request."""
+        if self.cache is None or not self.cache.is_available():
+            return None
+
+        response = self.cache.get_cached_search_response(query, search_options)
+        if response is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return response
+
+    def _set_shared_response(
+        self, query: str, search_options: Dict[str, Any], response: Dict[str, Any]
+    ) -> None:
+        """Share successful response with other workers."""
+        if self.cache is not None and response["success"]:
+            self.cache.cache_search_response(query, search_options, response)
+
+    def invalidate_cache(self) -> int:
+        """
+        Drop shared cached responses, e.g. after the search index is updated.
+
+        Returns:
+            Number of cached responses removed
+        """
+        self.coordinator.response_cache.clear()
+        if self.coordinator.summary_cache is not None:
+            self.coordinator.summary_cache.clear()
+        if self.cache is None:
+            return 0
+        return self.cache.clear_search_cache()
+
     def handle_status_request(self) -> Dict[str, Any]:
         """Handle system status request."""
         try:
             status = self.coordinator.get_system_status()
+            status["shared_response_cache"] = {
+                "available": self.cache is not None and self.cache.is_available(),
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+            }
             return {"success": True, "data": status}
         except Exception as e:
             logger.error(f"Status request error: {e}")
@@ -363,6 +1048,8 @@ class SearchAPIHandler:
                 message="Invalid query",
                 errors=["Query is required and must be a non-empty string"],
             )
+        if SearchCoordinator.is_trivial_query(query):
+            return SearchCoordinator.trivial_query_result()
 
         # Validate options if provided
         options = request_data.get("options", {})
@@ -397,14 +1084,17 @@ def create_search_coordinator(
     return SearchCoordinator(sphinx_handler, ai_handler, genai_handler, max_results)
 
 
-def create_api_handler(coordinator: SearchCoordinator) -> SearchAPIHandler:
+def create_api_handler(
+    coordinator: SearchCoordinator, cache: Optional[SphinxAICache] = None
+) -> SearchAPIHandler:
     """
     Factory function to create API handler.
 
     Args:
         coordinator: Search coordinator
+        cache: Shared response cache (optional)
 
     Returns:
         Configured API handler
     """
-    return SearchAPIHandler(coordinator)
+    return SearchAPIHandler(coordinator, cache)
@@ -6,27 +6,62 @@ This module provides an improved AI handler using OpenVINO GenAI with advanced f
 for better text generation, streaming responses, and forum-specific optimizations.
 """
 
+import asyncio
+import functools
+import importlib.util
+import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
 
 from ..core.constants import (
+    CATEGORY_LRU_SIZE,
+    DEFAULT_EMBEDDING_BACKEND,
     DEFAULT_EMBEDDING_MODEL,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_LRU_SIZE,
+    ENHANCED_POLISH_PROMPT_FNS,
+    ENHANCED_POLISH_PROMPT_PARTS,
     ENHANCED_POLISH_PROMPTS,
+    GENAI_INT8_SUBDIR,
+    GENAI_KV_CACHE_SIZE_GB,
     MAX_ANSWER_LENGTH,
     MAX_CONTEXT_LENGTH,
     MAX_SUMMARY_LENGTH,
+    OPENVINO_INT8_CACHE_DIR,
+    OPENVINO_INT8_MODEL_FILE,
+    OPENVINO_MODEL_PATH,
+    PROMPT_BUCKET_CHARS,
+    SUMMARY_CHARS_PER_TOKEN,
+    SUMMARY_STOP_MARGIN,
+    TORCH_HALF_PRECISION_DEVICES,
+)
+from ..core.interfaces import AIHandler, _as_contig_f32
+from ..utils.embedding_utils import (
+    EmbeddingDiskCache,
+    encode_embedding_b64,
+    int8_similarity,
+    pack_int8_embedding,
+    quantize_int8,
+)
+from ..utils.fast_sim import warmup as warmup_similarity_kernel
+from ..utils.text_processing import (
+    clean_for_embedding,
+    clean_for_embedding_many,
+    normalize_polish_text,
+    remove_stopwords_normalized,
 )
-from ..core.interfaces import AIHandler
-from ..utils.text_processing import normalize_polish_text, remove_stopwords
 
 logger = logging.getLogger(__name__)
 
 try:
     # OpenVINO GenAI imports with enhanced features
+    import openvino as ov
     import openvino_genai as ov_genai
 
     GENAI_AVAILABLE = True
@@ -35,15 +70,11 @@ except ImportError:
     logger.warning("OpenVINO GenAI not available")
     GENAI_AVAILABLE = False
 
-try:
-    # Fallback imports for embeddings
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
-
-    EMBEDDINGS_AVAILABLE = True
-except ImportError:
+# Fallback embeddings; sentence_transformers pulls in torch and transformers,
+# so it is only imported when the embedding model is first loaded
+EMBEDDINGS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+if not EMBEDDINGS_AVAILABLE:
     logger.warning("Embedding libraries not available")
-    EMBEDDINGS_AVAILABLE = False
 
 # Enhanced configuration constants moved to constants.py
 
@@ -51,18 +82,53 @@ except ImportError:
 class GenAIHandler(AIHandler):
     """Enhanced OpenVINO GenAI handler for advanced text generation and forum optimization."""
 
-    def __init__(self, model_path: Optional[str] = None, device: str = "CPU"):
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        device: str = "CPU",
+        embedding_backend: str = DEFAULT_EMBEDDING_BACKEND,
+        enable_prefix_caching: bool = True,
+        quantize_llm: bool = True,
+    ):
         """Initialize GenAI handler.
 
         Args:
             model_path: Path to the GenAI model
             device: Target device for inference (CPU, GPU, etc.)
+            embedding_backend: Embedding backend ("openvino-int8" or "torch")
+            enable_prefix_caching: Reuse KV cache of shared prompt prefixes
+            quantize_llm: Run the INT8 weight copy of an uncompressed model,
+                created by UnifiedModelConverter.compress_llm_model
         """
         self.model_path = Path(model_path) if model_path else None
+        # Validated once; call reload() after the model files change
+        self._model_path_ok = bool(self.model_path and self.model_path.exists())
         self.device = device
+        self.embedding_backend = embedding_backend
+        self.enable_prefix_caching = enable_prefix_caching
+        self.quantize_llm = quantize_llm
+        # Model directory the pipeline was created from
+        self.pipeline_path: Optional[Path] = None
         self.pipe = None
         self.embedding_model: Optional[Any] = None  # SentenceTransformer
         self.generation_config: Optional[Any] = None  # OpenVINO GenAI GenerationConfig
+        # Deterministic config for short classification and query rewriting
+        self.greedy_config: Optional[Any] = None
+        self.tokenizer: Optional[Any] = None  # OpenVINO GenAI Tokenizer
+        # Pre-tokenized static prompt parts: (token ids, following field name)
+        self._prompt_tokens: Dict[
+            str, List[Tuple[NDArray[np.int64], Optional[str]]]
+        ] = {}
+        # Serializes generation config updates and pipeline calls
+        self._pipe_lock = threading.Lock()
+        # Recently encoded embeddings keyed by content hash of the prepared
+        # text, stored as float16 to halve their memory
+        self._embedding_lru: "OrderedDict[str, NDArray[np.float16]]" = OrderedDict()
+        self._embedding_lru_lock = threading.Lock()
+        # Categories keyed by content hash of the classification input;
+        # greedy decoding makes classification deterministic
+        self._category_lru: "OrderedDict[str, str]" = OrderedDict()
+        self._category_lru_lock = threading.Lock()
 
         if not GENAI_AVAILABLE:
             logger.error("OpenVINO GenAI not available - handler will be limited")
@@ -71,11 +137,14 @@ class GenAIHandler(AIHandler):
         self._setup_generation_config()
 
         try:
-            if self.model_path and self.model_path.exists():
+            if self._model_path_ok:
                 self._load_model()
         except Exception as e:
             logger.error(f"Failed to initialize GenAI handler: {e}")
 
+        # Compile the similarity kernel before the first query needs it
+        warmup_similarity_kernel()
+
     def _setup_generation_config(self) -> None:
         """Setup generation configuration for OpenVINO GenAI."""
         if not GENAI_AVAILABLE:
@@ -89,6 +158,13 @@ class GenAIHandler(AIHandler):
                 self.generation_config.top_p = 0.9
                 self.generation_config.do_sample = True
                 self.generation_config.repetition_penalty = 1.1
+
+            self.greedy_config = ov_genai.GenerationConfig()
+            if self.greedy_config is not None:
+                self.greedy_config.max_new_tokens = 20
+                self.greedy_config.do_sample = False
+                self.greedy_config.num_beams = 1
+                self.greedy_config.repetition_penalty = 1.0
         except Exception as e:
             logger.error(f"Failed to setup generation config: {e}")
 
@@ -99,17 +175,133 @@ class GenAIHandler(AIHandler):
             True if model loaded successfully, False otherwise
         """
         try:
-            if not self.model_path or not self.model_path.exists():
+            if not self._model_path_ok or self.model_path is None:
                 logger.error(f"Model path does not exist: {self.model_path}")
                 return False
 
-            self.pipe = ov_genai.LLMPipeline(str(self.model_path), self.device)
-            logger.info(f"GenAI model loaded: {self.model_path}")
+            self.pipeline_path = self._resolve_pipeline_path(self.model_path)
+            self.pipe = self._create_pipeline()
+            logger.info(f"GenAI model loaded: {self.pipeline_path}")
+            self._prepare_prompt_tokens()
             return True
         except Exception as e:
             logger.error(f"Failed to load GenAI model: {e}")
             return False
 
+    def reload(self) -> bool:
+        """Re-validate the model path and load the model again.
+
+        Generation never retries a failed load by itself, so this is the
+        way to pick up a model that was missing or replaced on disk.
+
+        Returns:
+            True if model loaded successfully, False otherwise
+        """
+        if not GENAI_AVAILABLE:
+            return False
+
+        self._model_path_ok = bool(self.model_path and self.model_path.exists())
+        with self._pipe_lock:
+            self.pipe = None
+        return self._load_model()
+
+    def _create_pipeline(self) -> Any:
+        """Create LLM pipeline, with prefix caching when enabled.
+
+        Every prompt template starts with its static instruction text, so
+        with prefix caching the KV blocks of that text are computed once and
+        only the query and content suffix is prefilled per request.
+
+        Returns:
+            OpenVINO GenAI LLMPipeline
+        """
+        if self.enable_prefix_caching:
+            try:
+                scheduler_config = ov_genai.SchedulerConfig()
+                scheduler_config.enable_prefix_caching = True
+                scheduler_config.cache_size = GENAI_KV_CACHE_SIZE_GB
+                return ov_genai.LLMPipeline(
+                    str(self.pipeline_path),
+                    self.device,
+                    scheduler_config=scheduler_config,
+                )
+            except Exception as e:
+                logger.warning(f"Prefix caching unavailable, loading without: {e}")
+                self.enable_prefix_caching = False
+
+        return ov_genai.LLMPipeline(str(self.pipeline_path), self.device)
+
+    def _resolve_pipeline_path(self, model_path: Path) -> Path:
+        """Get model directory to run, preferring INT8 weights when enabled.
+
+        Models exported with a weight format (the converter uses int4/int8)
+        are used as is. Otherwise the INT8 weight-only compressed copy under
+        GENAI_INT8_SUBDIR is used if the converter has created it; the
+        handler never writes to the model directory itself.
+
+        Args:
+            model_path: Exported OpenVINO GenAI model directory
+
+        Returns:
+            Directory to create the pipeline from
+        """
+        if not self.quantize_llm or self._has_compressed_weights(model_path):
+            return model_path
+
+        int8_path = model_path / GENAI_INT8_SUBDIR
+        if (int8_path / "openvino_model.xml").exists():
+            return int8_path
+
+        logger.info(
+            "GenAI model weights are not compressed; create an INT8 copy with "
+            f"'python unified_model_converter.py --compress-llm {model_path}'"
+        )
+        return model_path
+
+    @staticmethod
+    def _has_compressed_weights(model_path: Path) -> bool:
+        """Check whether the export recorded a weight quantization config."""
+        try:
+            with open(model_path / "openvino_config.json", encoding="utf-8") as f:
+                return bool(json.load(f).get("quantization_config"))
+        except (OSError, ValueError):
+            return False
+
+    def _prepare_prompt_tokens(self) -> None:
+        """Tokenize static parts of the prompt templates once per loaded model."""
+        self._prompt_tokens = {}
+        try:
+            if self.pipe is None:
+                return
+
+            self.tokenizer = self.pipe.get_tokenizer()
+            for name, parts in ENHANCED_POLISH_PROMPT_PARTS.items():
+                # Special tokens (BOS) belong only at the start of the prompt
+                self._prompt_tokens[name] = [
+                    (self._encode(literal, add_special_tokens=i == 0), field_name)
+                    for i, (literal, field_name) in enumerate(parts)
+                ]
+        except Exception as e:
+            logger.warning(f"Prompt pre-tokenization unavailable: {e}")
+            self.tokenizer = None
+            self._prompt_tokens = {}
+
+    def _encode(self, text: str, add_special_tokens: bool = False) -> NDArray[np.int64]:
+        """Encode text to a 1D array of token ids.
+
+        Args:
+            text: Text to encode
+            add_special_tokens: Whether to add model special tokens
+
+        Returns:
+            Token ids
+        """
+        if not text or self.tokenizer is None:
+            return np.empty(0, dtype=np.int64)
+
+        encoded = self.tokenizer.encode(text, add_special_tokens=add_special_tokens)
+        return np.asarray(encoded.input_ids.data, dtype=np.int64).ravel()
+
     def _load_embedding_model(self) -> bool:
         """Load sentence transformer model for embeddings.
 
@@ -121,41 +313,312 @@ class GenAIHandler(AIHandler):
             return False
 
         try:
-            self.embedding_model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            logger.error(f"Failed to import embedding libraries: {e}")
+            return False
+
+        if self.embedding_backend == "openvino-int8":
+            try:
+                self.embedding_model = self._load_openvino_int8_embedding_model()
+                logger.info("INT8 OpenVINO embedding model loaded successfully")
+                return True
+            except Exception as e:
+                logger.warning(
+                    f"INT8 OpenVINO embedding model not available, "
+                    f"falling back to default backend: {e}"
+                )
+
+        try:
+            torch_device = TORCH_HALF_PRECISION_DEVICES.get(self.device.upper())
+            if torch_device is None:
+                self.embedding_model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+            else:
+                # Half precision halves the weight bytes moved per forward pass
+                self.embedding_model = SentenceTransformer(
+                    DEFAULT_EMBEDDING_MODEL, device=torch_device
+                ).half()
             logger.info("Embedding model loaded successfully")
             return True
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             return False
 
-    def generate_text(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def _load_openvino_int8_embedding_model(self) -> Any:
+        """Load INT8-quantized OpenVINO export of the embedding model.
+
+        Uses the local export under OPENVINO_MODEL_PATH when present,
+        otherwise the quantized file published with DEFAULT_EMBEDDING_MODEL.
+        When neither can be loaded, the model is exported to OpenVINO on the
+        fly with 8-bit weight compression (requires optimum-intel and NNCF)
+        and saved under OPENVINO_INT8_CACHE_DIR, so later loads skip the
+        export.
+
+        Returns:
+            SentenceTransformer running on the OpenVINO backend
+        """
+        from sentence_transformers import SentenceTransformer
+
+        local_path = Path(__file__).resolve().parents[2] / OPENVINO_MODEL_PATH
+        model_name = str(local_path) if local_path.exists() else DEFAULT_EMBEDDING_MODEL
+
+        try:
+            return SentenceTransformer(
+                model_name,
+                backend="openvino",
+                model_kwargs={
+                    "file_name": OPENVINO_INT8_MODEL_FILE,
+                    "device": self.device,
+                },
+            )
+        except Exception as e:
+            logger.info(f"Pre-quantized embedding model not found: {e}")
+
+        cache_dir = Path(OPENVINO_INT8_CACHE_DIR).expanduser()
+        if cache_dir.exists():
+            try:
+                return SentenceTransformer(
+                    str(cache_dir),
+                    backend="openvino",
+                    model_kwargs={"device": self.device},
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Cached INT8 embedding model unusable, re-exporting: {e}"
+                )
+
+        model = SentenceTransformer(
+            DEFAULT_EMBEDDING_MODEL,
+            backend="openvino",
+            model_kwargs={"load_in_8bit": True, "device": self.device},
+        )
+        try:
+            model.save(str(cache_dir))
+            logger.info(f"INT8 embedding model cached in {cache_dir}")
+        except Exception as e:
+            logger.warning(f"Failed to cache INT8 embedding model: {e}")
+        return model
+
+    def _generation_config_for(
+        self, max_tokens: Optional[int], greedy: bool = False
+    ) -> Optional[Any]:
+        """Select generation config and apply max_tokens; call under _pipe_lock.
+
+        Args:
+            max_tokens: Maximum tokens to generate, config default if None
+            greedy: Select the greedy decoding config
+
+        Returns:
+            OpenVINO GenAI GenerationConfig
+        """
+        config = self.generation_config
+        if greedy and self.greedy_config is not None:
+            config = self.greedy_config
+
+        # Update generation config if max_tokens specified
+        if max_tokens and config:
+            config.max_new_tokens = max_tokens
+        return config
+
+    @staticmethod
+    def _length_streamer(
+        max_chars: Optional[int], callback: Optional[Callable[[str], bool]] = None
+    ) -> Optional[Callable[[str], bool]]:
+        """Build streamer stopping generation after max_chars characters.
+
+        Args:
+            max_chars: Character limit, callback is returned as is if None
+            callback: Streamer receiving each text chunk; returns True to stop
+
+        Returns:
+            Streamer callback for LLMPipeline.generate, or None
+        """
+        if not max_chars:
+            return callback
+
+        produced = 0
+
+        def streamer(chunk: str) -> bool:
+            nonlocal produced
+            produced += len(chunk)
+            stop = bool(callback(chunk)) if callback is not None else False
+            return stop or produced >= max_chars
+
+        return streamer
+
+    @staticmethod
+    def _summary_limits(max_length: int) -> Tuple[int, int]:
+        """Token budget and streaming stop point for a summary of max_length chars."""
+        max_tokens = max(1, max_length // SUMMARY_CHARS_PER_TOKEN)
+        return max_tokens, int(max_length * SUMMARY_STOP_MARGIN)
+
+    def generate_text(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        greedy: bool = False,
+        max_chars: Optional[int] = None,
+    ) -> str:
         """Generate text using OpenVINO GenAI.
 
         Args:
             prompt: Input prompt for generation
             max_tokens: Maximum tokens to generate
+            greedy: Use deterministic greedy decoding instead of sampling
+            max_chars: Stop generation once this many characters were produced
 
         Returns:
             Generated text
         """
-        if not self.pipe:
-            if not self._load_model():
-                return "Model not available"
+        if self.pipe is None:
+            return "Model not available"
 
         try:
-            # Update generation config if max_tokens specified
-            if max_tokens and self.generation_config:
-                self.generation_config.max_new_tokens = max_tokens
-
-            if self.pipe is not None:
-                result = self.pipe.generate(prompt, self.generation_config)
-                return result.strip()
-            else:
-                return "Model not available"
+            with self._pipe_lock:
+                config = self._generation_config_for(max_tokens, greedy)
+                result = self.pipe.generate(
+                    prompt, config, streamer=self._length_streamer(max_chars)
+                )
+            return str(result).strip()
         except Exception as e:
             logger.error(f"Failed to generate text: {e}")
             return f"Generation failed: {str(e)}"
 
+    def generate_text_stream(
+        self,
+        prompt: str,
+        callback: Callable[[str], bool],
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Generate text, passing decoded chunks to a callback as they arrive.
+
+        Args:
+            prompt: Input prompt for generation
+            callback: Streamer receiving each text chunk; returns True to stop
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Full generated text
+        """
+        if self.pipe is None:
+            return "Model not available"
+
+        try:
+            with self._pipe_lock:
+                config = self._generation_config_for(max_tokens)
+                result = self.pipe.generate(prompt, config, streamer=callback)
+            return str(result).strip()
+        except Exception as e:
+            logger.error(f"Failed to stream text: {e}")
+            return f"Generation failed: {str(e)}"
+
+    def generate_from_template(
+        self,
+        template_name: str,
+        max_tokens: Optional[int] = None,
+        greedy: bool = False,
+        max_chars: Optional[int] = None,
+        **fields: str,
+    ) -> str:
+        """Generate text from a prompt template using pre-tokenized static parts.
+
+        Only the field values are tokenized per call; token ids of the static
+        instruction text are reused. Falls back to a formatted text prompt
+        when pre-tokenization is unavailable.
+
+        Args:
+            template_name: Key of ENHANCED_POLISH_PROMPTS
+            max_tokens: Maximum tokens to generate
+            greedy: Use deterministic greedy decoding instead of sampling
+            max_chars: Stop generation once this many characters were produced
+            **fields: Values for the template fields
+
+        Returns:
+            Generated text
+        """
+        parts = self._prompt_tokens.get(template_name)
+        if not parts or self.pipe is None or self.tokenizer is None:
+            prompt = ENHANCED_POLISH_PROMPT_FNS[template_name](**fields)
+            return self.generate_text(prompt, max_tokens, greedy, max_chars)
+
+        try:
+            chunks = []
+            for static_ids, field_name in parts:
+                chunks.append(static_ids)
+                if field_name is not None:
+                    chunks.append(self._encode(fields[field_name]))
+            input_ids = np.concatenate(chunks)[np.newaxis, :]
+            inputs = ov_genai.TokenizedInputs(
+                ov.Tensor(input_ids), ov.Tensor(np.ones_like(input_ids))
+            )
+
+            with self._pipe_lock:
+                config = self._generation_config_for(max_tokens, greedy)
+                result = self.pipe.generate(
+                    inputs, config, streamer=self._length_streamer(max_chars)
+                )
+            return self.tokenizer.decode(result.tokens[0]).strip()
+        except Exception as e:
+            logger.warning(f"Tokenized generation failed, using text prompt: {e}")
+            prompt = ENHANCED_POLISH_PROMPT_FNS[template_name](**fields)
+            return self.generate_text(prompt, max_tokens, greedy, max_chars)
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: Optional[int] = None,
+        greedy: bool = False,
+    ) -> List[str]:
+        """Generate text for several prompts in batched pipeline calls.
+
+        Args:
+            prompts: Input prompts for generation
+            max_tokens: Maximum tokens to generate per prompt
+            greedy: Use deterministic greedy decoding instead of sampling
+
+        Returns:
+            Generated texts, in prompt order
+        """
+        if not prompts:
+            return []
+
+        if self.pipe is None:
+            return ["Model not available"] * len(prompts)
+
+        try:
+            outputs = [""] * len(prompts)
+            for bucket in self._length_buckets(prompts):
+                with self._pipe_lock:
+                    config = self._generation_config_for(max_tokens, greedy)
+                    # A list of prompts is decoded as one batch by the pipeline
+                    result = self.pipe.generate([prompts[i] for i in bucket], config)
+                for i, text in zip(bucket, result.texts):
+                    outputs[i] = text.strip()
+            return outputs
+        except Exception as e:
+            logger.error(f"Failed to generate batch: {e}")
+            return [f"Generation failed: {str(e)}"] * len(prompts)
+
+    def _length_buckets(self, prompts: List[str]) -> List[List[int]]:
+        """Group prompt indices by length so batches need little padding.
+
+        With prefix caching the pipeline runs continuous batching, which
+        schedules sequences without padding, so all prompts form one batch.
+
+        Args:
+            prompts: Input prompts for generation
+
+        Returns:
+            Index lists, one per batch, shortest prompts first
+        """
+        if self.enable_prefix_caching:
+            return [list(range(len(prompts)))]
+
+        buckets: Dict[int, List[int]] = {}
+        for i, prompt in enumerate(prompts):
+            buckets.setdefault(len(prompt) // PROMPT_BUCKET_CHARS, []).append(i)
+        return [buckets[key] for key in sorted(buckets)]
+
     def summarize_content(
         self, content: str, query: str, max_length: int = MAX_SUMMARY_LENGTH
     ) -> str:
@@ -170,33 +633,148 @@ class GenAIHandler(AIHandler):
             Summarized content in Polish
         """
         try:
-            # Preprocess content and query
-            clean_content = normalize_polish_text(content)
-            clean_query = normalize_polish_text(query)
-
-            # Truncate content if too long
-            if len(clean_content) > MAX_CONTEXT_LENGTH:
-                clean_content = clean_content[:MAX_CONTEXT_LENGTH] + "..."
-
-            prompt = ENHANCED_POLISH_PROMPTS["summarize"].format(
-                query=clean_query, content=clean_content
+            fields = self._summary_fields(content, query)
+            max_tokens, max_chars = self._summary_limits(max_length)
+            summary = self.generate_from_template(
+                "summarize", max_tokens, max_chars=max_chars, **fields
+            )
+            return self._finalize_summary(summary, fields["content"], max_length)
+        except Exception as e:
+            logger.error(f"Failed to summarize content: {e}")
+            return (
+                content[:max_length] + "..." if len(content) > max_length else content
             )
 
-            summary = self.generate_text(prompt, max_length)
+    def summarize_content_stream(
+        self,
+        content: str,
+        query: str,
+        callback: Callable[[str], bool],
+        max_length: int = MAX_SUMMARY_LENGTH,
+    ) -> str:
+        """Summarize forum content, streaming text chunks to a callback.
 
-            # Clean up and validate summary
-            if not summary or "Generation failed" in summary:
-                # Fallback to simple truncation
-                sentences = clean_content.split(". ")
-                summary = ". ".join(sentences[:2]) + "."
+        Args:
+            content: Content to summarize
+            query: User query for context
+            callback: Streamer receiving each text chunk; returns True to stop
+            max_length: Maximum summary length
 
-            return summary[:max_length] if len(summary) > max_length else summary
+        Returns:
+            Summarized content in Polish
+        """
+        try:
+            fields = self._summary_fields(content, query)
+            prompt = ENHANCED_POLISH_PROMPT_FNS["summarize"](**fields)
+            max_tokens, max_chars = self._summary_limits(max_length)
+            streamer = self._length_streamer(max_chars, callback) or callback
+            summary = self.generate_text_stream(prompt, streamer, max_tokens)
+            return self._finalize_summary(summary, fields["content"], max_length)
         except Exception as e:
             logger.error(f"Failed to summarize content: {e}")
             return (
                 content[:max_length] + "..." if len(content) > max_length else content
             )
 
+    def summarize_contents(
+        self,
+        contents: List[str],
+        queries: List[str],
+        max_length: int = MAX_SUMMARY_LENGTH,
+    ) -> List[str]:
+        """Summarize several forum contents in one batched generation.
+
+        Args:
+            contents: Contents to summarize
+            queries: User query for each content
+            max_length: Maximum summary length
+
+        Returns:
+            Summarized contents in Polish, in input order
+        """
+        try:
+            prepared = [
+                self._summary_fields(content, query)
+                for content, query in zip(contents, queries)
+            ]
+            render = ENHANCED_POLISH_PROMPT_FNS["summarize"]
+            prompts = [render(**fields) for fields in prepared]
+            summaries = self.generate_batch(
+                prompts, self._summary_limits(max_length)[0]
+            )
+            return [
+                self._finalize_summary(summary, fields["content"], max_length)
+                for summary, fields in zip(summaries, prepared)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to summarize contents: {e}")
+            return [
+                self.summarize_content(content, query, max_length)
+                for content, query in zip(contents, queries)
+            ]
+
+    def _summary_fields(self, content: str, query: str) -> Dict[str, str]:
+        """Prepare summarization prompt fields.
+
+        Args:
+            content: Content to summarize
+            query: User query for context
+
+        Returns:
+            Cleaned query and content for the summarize template
+        """
+        return {
+            "query": normalize_polish_text(query),
+            "content": self._normalize_truncated(content, MAX_CONTEXT_LENGTH),
+        }
+
+    def _normalize_truncated(self, text: str, max_length: int) -> str:
+        """Normalize text and truncate it to max_length.
+
+        Input is first cut to twice max_length, so long threads are not
+        normalized in full only to be discarded; the margin covers markup
+        and whitespace removed by normalization.
+
+        Args:
+            text: Raw text
+            max_length: Maximum length of the normalized text
+
+        Returns:
+            Normalized text, with "..." appended when truncated
+        """
+        if len(text) > max_length * 2:
+            text = text[: max_length * 2]
+
+        clean_text = normalize_polish_text(text)
+        if len(clean_text) > max_length:
+            clean_text = clean_text[:max_length] + "..."
+        return clean_text
+
+    def _finalize_summary(
+        self, summary: str, clean_content: str, max_length: int
+    ) -> str:
+        """Validate generated summary and trim it to max_length.
+
+        Args:
+            summary: Generated summary
+            clean_content: Cleaned source content for the fallback
+            max_length: Maximum summary length
+
+        Returns:
+            Final summary
+        """
+        # Clean up and validate summary
+        if not summary or "Generation failed" in summary:
+            # Fallback to the first two sentences, found without splitting all
+            end = -1
+            for _ in range(2):
+                end = clean_content.find(". ", end + 1)
+                if end < 0:
+                    break
+            summary = (clean_content if end < 0 else clean_content[:end]) + "."
+
+        return summary[:max_length] if len(summary) > max_length else summary
+
     def answer_question(
         self, query: str, context: str, max_length: int = MAX_ANSWER_LENGTH
     ) -> str:
@@ -212,18 +790,12 @@ class GenAIHandler(AIHandler):
         """
         try:
             clean_query = normalize_polish_text(query)
-            clean_context = normalize_polish_text(context)
-
-            # Truncate context if too long
-            if len(clean_context) > MAX_CONTEXT_LENGTH:
-                clean_context = clean_context[:MAX_CONTEXT_LENGTH] + "..."
+            clean_context = self._normalize_truncated(context, MAX_CONTEXT_LENGTH)
 
-            prompt = ENHANCED_POLISH_PROMPTS["answer"].format(
-                query=clean_query, context=clean_context
+            answer = self.generate_from_template(
+                "answer", max_length, query=clean_query, context=clean_context
             )
 
-            answer = self.generate_text(prompt, max_length)
-
             # Validate answer
             if not answer or "Generation failed" in answer:
                 return "Nie udało się wygenerować odpowiedzi na podstawie dostępnych informacji."
@@ -233,20 +805,26 @@ class GenAIHandler(AIHandler):
             logger.error(f"Failed to answer question: {e}")
             return "Wystąpił błąd podczas generowania odpowiedzi."
 
-    def enhance_query(self, query: str) -> str:
+    def enhance_query(self, query: str, normalized_query: Optional[str] = None) -> str:
         """Enhance search query with synonyms and related terms.
 
         Args:
             query: Original search query
+            normalized_query: Query already passed through normalize_polish_text
 
         Returns:
             Enhanced query with additional terms
         """
         try:
-            clean_query = normalize_polish_text(query)
+            clean_query = (
+                normalized_query
+                if normalized_query is not None
+                else normalize_polish_text(query)
+            )
 
-            prompt = ENHANCED_POLISH_PROMPTS["enhance_query"].format(query=clean_query)
-            enhanced = self.generate_text(prompt, 50)
+            enhanced = self.generate_from_template(
+                "enhance_query", 50, greedy=True, query=clean_query
+            )
 
             if enhanced and "Generation failed" not in enhanced:
                 return enhanced.strip()
@@ -266,33 +844,96 @@ class GenAIHandler(AIHandler):
             Content category
         """
         try:
-            clean_content = normalize_polish_text(content)
-
-            # Truncate if too long
-            if len(clean_content) > 500:
-                clean_content = clean_content[:500] + "..."
-
-            prompt = ENHANCED_POLISH_PROMPTS["classify"].format(content=clean_content)
-            category = self.generate_text(prompt, 20)
-
-            # Validate category
-            valid_categories = [
-                "opinie_produkty",
-                "porady_techniczne",
-                "rekomendacje",
-                "dyskusja_ogolna",
-                "inne",
-            ]
-            category = category.strip().lower()
-
-            if any(cat in category for cat in valid_categories):
+            clean_content = self._classify_text(content)
+            key = EmbeddingDiskCache.content_key(clean_content)
+            category = self._cached_category(key)
+            if category is not None:
                 return category
 
-            return "inne"  # Default category
+            generated = self.generate_from_template(
+                "classify", 20, greedy=True, content=clean_content
+            )
+            return self._store_category(key, generated)
         except Exception as e:
             logger.error(f"Failed to classify content: {e}")
             return "inne"
 
+    def classify_contents(self, contents: List[str]) -> List[str]:
+        """Classify several forum contents in one batched generation.
+
+        Args:
+            contents: Contents to classify
+
+        Returns:
+            Content categories, in input order
+        """
+        try:
+            texts = [self._classify_text(content) for content in contents]
+            keys = [EmbeddingDiskCache.content_key(text) for text in texts]
+            categories = [self._cached_category(key) for key in keys]
+
+            # Classify each distinct uncached content once, in one batch
+            misses: Dict[str, int] = {}
+            for position, category in enumerate(categories):
+                if category is None and keys[position] not in misses:
+                    misses[keys[position]] = position
+            if misses:
+                render = ENHANCED_POLISH_PROMPT_FNS["classify"]
+                prompts = [render(content=texts[i]) for i in misses.values()]
+                generated = self.generate_batch(prompts, 20, greedy=True)
+                new_categories = {
+                    key: self._store_category(key, text)
+                    for key, text in zip(misses, generated)
+                }
+                categories = [
+                    new_categories[key] if category is None else category
+                    for key, category in zip(keys, categories)
+                ]
+
+            return categories
+        except Exception as e:
+            logger.error(f"Failed to classify contents: {e}")
+            return [self.classify_content(content) for content in contents]
+
+    def _classify_text(self, content: str) -> str:
+        """Normalize and truncate content for classification."""
+        return self._normalize_truncated(content, 500)
+
+    def _cached_category(self, key: str) -> Optional[str]:
+        """Look up category of a previously classified content."""
+        with self._category_lru_lock:
+            category = self._category_lru.get(key)
+            if category is not None:
+                self._category_lru.move_to_end(key)
+        return category
+
+    def _store_category(self, key: str, generated: str) -> str:
+        """Validate generated category, caching it unless generation failed."""
+        category = self._validate_category(generated)
+        failed = not generated or generated == "Model not available"
+        if not failed and "Generation failed" not in generated:
+            with self._category_lru_lock:
+                self._category_lru[key] = category
+                while len(self._category_lru) > CATEGORY_LRU_SIZE:
+                    self._category_lru.popitem(last=False)
+        return category
+
+    def _validate_category(self, category: str) -> str:
+        """Map generated text to a known category."""
+        valid_categories = [
+            "opinie_produkty",
+            "porady_techniczne",
+            "rekomendacje",
+            "dyskusja_ogolna",
+            "inne",
+        ]
+        category = category.strip().lower()
+
+        if any(cat in category for cat in valid_categories):
+            return category
+
+        return "inne"  # Default category
+
     def generate_embeddings(self, texts: List[str]) -> Optional[NDArray]:
         """Generate embeddings for texts using fallback model.
 
@@ -305,24 +946,134 @@ class GenAIHandler(AIHandler):
         if not self.embedding_model and not self._load_embedding_model():
             return None
 
+        return self._encode_prepared(clean_for_embedding_many(texts))
+
+    def generate_query_embeddings(self, queries: List[str]) -> Optional[NDArray]:
+        """Generate embeddings for search queries as typed.
+
+        Unlike generate_embeddings, stopwords are kept, so negations such as
+        "nie" or "bez" still change the embedding.
+
+        Args:
+            queries: List of search queries
+
+        Returns:
+            Embeddings array or None if failed
+        """
+        return self._encode_prepared([" ".join(query.split()) for query in queries])
+
+    def _encode_prepared(self, processed_texts: List[str]) -> Optional[NDArray]:
+        """Encode texts already prepared with clean_for_embedding."""
+        if not self.embedding_model and not self._load_embedding_model():
+            return None
+
         try:
-            # Preprocess texts
-            processed_texts = []
-            for text in texts:
-                normalized = normalize_polish_text(text)
-                words = normalized.split()
-                without_stopwords = remove_stopwords(words)
-                processed_texts.append(" ".join(without_stopwords))
-
-            if self.embedding_model is not None:
-                embeddings = self.embedding_model.encode(processed_texts)
-                return embeddings
-            else:
+            if self.embedding_model is None:
                 return None
+
+            keys = [EmbeddingDiskCache.content_key(text) for text in processed_texts]
+            with self._embedding_lru_lock:
+                found = [self._embedding_lru.get(key) for key in keys]
+                for key, embedding in zip(keys, found):
+                    if embedding is not None:
+                        self._embedding_lru.move_to_end(key)
+
+            # Encode each distinct uncached text once, in one batch
+            misses: Dict[str, int] = {}
+            for position, embedding in enumerate(found):
+                if embedding is None and keys[position] not in misses:
+                    misses[keys[position]] = position
+            if misses:
+                encoded = _as_contig_f32(
+                    self.embedding_model.encode(
+                        [processed_texts[i] for i in misses.values()],
+                        batch_size=EMBEDDING_BATCH_SIZE,
+                        show_progress_bar=False,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,
+                    )
+                )
+                new_rows = dict(zip(misses, encoded))
+                with self._embedding_lru_lock:
+                    self._embedding_lru.update(zip(misses, encoded.astype(np.float16)))
+                    while len(self._embedding_lru) > EMBEDDING_LRU_SIZE:
+                        self._embedding_lru.popitem(last=False)
+                found = [
+                    new_rows[key] if embedding is None else embedding
+                    for key, embedding in zip(keys, found)
+                ]
+
+            if not found:
+                return np.empty((0, 0), dtype=np.float32)
+            return _as_contig_f32(np.stack(found))
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
             return None
 
+    def generate_embeddings_cached(
+        self, texts: List[str], cache: EmbeddingDiskCache
+    ) -> Optional[NDArray]:
+        """Generate embeddings, encoding only texts missing from the disk cache.
+
+        Args:
+            texts: List of texts to embed
+            cache: Content-hash keyed embedding cache
+
+        Returns:
+            Embeddings array or None if failed
+        """
+        try:
+            processed_texts = clean_for_embedding_many(texts)
+            keys = [cache.content_key(text) for text in processed_texts]
+            cached = cache.get_many(keys)
+
+            misses = [i for i, embedding in enumerate(cached) if embedding is None]
+            if misses:
+                if not self.embedding_model and not self._load_embedding_model():
+                    return None
+                if self.embedding_model is None:
+                    return None
+
+                # Encode all misses in one batch and write them back
+                encoded = self.embedding_model.encode(
+                    [processed_texts[i] for i in misses],
+                    batch_size=EMBEDDING_BATCH_SIZE,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                )
+                cache.put_many([keys[i] for i in misses], encoded)
+                for i, embedding in zip(misses, encoded):
+                    cached[i] = embedding
+
+            if not cached:
+                return np.empty((0, cache.dimension or 0), dtype=np.float32)
+            return _as_contig_f32(np.stack(cached))
+        except Exception as e:
+            logger.error(f"Failed to generate cached embeddings: {e}")
+            return None
+
+    def generate_embeddings_int8(
+        self, texts: List[str]
+    ) -> Optional[Tuple[NDArray[np.int8], NDArray[np.float32]]]:
+        """Generate int8-quantized embeddings for compact storage.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Tuple of (quantized rows, per-row scales) or None if failed
+        """
+        embeddings = self.generate_embeddings(texts)
+        if embeddings is None:
+            return None
+
+        try:
+            return quantize_int8(embeddings)
+        except Exception as e:
+            logger.error(f"Failed to quantize embeddings: {e}")
+            return None
+
     def process_query(
         self, query: str, context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -338,16 +1089,14 @@ class GenAIHandler(AIHandler):
         try:
             # Basic processing
             normalized_query = normalize_polish_text(query)
-            query_words = normalized_query.split()
-            clean_words = remove_stopwords(query_words)
-            clean_query = " ".join(clean_words)
+            clean_query = remove_stopwords_normalized(normalized_query)
 
-            # AI enhancements
-            enhanced_query = self.enhance_query(query)
+            # AI enhancements, reusing the normalized query
+            enhanced_query = self.enhance_query(query, normalized_query)
 
-            # Generate embeddings if available
+            # Generate embeddings if available; clean_query is already prepared
             query_embedding = None
-            embeddings = self.generate_embeddings([clean_query])
+            embeddings = self._encode_prepared([clean_query])
             if embeddings is not None:
                 query_embedding = embeddings[0]
 
@@ -357,7 +1106,9 @@ class GenAIHandler(AIHandler):
                 "clean_query": clean_query,
                 "enhanced_query": enhanced_query,
                 "embedding": (
-                    query_embedding.tolist() if query_embedding is not None else None
+                    encode_embedding_b64(query_embedding)
+                    if query_embedding is not None
+                    else None
                 ),
                 "context": context or {},
             }
@@ -377,37 +1128,44 @@ class GenAIHandler(AIHandler):
     ) -> List[Dict[str, Any]]:
         """Enhance search results with AI-generated content.
 
+        The result dictionaries are updated in place (``ai_summary``,
+        ``ai_category`` and ``embedding`` keys) rather than copied, as wide
+        Sphinx rows make per-result copies costly. Embeddings are stored
+        int8-quantized as packed by pack_int8_embedding; use
+        unpack_int8_embeddings with int8_similarity to score them.
+
         Args:
-            results: List of search result dictionaries
+            results: List of search result dictionaries, modified in place
             query: Original search query
 
         Returns:
             Enhanced results with AI summaries, answers, and classifications
         """
         try:
-            enhanced_results = []
-
+            with_content = []
             for result in results:
-                enhanced_result = result.copy()
                 content = result.get("content", result.get("body", ""))
-
                 if content:
-                    # Generate AI summary
-                    summary = self.summarize_content(content, query)
-                    enhanced_result["ai_summary"] = summary
-
-                    # Classify content
-                    category = self.classify_content(content)
-                    enhanced_result["ai_category"] = category
-
-                    # Generate embeddings for similarity scoring
-                    embeddings = self.generate_embeddings([content])
-                    if embeddings is not None:
-                        enhanced_result["embedding"] = embeddings[0].tolist()
+                    with_content.append((result, content))
+            if not with_content:
+                return results
+
+            # Summaries, categories and embeddings each in one batched call
+            contents = [content for _, content in with_content]
+            summaries = self.summarize_contents(contents, [query] * len(contents))
+            categories = self.classify_contents(contents)
+            quantized = self.generate_embeddings_int8(contents)
+
+            for position, (result, _) in enumerate(with_content):
+                result["ai_summary"] = summaries[position]
+                result["ai_category"] = categories[position]
+                if quantized is not None:
+                    rows, scales = quantized
+                    result["embedding"] = pack_int8_embedding(
+                        rows[position], scales[position]
+                    )
 
-                enhanced_results.append(enhanced_result)
-
-            return enhanced_results
+            return results
         except Exception as e:
             logger.error(f"Failed to enhance results: {e}")
             return results
@@ -416,23 +1174,30 @@ class GenAIHandler(AIHandler):
         self,
         query_embedding: NDArray,
         content_embeddings: NDArray,
+        content_scales: Optional[NDArray] = None,
     ) -> Optional[NDArray]:
         """Calculate similarity between query and content embeddings.
 
         Args:
             query_embedding: Query embedding
-            content_embeddings: Content embeddings
+            content_embeddings: Content embeddings (float32, or int8 with scales)
+            content_scales: Per-row scales for int8 content embeddings
 
         Returns:
             Similarity scores or None if failed
         """
         try:
-            if not EMBEDDINGS_AVAILABLE:
-                return None
-
-            # Use cosine similarity
-            similarities = cosine_similarity([query_embedding], content_embeddings)
-            return similarities[0]  # Return 1D array of similarities
+            if content_scales is not None:
+                return int8_similarity(
+                    query_embedding, content_embeddings, content_scales
+                )
+
+            # Embeddings are L2-normalized, so cosine similarity is a dot product.
+            # Contiguous float32 inputs from generate_embeddings pass through
+            # without a copy.
+            content = _as_contig_f32(content_embeddings)
+            query = _as_contig_f32(query_embedding).ravel()
+            return content @ query
         except Exception as e:
             logger.error(f"Failed to calculate similarity: {e}")
             return None
@@ -450,6 +1215,59 @@ class GenAIHandler(AIHandler):
         """
         return self.summarize_content(content, query, max_length)
 
+    def generate_summaries(
+        self, queries: List[str], contents: List[str], max_length: int = 200
+    ) -> List[str]:
+        """Generate summaries for several contents in one batch.
+
+        Args:
+            queries: Search query for each content
+            contents: Contents to summarize
+            max_length: Maximum summary length
+
+        Returns:
+            Generated summaries, in input order
+        """
+        return self.summarize_contents(contents, queries, max_length)
+
+    async def generate_summary_async(
+        self, query: str, content: str, max_length: int = 200
+    ) -> str:
+        """Generate content summary in a worker thread.
+
+        Args:
+            query: Search query for context
+            content: Content to summarize
+            max_length: Maximum summary length
+
+        Returns:
+            Generated summary
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.generate_summary, query, content, max_length),
+        )
+
+    async def generate_summaries_async(
+        self, queries: List[str], contents: List[str], max_length: int = 200
+    ) -> List[str]:
+        """Generate summaries for several contents in a worker thread.
+
+        Args:
+            queries: Search query for each content
+            contents: Contents to summarize
+            max_length: Maximum summary length
+
+        Returns:
+            Generated summaries, in input order
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.generate_summaries, queries, contents, max_length),
+        )
+
     def preprocess_text(self, text: str) -> str:
         """Preprocess text for AI processing.
 
@@ -461,10 +1279,7 @@ class GenAIHandler(AIHandler):
         """
         try:
             # Use our existing text processing pipeline
-            normalized = normalize_polish_text(text)
-            words = normalized.split()
-            clean_words = remove_stopwords(words)
-            return " ".join(clean_words)
+            return clean_for_embedding(text)
         except Exception as e:
             logger.error(f"Failed to preprocess text: {e}")
             return text
@@ -493,6 +1308,9 @@ class GenAIHandler(AIHandler):
             "embeddings_available": EMBEDDINGS_AVAILABLE,
             "model_loaded": self.pipe is not None,
             "embedding_model_loaded": self.embedding_model is not None,
+            "embedding_backend": self.embedding_backend,
+            "prefix_caching": self.enable_prefix_caching,
+            "quantize_llm": self.quantize_llm,
             "device": self.device,
             "model_path": str(self.model_path) if self.model_path else None,
         }
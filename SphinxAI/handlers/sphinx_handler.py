@@ -5,20 +5,95 @@ Sphinx Search Handler - Clean Implementation.
 This module handles all Sphinx search operations following Single Responsibility Principle.
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
-try:
-    import pymysql
-    import pymysql.cursors
+# Index names are interpolated into the SphinxQL templates
+_INDEX_NAME_RE = re.compile(r"^[A-Za-z0-9_]+$")
 
-    PYMYSQL_AVAILABLE = True
-except ImportError:
+# Database drivers are only imported when the first connection is opened,
+# so CLI commands that never touch Sphinx do not pay their import cost
+PYMYSQL_AVAILABLE = importlib.util.find_spec("pymysql") is not None
+if not PYMYSQL_AVAILABLE:
     logger.warning("PyMySQL not available")
-    PYMYSQL_AVAILABLE = False
-    pymysql = None
+AIOMYSQL_AVAILABLE = importlib.util.find_spec("aiomysql") is not None
+
+
+class PendingSearch:
+    """
+    Sphinx search sent to the server whose result has not been read yet.
+
+    The pooled connection stays checked out until fetch() or cancel() is
+    called, so every pending search must be finished with one of them;
+    cancel() after fetch() is a no-op.
+
+    Splitting Connection.query() relies on PyMySQL internals
+    (Connection._execute_command, _read_query_result and _result.rows), which
+    is why requirements pin PyMySQL to the tested range. Deployments that
+    cannot pin it should enable [sphinx] async_search instead.
+    """
+
+    def __init__(self, handler: "SphinxSearchHandler", connection: Any = None):
+        """
+        Initialize pending search.
+
+        Args:
+            handler: Handler that sent the search
+            connection: Connection the query was written to, or None when
+                nothing was sent
+        """
+        self._handler = handler
+        self._connection = connection
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        """
+        Wait for and read the search result.
+
+        Returns:
+            List of search results
+
+        Raises:
+            Exception: If the result could not be read, so the caller can
+                retry the search instead of reporting no results
+        """
+        rows = self._read()
+        return self._handler._format_results(rows) if rows else []
+
+    def cancel(self) -> None:
+        """Read and drop the result, returning the connection to the pool."""
+        try:
+            self._read()
+        except Exception as e:
+            logger.debug(f"Error dropping pending Sphinx result: {e}")
+
+    def _read(self) -> Tuple[Any, ...]:
+        """Read the raw result rows and release the connection."""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return ()
+
+        pool = self._handler._pool
+        try:
+            # Counterpart of the query write in send_search; both halves of
+            # Connection.query() are used separately to overlap the wait
+            connection._read_query_result()
+            rows = connection._result.rows or ()
+        except BaseException:
+            pool.discard(connection)
+            raise
+
+        pool.release(connection)
+        return rows
 
 
 class SphinxSearchHandler:
@@ -35,6 +110,9 @@ class SphinxSearchHandler:
         port: int = 9306,
         index_name: str = "forum_posts",
         connection_timeout: int = 10,
+        pool_size: int = 8,
+        status_ttl: float = 30.0,
+        content_db: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize Sphinx handler.
@@ -44,16 +122,41 @@ class SphinxSearchHandler:
             port: Sphinx server port
             index_name: Index name to search
             connection_timeout: Connection timeout in seconds
+            pool_size: Maximum number of idle connections kept for reuse
+            status_ttl: Seconds a get_status probe result is reused
+            content_db: SMF database settings (host, port, database, user,
+                password, table_prefix, charset); when given, search_ids
+                results have their content hydrated from smf_messages
         """
+        if not _INDEX_NAME_RE.match(index_name):
+            raise ValueError(f"Invalid Sphinx index name: {index_name!r}")
+
         self.host = host
         self.port = port
         self.index_name = index_name
+        # Search statements keyed by whether content is selected; the index
+        # name is fixed, so only the query and limit vary per call
+        self._search_sql = {
+            with_content: self._build_search_sql(with_content)
+            for with_content in (True, False)
+        }
         self.connection_timeout = connection_timeout
-        self.connection = None
+        self.status_ttl = status_ttl
+        # (monotonic time of the probe, status) of the last get_status call
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_lock = threading.Lock()
 
         if not PYMYSQL_AVAILABLE:
             raise ImportError("PyMySQL is required for Sphinx integration")
 
+        self._pool = ConnectionPool(self._connect, max_idle=pool_size)
+        self.content_db = content_db
+        self._content_pool = (
+            ConnectionPool(self._connect_content_db, max_idle=pool_size)
+            if content_db
+            else None
+        )
+
         logger.info(f"Sphinx handler initialized: {host}:{port}")
 
     def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -67,129 +170,310 @@ class SphinxSearchHandler:
         Returns:
             List of search results
         """
+        return self.search_many([(query, max_results)])[0]
+
+    def search_batch(
+        self, queries: List[str], max_results: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Perform Sphinx search for several queries in one round trip.
+
+        Args:
+            queries: Search queries
+            max_results: Maximum results to return per query
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        return self.search_many([(query, max_results) for query in queries])
+
+    @property
+    def lazy_content(self) -> bool:
+        """Whether search_ids results can be hydrated with hydrate_content."""
+        return self._content_pool is not None
+
+    def send_search(
+        self, query: str, max_results: int = 10, with_content: bool = True
+    ) -> Optional[PendingSearch]:
+        """
+        Send a Sphinx search without waiting for its result.
+
+        The server works on the query while the caller does other work;
+        PendingSearch.fetch() then reads the result.
+
+        Args:
+            query: Search query
+            max_results: Maximum results to return
+            with_content: Whether to fetch post content along with the rows
+
+        Returns:
+            Pending search to fetch the result from, or None if it could not
+            be sent and search() should be used instead
+        """
         if not query or not query.strip():
-            return []
+            return PendingSearch(self)
 
         try:
-            connection = self._get_connection()
-            if not connection:
-                logger.error("Failed to connect to Sphinx")
-                return []
-
-            with connection.cursor() as cursor:
-                # Use parameterized query to prevent SQL injection
-                sql = f"""
-                    SELECT id, weight(), subject, content, topic_id, post_id,
-                           board_id, board_name, num_replies, num_views
-                    FROM {self.index_name}
-                    WHERE MATCH(%s)
-                    ORDER BY weight() DESC, id DESC
-                    LIMIT %s
-                """
-
-                cursor.execute(sql, (query, max_results))
-                results = cursor.fetchall()
-
-                return self._format_results(results)
+            import pymysql.constants.COMMAND
 
+            connection = self._pool.acquire()
         except Exception as e:
             logger.error(f"Sphinx search error: {e}")
-            return []
-        finally:
-            self._close_connection()
+            return None
+
+        try:
+            sql = self._search_sql[with_content] % (
+                connection.escape(query),
+                int(max_results),
+            )
+            connection._execute_command(pymysql.constants.COMMAND.COM_QUERY, sql)
+        except Exception as e:
+            logger.error(f"Sphinx search error: {e}")
+            self._pool.discard(connection)
+            return None
+
+        return PendingSearch(self, connection)
+
+    def search_ids(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        Perform Sphinx search without fetching post content.
+
+        Content is by far the largest column on the wire; results carry an
+        empty content until passed to hydrate_content.
+
+        Args:
+            query: Search query
+            max_results: Maximum results to return
+
+        Returns:
+            List of search results with empty content
+        """
+        return self.search_many([(query, max_results)], with_content=False)[0]
+
+    def hydrate_content(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fill in missing content from the SMF messages table in one query.
+
+        Args:
+            results: Search results, updated in place
+
+        Returns:
+            The same results
+        """
+        if self._content_pool is None:
+            return results
+
+        post_ids = list(
+            dict.fromkeys(
+                result["post_id"]
+                for result in results
+                if not result.get("content") and result.get("post_id")
+            )
+        )
+        if not post_ids:
+            return results
+
+        table = f"{self.content_db.get('table_prefix', 'smf_')}messages"
+        placeholders = ", ".join(["%s"] * len(post_ids))
+        try:
+            with self._content_pool.connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT id_msg, body FROM {table} "
+                        f"WHERE id_msg IN ({placeholders})",
+                        post_ids,
+                    )
+                    bodies = dict(cursor.fetchall())
+
+            for result in results:
+                if not result.get("content"):
+                    result["content"] = bodies.get(result.get("post_id"), "")
+
+        except Exception as e:
+            logger.error(f"Content hydration error: {e}")
+
+        return results
+
+    def search_many(
+        self, queries: List[Tuple[str, int]], with_content: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Perform several Sphinx searches as one multi-statement round trip.
+
+        Args:
+            queries: (query, max_results) pairs
+            with_content: Whether to fetch post content along with the rows
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        raw_results: List[List[Tuple[Any, ...]]] = [[] for _ in queries]
+        active = [
+            position
+            for position, (query, _) in enumerate(queries)
+            if query and query.strip()
+        ]
+        if not active:
+            return raw_results
+
+        try:
+            search_sql = self._search_sql[with_content]
+            with self._pool.connection() as connection:
+                with connection.cursor() as cursor:
+                    # Parameter markers cannot span statements, so each
+                    # statement is bound client-side before joining
+                    cursor.execute(
+                        ";".join(
+                            cursor.mogrify(
+                                search_sql,
+                                (queries[position][0], int(queries[position][1])),
+                            )
+                            for position in active
+                        )
+                    )
+                    for statement, position in enumerate(active):
+                        if statement:
+                            cursor.nextset()
+                        raw_results[position] = cursor.fetchall()
+
+            # Format only once the connection is back in the pool
+            return [self._format_results(rows) for rows in raw_results]
+
+        except Exception as e:
+            logger.error(f"Sphinx search error: {e}")
+            return [[] for _ in queries]
+
+    def _build_search_sql(self, with_content: bool = True) -> str:
+        """
+        Build search statement template for the configured index.
+
+        Rows come back as plain tuples; _format_results unpacks them in the
+        column order selected here, with content last so that rows without
+        it share the same layout.
+
+        Args:
+            with_content: Whether to select post content
+
+        Returns:
+            SphinxQL SELECT statement with query and limit parameter markers
+        """
+        content_column = ", content" if with_content else ""
+        return (
+            "SELECT id, weight(), subject, topic_id, post_id, board_id, "
+            f"board_name, num_replies, num_views{content_column} "
+            f"FROM {self.index_name} WHERE MATCH(%s) "
+            "ORDER BY weight() DESC, id DESC LIMIT %s"
+        )
 
     def get_status(self) -> Dict[str, Any]:
-        """Get Sphinx handler status."""
-        status = {
+        """Get Sphinx handler status, probing the server at most once per TTL."""
+        with self._status_lock:
+            cached = self._status_cache
+            if cached is not None and time.monotonic() - cached[0] < self.status_ttl:
+                return dict(cached[1])
+
+            status = self._probe_status()
+            self._status_cache = (time.monotonic(), status)
+            return dict(status)
+
+    def _probe_status(self) -> Dict[str, Any]:
+        """Check the connection and index on the server."""
+        status: Dict[str, Any] = {
             "handler": "sphinx",
             "host": self.host,
             "port": self.port,
             "index": self.index_name,
             "pymysql_available": PYMYSQL_AVAILABLE,
+            "idle_connections": len(self._pool),
         }
 
         try:
-            connection = self._get_connection()
-            if connection:
+            with self._pool.connection() as connection:
                 status["connection"] = "active"
                 # Test query to check index
                 with connection.cursor() as cursor:
-                    cursor.execute(f"SHOW TABLES LIKE '{self.index_name}'")
+                    cursor.execute("SHOW TABLES LIKE %s", (self.index_name,))
                     result = cursor.fetchone()
                     status["index_exists"] = result is not None
-            else:
-                status["connection"] = "failed"
-                status["index_exists"] = False
 
         except Exception as e:
             status["connection"] = "error"
             status["error"] = str(e)
-        finally:
-            self._close_connection()
 
         return status
 
-    def _get_connection(self):
-        """Get database connection to Sphinx."""
-        try:
-            if self.connection and self.connection.open:
-                return self.connection
-
-            self.connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                charset="utf8mb4",
-                cursorclass=pymysql.cursors.DictCursor,
-                connect_timeout=self.connection_timeout,
-                autocommit=True,
-            )
-
-            return self.connection
-
-        except Exception as e:
-            logger.error(f"Sphinx connection error: {e}")
-            return None
-
-    def _close_connection(self) -> None:
-        """Close database connection."""
-        if self.connection:
-            try:
-                self.connection.close()
-            except Exception as e:
-                logger.warning(f"Error closing Sphinx connection: {e}")
-            finally:
-                self.connection = None
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close_all()
+        if self._content_pool is not None:
+            self._content_pool.close_all()
+
+    def _connect(self) -> Any:
+        """Open a new database connection to Sphinx."""
+        import pymysql
+        import pymysql.constants.CLIENT
+
+        return pymysql.connect(
+            host=self.host,
+            port=self.port,
+            charset="utf8mb4",
+            connect_timeout=self.connection_timeout,
+            autocommit=True,
+            client_flag=pymysql.constants.CLIENT.MULTI_STATEMENTS,
+        )
+
+    def _connect_content_db(self) -> Any:
+        """Open a new database connection to the SMF database."""
+        import pymysql
+
+        db = self.content_db or {}
+        return pymysql.connect(
+            host=db.get("host", "localhost"),
+            port=int(db.get("port", 3306)),
+            user=db.get("user", ""),
+            password=db.get("password", ""),
+            database=db.get("database", ""),
+            charset=db.get("charset", "utf8mb4"),
+            connect_timeout=self.connection_timeout,
+            autocommit=True,
+        )
 
     def _format_results(
-        self, raw_results: List[Dict[str, Any]]
+        self, raw_results: List[Tuple[Any, ...]]
     ) -> List[Dict[str, Any]]:
-        """Format raw Sphinx results."""
-        formatted_results = []
-
-        for result in raw_results:
-            formatted_result = {
-                "id": str(result.get("id", "")),
-                "title": result.get("subject", ""),
-                "content": result.get("content", ""),
-                "weight": float(result.get("weight()", 0)),
-                "topic_id": result.get("topic_id"),
-                "post_id": result.get("post_id"),
-                "board_id": result.get("board_id"),
-                "board_name": result.get("board_name", "Unknown"),
-                "num_replies": int(result.get("num_replies", 0)),
-                "num_views": int(result.get("num_views", 0)),
-                "url": self._generate_post_url(result),
+        """Format raw Sphinx result rows, in _build_search_sql column order."""
+        _int, _float, _str = int, float, str
+        post_url = self._generate_post_url
+        return [
+            {
+                "id": _str(row_id),
+                "title": subject,
+                "content": content[0] if content else "",
+                "weight": _float(weight),
+                "topic_id": topic_id,
+                "post_id": post_id,
+                "board_id": board_id,
+                "board_name": board_name or "Unknown",
+                "num_replies": _int(num_replies or 0),
+                "num_views": _int(num_views or 0),
+                "url": post_url(topic_id, post_id),
             }
-
-            formatted_results.append(formatted_result)
-
-        return formatted_results
-
-    def _generate_post_url(self, result: Dict[str, Any]) -> str:
+            for (
+                row_id,
+                weight,
+                subject,
+                topic_id,
+                post_id,
+                board_id,
+                board_name,
+                num_replies,
+                num_views,
+                *content,
+            ) in raw_results
+        ]
+
+    def _generate_post_url(self, topic_id: Any, post_id: Any) -> str:
         """Generate URL for forum post."""
-        topic_id = result.get("topic_id")
-        post_id = result.get("post_id")
-
         if topic_id and post_id:
             return f"index.php?topic={topic_id}.msg{post_id}#msg{post_id}"
         elif topic_id:
@@ -198,11 +482,174 @@ class SphinxSearchHandler:
             return ""
 
 
+class AsyncSphinxSearchHandler(SphinxSearchHandler):
+    """
+    Sphinx search handler with coroutine search methods.
+
+    Sphinx queries are pure network I/O, so awaiting them on an aiomysql
+    pool lets concurrent searches overlap their round trips without a
+    worker thread each. The synchronous methods are inherited unchanged
+    for the CLI path.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9306,
+        index_name: str = "forum_posts",
+        connection_timeout: int = 10,
+        pool_size: int = 8,
+        status_ttl: float = 30.0,
+        async_pool_size: int = 16,
+        content_db: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize async Sphinx handler.
+
+        Args:
+            host: Sphinx server host
+            port: Sphinx server port
+            index_name: Index name to search
+            connection_timeout: Connection timeout in seconds
+            pool_size: Maximum number of idle synchronous connections
+            status_ttl: Seconds a get_status probe result is reused
+            async_pool_size: Maximum number of aiomysql pool connections
+            content_db: SMF database settings for hydrate_content
+        """
+        if not AIOMYSQL_AVAILABLE:
+            raise ImportError("aiomysql is required for async Sphinx integration")
+
+        super().__init__(
+            host,
+            port,
+            index_name,
+            connection_timeout,
+            pool_size,
+            status_ttl,
+            content_db,
+        )
+        self.async_pool_size = async_pool_size
+        # aiomysql pools are bound to the event loop they were created in
+        self._async_pool: Any = None
+        self._async_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_pool_lock: Optional[asyncio.Lock] = None
+
+    async def search_async(
+        self, query: str, max_results: int = 10, with_content: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform Sphinx search without blocking the event loop.
+
+        Args:
+            query: Search query
+            max_results: Maximum results to return
+            with_content: Whether to fetch post content along with the rows;
+                without it, results are hydrated like those of search_ids
+
+        Returns:
+            List of search results
+        """
+        if not query or not query.strip():
+            return []
+
+        try:
+            pool = await self._get_async_pool()
+            async with pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(
+                        self._search_sql[with_content], (query, int(max_results))
+                    )
+                    rows = await cursor.fetchall()
+
+            # Format only once the connection is back in the pool
+            return self._format_results(rows)
+
+        except Exception as e:
+            logger.error(f"Sphinx search error: {e}")
+            return []
+
+    async def search_batch_async(
+        self, queries: List[str], max_results: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Perform concurrent Sphinx searches for several queries.
+
+        Args:
+            queries: Search queries
+            max_results: Maximum results to return per query
+
+        Returns:
+            List of search results for each query, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.search_async(query, max_results) for query in queries)
+            )
+        )
+
+    async def close_async(self) -> None:
+        """Close the aiomysql pool and all pooled synchronous connections."""
+        self.close()
+        pool, self._async_pool = self._async_pool, None
+        self._async_pool_loop = None
+        self._async_pool_lock = None
+        if pool is not None:
+            pool.close()
+            await pool.wait_closed()
+
+    async def _get_async_pool(self) -> Any:
+        """Create the aiomysql pool for the running event loop on first use."""
+        import aiomysql
+
+        loop = asyncio.get_running_loop()
+        if self._async_pool_loop is not loop:
+            if self._async_pool is not None and self._async_pool_loop is not None:
+                self._close_stale_pool(self._async_pool, self._async_pool_loop)
+            self._async_pool = None
+            self._async_pool_loop = loop
+            self._async_pool_lock = asyncio.Lock()
+
+        async with self._async_pool_lock:
+            if self._async_pool is None:
+                self._async_pool = await aiomysql.create_pool(
+                    host=self.host,
+                    port=self.port,
+                    charset="utf8mb4",
+                    connect_timeout=self.connection_timeout,
+                    autocommit=True,
+                    minsize=1,
+                    maxsize=self.async_pool_size,
+                )
+        return self._async_pool
+
+    @staticmethod
+    def _close_stale_pool(pool: Any, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the aiomysql pool of an event loop that is no longer used."""
+        pool.close()
+        if loop.is_running():
+            # Still running in another thread, so close the pool there
+            asyncio.run_coroutine_threadsafe(pool.wait_closed(), loop)
+            return
+
+        # Transports of a stopped loop cannot be closed through it (e.g.
+        # after asyncio.run returned); shutting the sockets down releases
+        # the server side, and the sockets are freed with the pool
+        for connection in [*pool._free, *pool._used]:
+            writer = getattr(connection, "_writer", None)
+            if writer is None:
+                continue
+            try:
+                writer.transport.get_extra_info("socket").shutdown(socket.SHUT_RDWR)
+            except (AttributeError, OSError) as e:
+                logger.debug(f"Error closing stale aiomysql connection: {e}")
+
+
 def create_sphinx_handler(
     host: str = "localhost",
     port: int = 9306,
     index_name: str = "forum_posts",
     connection_timeout: int = 10,
+    pool_size: int = 8,
 ) -> SphinxSearchHandler:
     """
     Factory function to create Sphinx handler.
@@ -212,8 +659,9 @@ def create_sphinx_handler(
         port: Sphinx server port
         index_name: Index name
         connection_timeout: Connection timeout
+        pool_size: Maximum number of idle pooled connections
 
     Returns:
         Configured Sphinx handler
     """
-    return SphinxSearchHandler(host, port, index_name, connection_timeout)
+    return SphinxSearchHandler(host, port, index_name, connection_timeout, pool_size)
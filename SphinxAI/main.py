@@ -10,14 +10,26 @@ import argparse
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
 from SphinxAI.core.constants import PLUGIN_NAME, VERSION, config_manager
-from SphinxAI.core.interfaces import SearchHandler
+from SphinxAI.core.interfaces import ProcessingResult, SearchHandler
 from SphinxAI.core.search_coordinator import SearchCoordinator
 from SphinxAI.handlers.genai_handler import GenAIHandler
-from SphinxAI.handlers.sphinx_handler import SphinxSearchHandler
+from SphinxAI.handlers.sphinx_handler import (
+    AIOMYSQL_AVAILABLE,
+    AsyncSphinxSearchHandler,
+    SphinxSearchHandler,
+)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +38,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def load_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON input, using orjson when installed.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize CLI output as UTF-8 JSON, using orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: Whether to indent the document; compact output fits on one line
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode(
+        "utf-8"
+    )
+
+
 def load_configuration() -> Dict[str, Any]:
     """Load configuration from INI and JSON files
 
@@ -47,6 +93,25 @@ def load_configuration() -> Dict[str, Any]:
         sys.exit(1)
 
 
+def config_flag(section: Dict[str, Any], key: str, default: bool = False) -> bool:
+    """Read a boolean option, which INI files provide as a string.
+
+    Args:
+        section: Configuration section
+        key: Option name
+        default: Value when the option is not set
+
+    Returns:
+        Option value
+    """
+    value = section.get(key)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
 def setup_handlers(config: Dict[str, Any]) -> Dict[str, Any]:
     """Setup search and AI handlers based on configuration.
 
@@ -60,10 +125,21 @@ def setup_handlers(config: Dict[str, Any]) -> Dict[str, Any]:
 
     # Setup Sphinx handler
     sphinx_config = config.get("sphinx", {})
-    sphinx_handler = SphinxSearchHandler(
+    sphinx_handler_class = SphinxSearchHandler
+    if config_flag(sphinx_config, "async_search"):
+        if AIOMYSQL_AVAILABLE:
+            sphinx_handler_class = AsyncSphinxSearchHandler
+        else:
+            logger.warning("aiomysql not available, using synchronous Sphinx search")
+    sphinx_handler = sphinx_handler_class(
         host=sphinx_config.get("host", "localhost"),
         port=sphinx_config.get("port", 9306),
         index_name=sphinx_config.get("index", "smf_posts"),
+        content_db=(
+            config.get("database")
+            if config_flag(sphinx_config, "lazy_content")
+            else None
+        ),
     )
     handlers["sphinx"] = sphinx_handler
 
@@ -76,7 +152,9 @@ def setup_handlers(config: Dict[str, Any]) -> Dict[str, Any]:
     )
     if genai_model_path:
         genai_handler = GenAIHandler(
-            model_path=genai_model_path, device=ai_config.get("device", "CPU")
+            model_path=genai_model_path,
+            device=ai_config.get("device", "CPU"),
+            quantize_llm=config_flag(ai_config, "quantize_llm", True),
         )
         if genai_handler.is_available():
             handlers["genai"] = genai_handler
@@ -98,6 +176,36 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     return load_configuration()
 
 
+def create_coordinator(args: argparse.Namespace) -> SearchCoordinator:
+    """Load configuration and build the search coordinator with its handlers.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Search coordinator
+    """
+    # Load configuration
+    config = load_config(Path(args.config) if args.config else None)
+
+    # Setup handlers
+    handlers = setup_handlers(config)
+
+    # Initialize search coordinator
+    ai_handlers_list = [h for k, h in handlers.items() if k != "sphinx"]
+    sphinx_handler = handlers.get("sphinx")
+    if sphinx_handler is None:
+        logger.error("Sphinx handler not available")
+        sys.exit(1)
+
+    return SearchCoordinator(
+        sphinx_handler=sphinx_handler,
+        ai_handler=ai_handlers_list[0] if ai_handlers_list else None,
+        genai_handler=handlers.get("genai"),
+        semantic_cache=config_flag(config.get("cache", {}), "semantic"),
+    )
+
+
 def handle_search(args: argparse.Namespace) -> None:
     """Handle search command.
 
@@ -105,30 +213,13 @@ def handle_search(args: argparse.Namespace) -> None:
         args: Parsed command line arguments
     """
     try:
-        # Load configuration
-        config = load_config(Path(args.config) if args.config else None)
-
-        # Setup handlers
-        handlers = setup_handlers(config)
-
-        # Initialize search coordinator
-        ai_handlers_list = [h for k, h in handlers.items() if k != "sphinx"]
-        sphinx_handler = handlers.get("sphinx")
-        if sphinx_handler is None:
-            logger.error("Sphinx handler not available")
-            sys.exit(1)
-            
-        coordinator = SearchCoordinator(
-            sphinx_handler=sphinx_handler,
-            ai_handler=ai_handlers_list[0] if ai_handlers_list else None,
-            genai_handler=handlers.get("genai"),
-        )
+        coordinator = create_coordinator(args)
 
         # Perform search
         if args.input_file:
             # Read search data from file (for SMF integration)
-            with open(args.input_file, "r", encoding="utf-8") as f:
-                search_data = json.load(f)
+            with open(args.input_file, "rb") as f:
+                search_data = load_json(f.read())
 
             query = search_data.get("query", "")
             context = search_data.get("context", {})
@@ -144,18 +235,55 @@ def handle_search(args: argparse.Namespace) -> None:
         # Execute search
         results = coordinator.search(query, context)
 
-        # Output results
+        # Output results, written as bytes without a text encoding pass
+        output = dump_json(results.to_dict())
         if args.output_file:
-            with open(args.output_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            with open(args.output_file, "wb") as f:
+                f.write(output)
         else:
-            print(json.dumps(results, ensure_ascii=False, indent=2))
+            sys.stdout.buffer.write(output + b"\n")
+            sys.stdout.flush()
 
     except Exception as e:
         logger.error("Search failed: %s", e)
         sys.exit(1)
 
 
+def handle_serve(args: argparse.Namespace) -> None:
+    """Handle serve command, answering JSON searches read line by line from stdin.
+
+    Handlers (and the models and connections they hold) are built once and
+    reused for every query, instead of once per search process.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    try:
+        coordinator = create_coordinator(args)
+    except Exception as e:
+        logger.error("Server startup failed: %s", e)
+        sys.exit(1)
+
+    logger.info("Serving searches from stdin, one JSON object per line")
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+
+        try:
+            search_data = load_json(line)
+            result = coordinator.search(
+                search_data.get("query", ""), search_data.get("context", {})
+            )
+        except Exception as e:
+            logger.error("Search failed: %s", e)
+            result = ProcessingResult(
+                success=False, message="Search processing failed", errors=[str(e)]
+            )
+
+        sys.stdout.buffer.write(dump_json(result.to_dict(), indent=False) + b"\n")
+        sys.stdout.flush()
+
+
 def handle_model_install(args: argparse.Namespace) -> None:
     """Handle model installation command.
 
@@ -192,15 +320,27 @@ def handle_status(args: argparse.Namespace) -> None:
         config = load_config(Path(args.config) if args.config else None)
         handlers = setup_handlers(config)
 
+        # Status probes are independent I/O, so they run in parallel
+        probed = {
+            name: handler
+            for name, handler in handlers.items()
+            if hasattr(handler, "get_status")
+        }
+        with ThreadPoolExecutor(max_workers=max(len(probed), 1)) as executor:
+            statuses = dict(
+                zip(
+                    probed,
+                    executor.map(lambda handler: handler.get_status(), probed.values()),
+                )
+            )
+
         print(f"=== {PLUGIN_NAME} v{VERSION} - Status ===\n")
 
-        for name, handler in handlers.items():
-            if hasattr(handler, "get_status"):
-                status = handler.get_status()
-                print(f"{name.upper()} Handler:")
-                for key, value in status.items():
-                    print(f"  {key}: {value}")
-                print()
+        for name, status in statuses.items():
+            print(f"{name.upper()} Handler:")
+            for key, value in status.items():
+                print(f"  {key}: {value}")
+            print()
 
     except Exception as e:
         logger.error("Status check failed: %s", e)
@@ -231,6 +371,13 @@ def create_parser() -> argparse.ArgumentParser:
         "--output-file", "-o", help="Output file for results (JSON)"
     )
 
+    # Long-running search command
+    subparsers.add_parser(
+        "serve",
+        help="Answer JSON searches ({'query': ..., 'context': ...}) read from "
+        "stdin, one per line, reusing loaded models",
+    )
+
     # Model management commands
     install_parser = subparsers.add_parser("install-models", help="Install AI models")
     install_parser.add_argument("--model-name", help="Specific model to install")
@@ -262,6 +409,8 @@ def main() -> None:
     # Route to appropriate handler
     if args.command == "search":
         handle_search(args)
+    elif args.command == "serve":
+        handle_serve(args)
     elif args.command == "install-models":
         handle_model_install(args)
     elif args.command == "list-models":
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """Setup and Installation Script for Sphinx AI Search."""
 
+import argparse
 import json
 import os
 import platform
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Where UnifiedModelConverter writes NNCF compressed embedding models
+COMPRESSED_MODELS_DIR = Path("SphinxAI/models/compressed")
+
+# NLTK corpora downloaded during setup
+NLTK_CORPORA = ("punkt", "stopwords", "wordnet", "averaged_perceptron_tagger")
+
 
 def check_python_version() -> bool:
     """Check if Python version is compatible."""
@@ -59,14 +67,20 @@ def install_python_packages():
         return False
 
     try:
-        # Upgrade pip first
-        subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--upgrade", "pip"], check=True
-        )
-
-        # Install packages
+        # Upgrade pip and install packages in one pip invocation
         subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)],
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--no-input",
+                "--disable-pip-version-check",
+                "--upgrade",
+                "pip",
+                "-r",
+                str(requirements_file),
+            ],
             check=True,
         )
 
@@ -78,42 +92,45 @@ def install_python_packages():
         return False
 
 
-def setup_nltk_data():
-    """Download required NLTK data"""
-    print("Setting up NLTK data...")
+def setup_nlp_assets():
+    """Download NLTK data and spaCy models concurrently"""
+    print("Setting up NLTK data and spaCy models...")
 
     try:
         import nltk
-
-        nltk.download("punkt", quiet=True)
-        nltk.download("stopwords", quiet=True)
-        nltk.download("wordnet", quiet=True)
-        nltk.download("averaged_perceptron_tagger", quiet=True)
-
-        print("✓ NLTK data downloaded successfully")
-        return True
-
-    except Exception as e:
+    except ImportError as e:
         print(f"Error setting up NLTK data: {e}")
         return False
 
-
-def setup_spacy_models():
-    """Download spaCy models"""
-    print("Setting up spaCy models...")
-
-    try:
-        # Download English model
-        subprocess.run(
-            [sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True
+    # Each asset is an independent network fetch, so they run in parallel
+    with ThreadPoolExecutor(max_workers=len(NLTK_CORPORA) + 1) as executor:
+        nltk_futures = [
+            executor.submit(nltk.download, corpus, quiet=True)
+            for corpus in NLTK_CORPORA
+        ]
+        spacy_future = executor.submit(
+            subprocess.run,
+            [sys.executable, "-m", "spacy", "download", "en_core_web_sm"],
+            check=True,
         )
 
-        print("✓ spaCy models downloaded successfully")
-        return True
+        success = True
+        try:
+            for future in nltk_futures:
+                future.result()
+            print("✓ NLTK data downloaded successfully")
+        except Exception as e:
+            print(f"Error setting up NLTK data: {e}")
+            success = False
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error downloading spaCy models: {e}")
-        return False
+        try:
+            spacy_future.result()
+            print("✓ spaCy models downloaded successfully")
+        except subprocess.CalledProcessError as e:
+            print(f"Error downloading spaCy models: {e}")
+            success = False
+
+    return success
 
 
 def create_config_file():
@@ -226,6 +243,13 @@ def setup_models() -> bool:
         else:
             print(f"✓ All {llm_total_count} LLM models converted successfully")
 
+        # Embedding models need NNCF for their INT8 compressed copies
+        compressed_models = converter.compressed_embedding_models()
+        if compressed_models:
+            print(f"✓ {len(compressed_models)} embedding models compressed with NNCF")
+        else:
+            print("⚠️ No NNCF compressed embedding models found")
+
         # Step 3: Cleanup to save space
         print("3. Cleaning up temporary files...")
         converter.cleanup_original_models()
@@ -248,28 +272,57 @@ def setup_models() -> bool:
         return False
 
 
-def test_installation():
-    """Test the installation"""
+# Modules compiled to C extensions by the optional --compile step; the
+# extension takes precedence over the .py file on import
+NATIVE_MODULES = ["SphinxAI/utils/text_processing.py"]
+
+
+def compile_native_extensions() -> bool:
+    """Compile hot text processing modules ahead of time with mypyc."""
+    print("Compiling native extensions...")
+
+    try:
+        import mypyc  # noqa: F401
+    except ImportError:
+        print("⚠️ mypyc not installed (pip install mypy), skipping compilation")
+        return True
+
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "mypyc", *NATIVE_MODULES],
+            cwd=Path(__file__).resolve().parent.parent,
+            check=True,
+        )
+        print("✓ Native extensions compiled")
+    except subprocess.CalledProcessError as e:
+        # The interpreted modules keep working, compilation is optional
+        print(f"⚠️ Native compilation failed, using pure Python modules: {e}")
+    return True
+
+
+def test_installation(full_test: bool = False):
+    """Test the installation
+
+    Args:
+        full_test: Also download a small embedding model and encode a sentence
+    """
     print("Testing installation...")
 
     try:
         # Test imports
         import nltk
         import numpy
-        import sentence_transformers
-        import sklearn
         import spacy
         import torch
         import transformers
-
-        # Test basic functionality
         from sentence_transformers import SentenceTransformer
 
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-
-        # Test encoding
-        sentences = ["This is a test sentence"]
-        embeddings = model.encode(sentences)
+        # Test basic functionality, which needs a model download
+        if full_test:
+            model = SentenceTransformer("all-MiniLM-L6-v2")
+            model.encode(
+                ["This is a test sentence"], batch_size=1, show_progress_bar=False
+            )
 
         print("✓ Installation test passed")
         return True
@@ -292,16 +345,32 @@ def print_next_steps():
     print("5. Configure plugin settings in SMF admin")
     print("6. Run initial indexing")
     print("\nFor detailed instructions, see the README.md file")
-    print("\n✅ OpenVINO models with NNCF compression are ready!")
-    print(
-        "- Compressed model available at: SphinxAI/models/compressed/compressed_model/"
+    compressed_models = sorted(
+        path.parent for path in COMPRESSED_MODELS_DIR.glob("*/openvino_model.xml")
     )
-    print("- Model is optimized for Polish language processing")
-    print("- Binary format for faster loading and inference")
+    if compressed_models:
+        print("\n✅ OpenVINO models with NNCF compression are ready!")
+        for path in compressed_models:
+            print(f"- Compressed model available at: {path}/")
+        print("- Model is optimized for Polish language processing")
+        print("- Binary format for faster loading and inference")
 
 
 def main():
     """Main setup function"""
+    parser = argparse.ArgumentParser(description="Sphinx AI Search Setup")
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile text processing modules with mypyc",
+    )
+    parser.add_argument(
+        "--full-test",
+        action="store_true",
+        help="Test the installation by encoding with a downloaded embedding model",
+    )
+    args = parser.parse_args()
+
     print("Sphinx AI Search Setup")
     print("=" * 30)
 
@@ -311,10 +380,7 @@ def main():
     if not install_python_packages():
         return 1
 
-    if not setup_nltk_data():
-        return 1
-
-    if not setup_spacy_models():
+    if not setup_nlp_assets():
         return 1
 
     if not create_config_file():
@@ -327,7 +393,10 @@ def main():
     if not setup_models():
         return 1
 
-    if not test_installation():
+    if args.compile and not compile_native_extensions():
+        return 1
+
+    if not test_installation(args.full_test):
         return 1
 
     print_next_steps()
@@ -7,13 +7,26 @@ specifically configured for Polish language search and indexing.
 Includes Polish-specific text processing and search optimization.
 """
 
-import configparser
 import logging
 import os
-from typing import Any, Dict, List, Optional
-
-from .core.constants import POLISH_DIACRITICS_MAP, POLISH_STOPWORDS
+import re
+import time
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .core.constants import (
+    INDEX_FIELDS_TTL,
+    POLISH_DIACRITICS_TRANS,
+    POLISH_STOPWORDS,
+    _load_cached_file,
+    _parse_ini_file,
+)
 from .utils.cache import SphinxAICache
+from .utils.connection_pool import ConnectionPool
+from .utils.text_processing import NORMALIZE_CACHE_MAX_LENGTH
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +42,128 @@ except ImportError:
     pymysql = None  # type: ignore
 
 
+_NON_ASCII_RUN = re.compile(r"[^\x00-\x7f]+")
+
+
+@lru_cache(maxsize=1024)
+def _fold_char(char: str) -> str:
+    """Strip diacritics from one character, keeping it if it does not fold."""
+    # NFKD splits a letter into base + combining mark and the ASCII encode
+    # drops the mark; other scripts, symbols and compatibility forms would be
+    # dropped or expanded, so they are kept as they are
+    folded = unicodedata.normalize("NFKD", char).encode("ascii", "ignore")
+    return folded.decode("ascii") if len(folded) == 1 else char
+
+
+def _fold_polish_diacritics(text: str) -> str:
+    """Strip diacritics from text, keeping it one character per character."""
+    if text.isascii():
+        return text
+
+    # The table covers Polish letters (including Ł, which does not
+    # decompose) in one C pass; anything left is folded per character
+    text = text.translate(POLISH_DIACRITICS_TRANS)
+    if text.isascii():
+        return text
+    return _NON_ASCII_RUN.sub(
+        lambda match: "".join(map(_fold_char, match.group())), text
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fold_polish_diacritics_cached(text: str) -> str:
+    """Memoized _fold_polish_diacritics for short texts."""
+    return _fold_polish_diacritics(text)
+
+
+def _preprocess_polish_query(query: str, filter_stopwords: bool = True) -> str:
+    """Build the Sphinx query from a Polish user query."""
+    # Convert to lowercase
+    processed_query = query.lower()
+
+    # Remove Polish stopwords, unless the index already skips them
+    if filter_stopwords:
+        words = processed_query.split()
+        filtered_words = [word for word in words if word not in POLISH_STOPWORDS]
+
+        # If all words were stopwords, return original query
+        if not filtered_words:
+            return query
+
+        # Rejoin words
+        processed_query = " ".join(filtered_words)
+
+    # Add diacritic-insensitive search variations
+    # This helps find results even with different diacritic usage
+    query_variations = [processed_query]
+
+    # Create variation without diacritics
+    normalized_query = _fold_polish_diacritics(processed_query)
+    if normalized_query != processed_query:
+        query_variations.append(normalized_query)
+
+    # Join variations with OR operator for Sphinx
+    return " | ".join(query_variations)
+
+
+@lru_cache(maxsize=4096)
+def _preprocess_polish_query_cached(query: str, filter_stopwords: bool = True) -> str:
+    """Memoized _preprocess_polish_query for short queries."""
+    return _preprocess_polish_query(query, filter_stopwords)
+
+
+# Fields detected per index, keyed by "host:port:index", as (monotonic time
+# of detection, fields, content_in_index); shared by all instances
+_INDEX_FIELDS_CACHE: Dict[str, Tuple[float, List[str], bool]] = {}
+
+# Identifier and query validation, compiled once at import
+_INDEX_NAME_RE = re.compile(r"^[a-zA-Z0-9_\.]+$")
+_FIELD_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_ALLOWED_INDEXES: FrozenSet[str] = frozenset(
+    {"sphinx_main", "sphinx_delta", "forum_posts", "smf_posts", "main", "delta"}
+)
+_ALLOWED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "id",
+        "topic_id",
+        "post_id",
+        "board_id",
+        "weight",
+        "content",
+        "body",
+        "message",
+        "subject",
+        "title",
+        "topic_title",
+        "poster_time",
+        "poster_name",
+        "board_name",
+    }
+)
+# Substring matches, so e.g. "selected" is rejected too; one scan for all
+_DANGEROUS_QUERY_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in (
+            ";",
+            "--",
+            "/*",
+            "*/",
+            "union",
+            "select",
+            "insert",
+            "update",
+            "delete",
+            "drop",
+            "create",
+            "alter",
+            "exec",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
 class SphinxIntegrationPolish:
     """
     Handles Sphinx search daemon integration with Polish language support.
@@ -48,9 +183,13 @@ class SphinxIntegrationPolish:
         self.searchd_host = "localhost"
         self.searchd_port = 9306  # Default Sphinx MySQL port
         self.index_name = "smf_polish_posts"
-        self.connection = None
+        # Idle connections reused across searches instead of one shared
+        # connection, so concurrent requests do not serialize on it
+        self._pool = ConnectionPool(self._connect)
         self.available_fields: List[str] = []  # Cache for detected fields
         self.content_in_index = False  # Flag for content availability
+        # Set when the index declares stopwords, so searchd skips them itself
+        self.server_side_stopwords = False
         self.cache = SphinxAICache()  # Initialize cache service
 
         # Load configuration
@@ -62,10 +201,9 @@ class SphinxIntegrationPolish:
     def _load_config(self) -> None:
         """Load Sphinx configuration."""
         try:
-            if os.path.exists(self.config_path):
-                config = configparser.ConfigParser()
-                config.read(self.config_path)
-
+            # Parsed once per file version and shared by all instances
+            config = _load_cached_file(Path(self.config_path), _parse_ini_file)
+            if config is not None:
                 # Extract searchd settings
                 if "searchd" in config:
                     listen = config["searchd"].get("listen", "localhost:9306")
@@ -76,9 +214,11 @@ class SphinxIntegrationPolish:
                         self.searchd_host = listen
 
                 # Extract index settings
-                if f"index {self.index_name}" in config:
-                    # Index configuration loaded
-                    pass
+                index_section = f"index {self.index_name}"
+                if index_section in config:
+                    self.server_side_stopwords = bool(
+                        config[index_section].get("stopwords", "").strip()
+                    )
 
         except Exception as e:
             logger.error(f"Error loading Sphinx config: {e}")
@@ -89,93 +229,156 @@ class SphinxIntegrationPolish:
         This determines whether we can get content directly from Sphinx
         or need to query SMF database.
         """
+        if self._load_cached_index_fields():
+            return
+
+        detected = False
         try:
-            connection = self._get_connection()
-            if not connection:
-                logger.warning("Cannot detect index fields - no Sphinx connection")
-                self.available_fields = ["id", "topic_id", "post_id", "board_id"]
-                self.content_in_index = False
-                return
-
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                # Validate index name first
-                if not self._validate_index_name(self.index_name):
-                    logger.error(f"Invalid index name: {self.index_name}")
+            with self._pooled_connection() as connection:
+                if not connection:
+                    logger.warning("Cannot detect index fields - no Sphinx connection")
                     self.available_fields = ["id", "topic_id", "post_id", "board_id"]
                     self.content_in_index = False
                     return
 
-                # Try to describe the index structure using safe queries
-                try:
-                    # Use parameterized approach with validated index name
-                    escaped_index = self._escape_identifier(self.index_name)
-                    describe_query = f"DESCRIBE {escaped_index}"
-                    cursor.execute(describe_query)
-                    fields_info = cursor.fetchall()
-                    self.available_fields = [field["Field"] for field in fields_info]
-                    logger.info(
-                        f"Detected Sphinx index fields: {self.available_fields}"
-                    )
-                except Exception:
-                    # If DESCRIBE doesn't work, try a sample query to detect fields
+                with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                    # Validate index name first
+                    if not self._validate_index_name(self.index_name):
+                        logger.error(f"Invalid index name: {self.index_name}")
+                        self.available_fields = [
+                            "id",
+                            "topic_id",
+                            "post_id",
+                            "board_id",
+                        ]
+                        self.content_in_index = False
+                        return
+
+                    # Try to describe the index structure using safe queries
                     try:
+                        # Use parameterized approach with validated index name
                         escaped_index = self._escape_identifier(self.index_name)
-                        sample_query = f"SELECT * FROM {escaped_index} LIMIT 1"
-                        cursor.execute(sample_query)
-                        sample_result = cursor.fetchone()
-                        if sample_result:
-                            self.available_fields = list(sample_result.keys())
-                            logger.info(
-                                f"Detected fields from sample query: {self.available_fields}"
-                            )
-                        else:
-                            # Empty index, assume minimal fields
+                        describe_query = f"DESCRIBE {escaped_index}"
+                        cursor.execute(describe_query)
+                        fields_info = cursor.fetchall()
+                        self.available_fields = [
+                            field["Field"] for field in fields_info
+                        ]
+                        detected = True
+                        logger.info(
+                            f"Detected Sphinx index fields: {self.available_fields}"
+                        )
+                    except Exception:
+                        # If DESCRIBE doesn't work, try a sample query to detect fields
+                        try:
+                            escaped_index = self._escape_identifier(self.index_name)
+                            sample_query = f"SELECT * FROM {escaped_index} LIMIT 1"
+                            cursor.execute(sample_query)
+                            sample_result = cursor.fetchone()
+                            if sample_result:
+                                self.available_fields = list(sample_result.keys())
+                                detected = True
+                                logger.info(
+                                    f"Detected fields from sample query: {self.available_fields}"
+                                )
+                            else:
+                                # Empty index, assume minimal fields
+                                self.available_fields = [
+                                    "id",
+                                    "topic_id",
+                                    "post_id",
+                                    "board_id",
+                                ]
+                                logger.warning(
+                                    "Empty index, assuming minimal field set"
+                                )
+                        except Exception:
+                            # Fallback to minimal field set
                             self.available_fields = [
                                 "id",
                                 "topic_id",
                                 "post_id",
                                 "board_id",
                             ]
-                            logger.warning("Empty index, assuming minimal field set")
-                    except Exception:
-                        # Fallback to minimal field set
-                        self.available_fields = [
-                            "id",
-                            "topic_id",
-                            "post_id",
-                            "board_id",
-                        ]
-                        logger.warning("Could not detect fields, using minimal set")
-
-                # Check if content fields are available
-                content_fields = ["content", "body", "message", "text"]
-                subject_fields = ["subject", "title", "topic_title"]
+                            logger.warning("Could not detect fields, using minimal set")
 
-                self.content_in_index = any(
-                    field in self.available_fields for field in content_fields
-                )
-                subject_in_index = any(
-                    field in self.available_fields for field in subject_fields
-                )
+                    # Check if content fields are available
+                    content_fields = ["content", "body", "message", "text"]
+                    subject_fields = ["subject", "title", "topic_title"]
 
-                if self.content_in_index:
-                    logger.info("✓ Content available in Sphinx index")
-                else:
-                    logger.info(
-                        "⚠ Content NOT in Sphinx index - will need SMF database queries"
+                    self.content_in_index = any(
+                        field in self.available_fields for field in content_fields
                     )
-
-                if subject_in_index:
-                    logger.info("✓ Subject/title available in Sphinx index")
-                else:
-                    logger.info(
-                        "⚠ Subject NOT in Sphinx index - will need SMF database queries"
+                    subject_in_index = any(
+                        field in self.available_fields for field in subject_fields
                     )
 
+                    if self.content_in_index:
+                        logger.info("✓ Content available in Sphinx index")
+                    else:
+                        logger.info(
+                            "⚠ Content NOT in Sphinx index - will need SMF database queries"
+                        )
+
+                    if subject_in_index:
+                        logger.info("✓ Subject/title available in Sphinx index")
+                    else:
+                        logger.info(
+                            "⚠ Subject NOT in Sphinx index - will need SMF database queries"
+                        )
+
         except Exception as e:
             logger.error(f"Error detecting index fields: {e}")
             self.available_fields = ["id", "topic_id", "post_id", "board_id"]
             self.content_in_index = False
+            return
+
+        # Fallback field sets are not cached, so detection is retried
+        if detected:
+            self._store_index_fields()
+
+    def _index_key(self) -> str:
+        """Identify the index across instances and processes."""
+        return f"{self.searchd_host}:{self.searchd_port}:{self.index_name}"
+
+    def _load_cached_index_fields(self) -> bool:
+        """
+        Load detected index fields from the process or shared cache.
+
+        Returns:
+            True if the fields were found in a cache
+        """
+        index_key = self._index_key()
+        cached = _INDEX_FIELDS_CACHE.get(index_key)
+        if cached is None or time.monotonic() - cached[0] >= INDEX_FIELDS_TTL:
+            shared = self.cache.get_cached_index_fields(index_key)
+            if not shared:
+                return False
+            cached = (
+                time.monotonic(),
+                list(shared["fields"]),
+                bool(shared["content_in_index"]),
+            )
+            _INDEX_FIELDS_CACHE[index_key] = cached
+
+        _, fields, content_in_index = cached
+        self.available_fields = list(fields)
+        self.content_in_index = content_in_index
+        logger.info(f"Using cached Sphinx index fields: {self.available_fields}")
+        return True
+
+    def _store_index_fields(self) -> None:
+        """Store detected index fields in the process and shared caches."""
+        index_key = self._index_key()
+        fields = list(self.available_fields)
+        _INDEX_FIELDS_CACHE[index_key] = (
+            time.monotonic(),
+            fields,
+            self.content_in_index,
+        )
+        self.cache.cache_index_fields(
+            index_key, fields, self.content_in_index, ttl=INDEX_FIELDS_TTL
+        )
 
     def preprocess_polish_query(self, query: str) -> str:
         """
@@ -189,32 +392,10 @@ class SphinxIntegrationPolish:
         """
         if not query:
             return ""
-
-        # Convert to lowercase
-        processed_query = query.lower()
-
-        # Remove Polish stopwords
-        words = processed_query.split()
-        filtered_words = [word for word in words if word not in POLISH_STOPWORDS]
-
-        # If all words were stopwords, return original query
-        if not filtered_words:
-            return query
-
-        # Rejoin words
-        processed_query = " ".join(filtered_words)
-
-        # Add diacritic-insensitive search variations
-        # This helps find results even with different diacritic usage
-        query_variations = [processed_query]
-
-        # Create variation without diacritics
-        normalized_query = self._normalize_polish_diacritics(processed_query)
-        if normalized_query != processed_query:
-            query_variations.append(normalized_query)
-
-        # Join variations with OR operator for Sphinx
-        return " | ".join(query_variations)
+        filter_stopwords = not self.server_side_stopwords
+        if len(query) <= NORMALIZE_CACHE_MAX_LENGTH:
+            return _preprocess_polish_query_cached(query, filter_stopwords)
+        return _preprocess_polish_query(query, filter_stopwords)
 
     def _normalize_polish_diacritics(self, text: str) -> str:
         """
@@ -226,25 +407,44 @@ class SphinxIntegrationPolish:
         Returns:
             Text with normalized diacritics
         """
-        for polish_char, normalized_char in POLISH_DIACRITICS_MAP.items():
-            text = text.replace(polish_char, normalized_char)
-        return text
+        if len(text) <= NORMALIZE_CACHE_MAX_LENGTH:
+            return _fold_polish_diacritics_cached(text)
+        return _fold_polish_diacritics(text)
+
+    def _connect(self) -> Any:
+        """Open a new MySQL connection to Sphinx."""
+        return pymysql.connect(
+            host=self.searchd_host, port=self.searchd_port, charset="utf8"
+        )
+
+    @contextmanager
+    def _pooled_connection(self) -> Iterator[Optional[Any]]:
+        """
+        Use a pooled MySQL connection to Sphinx for a with block.
 
-    def _get_connection(self) -> Optional[Any]:
-        """Get MySQL connection to Sphinx."""
+        Connections are discarded rather than reused when the block raises.
+
+        Yields:
+            Open connection, or None if Sphinx cannot be reached
+        """
         if not PYMYSQL_AVAILABLE or pymysql is None:
             logger.error("PyMySQL not available")
-            return None
+            yield None
+            return
 
         try:
-            if self.connection is None or not self.connection.open:
-                self.connection = pymysql.connect(
-                    host=self.searchd_host, port=self.searchd_port, charset="utf8"
-                )
-            return self.connection
+            connection = self._pool.acquire()
         except Exception as e:
             logger.error(f"Error connecting to Sphinx: {e}")
-            return None
+            yield None
+            return
+
+        try:
+            yield connection
+        except BaseException:
+            self._pool.discard(connection)
+            raise
+        self._pool.release(connection)
 
     def search_polish(self, query: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -308,112 +508,117 @@ class SphinxIntegrationPolish:
             logger.error("PyMySQL not available for search")
             return []
 
-        connection = self._get_connection()
-        if not connection:
-            return []
-
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                # Escape the query for Sphinx
-                escaped_query = query.replace("'", "\\'").replace('"', '\\"')
-
-                # Build field list based on what's available in the index
-                base_fields = ["id", "WEIGHT() as weight"]
-                optional_fields = []
-
-                # Add fields that exist in the index
-                if "topic_id" in self.available_fields:
-                    optional_fields.append("topic_id")
-                if "post_id" in self.available_fields:
-                    optional_fields.append("post_id")
-                if "board_id" in self.available_fields:
-                    optional_fields.append("board_id")
-
-                # Add content fields if available
-                if self.content_in_index:
-                    for field in ["content", "body", "message"]:
-                        if field in self.available_fields:
-                            optional_fields.append(field)
-                            break
-
-                    for field in ["subject", "title", "topic_title"]:
-                        if field in self.available_fields:
-                            optional_fields.append(field)
-                            break
-
-                all_fields = base_fields + optional_fields
-
-                # Validate and escape field names
-                safe_fields = []
-                for field in all_fields:
-                    if self._validate_field_name(field):
-                        safe_fields.append(self._escape_identifier(field))
-                    else:
-                        logger.warning(f"Skipping invalid field name: {field}")
-
-                if not safe_fields:
-                    safe_fields = ["id", "topic_id", "post_id", "board_id"]  # fallback
-
-                fields_str = ", ".join(safe_fields)
-                escaped_index = self._escape_identifier(self.index_name)
-
-                # Build Sphinx SQL query with parameterized MATCH clause
-                # Note: Sphinx MATCH uses special syntax, but we still validate the query
-                if not self._validate_search_query(escaped_query):
-                    raise ValueError("Invalid search query format")
-
-                sql = f"""
-                    SELECT {fields_str}
-                    FROM {escaped_index}
-                    WHERE MATCH(?)
-                    ORDER BY weight DESC
-                    LIMIT ?
-                """
-
-                logger.debug(f"Executing Sphinx query with fields: {fields_str}")
-                # Use parameters for MATCH and LIMIT values
-                cursor.execute(sql, (escaped_query, limit))
-                sphinx_results = cursor.fetchall()
-
-                # Convert to standard format
-                results: List[Dict[str, Any]] = []
-                for row in sphinx_results:
-                    result: Dict[str, Any] = {
-                        "id": row.get("id"),
-                        "topic_id": row.get("topic_id"),
-                        "post_id": row.get("post_id"),
-                        "board_id": row.get("board_id"),
-                        "weight": row.get("weight", 0),
-                        "content_in_index": self.content_in_index,
-                        "needs_content_fetch": not self.content_in_index,
-                        "attrs": {
-                            "topic_id": row.get("topic_id"),
-                            "post_id": row.get("post_id"),
-                            "board_id": row.get("board_id"),
-                        },
-                    }
+            with self._pooled_connection() as connection:
+                if not connection:
+                    return []
 
-                    # Add content fields if available in index
+                with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                    # Escape the query for Sphinx
+                    escaped_query = query.replace("'", "\\'").replace('"', '\\"')
+
+                    # Build field list based on what's available in the index
+                    base_fields = ["id", "WEIGHT() as weight"]
+                    optional_fields = []
+
+                    # Add fields that exist in the index
+                    if "topic_id" in self.available_fields:
+                        optional_fields.append("topic_id")
+                    if "post_id" in self.available_fields:
+                        optional_fields.append("post_id")
+                    if "board_id" in self.available_fields:
+                        optional_fields.append("board_id")
+
+                    # Add content fields if available
                     if self.content_in_index:
                         for field in ["content", "body", "message"]:
-                            if field in row:
-                                result["content"] = row[field]
+                            if field in self.available_fields:
+                                optional_fields.append(field)
                                 break
 
                         for field in ["subject", "title", "topic_title"]:
-                            if field in row:
-                                result["subject"] = row[field]
+                            if field in self.available_fields:
+                                optional_fields.append(field)
                                 break
 
-                    results.append(result)
+                    all_fields = base_fields + optional_fields
 
-                logger.info(f"Sphinx search returned {len(results)} results")
-                if results and not self.content_in_index:
-                    logger.info(
-                        "Results contain only IDs - content will need to be fetched from SMF database"
-                    )
+                    # Validate and escape field names
+                    safe_fields = []
+                    for field in all_fields:
+                        if self._validate_field_name(field):
+                            safe_fields.append(self._escape_identifier(field))
+                        else:
+                            logger.warning(f"Skipping invalid field name: {field}")
 
-                return results
+                    if not safe_fields:
+                        safe_fields = [
+                            "id",
+                            "topic_id",
+                            "post_id",
+                            "board_id",
+                        ]  # fallback
+
+                    fields_str = ", ".join(safe_fields)
+                    escaped_index = self._escape_identifier(self.index_name)
+
+                    # Build Sphinx SQL query with parameterized MATCH clause
+                    # Note: Sphinx MATCH uses special syntax, but we still validate the query
+                    if not self._validate_search_query(escaped_query):
+                        raise ValueError("Invalid search query format")
+
+                    sql = f"""
+                        SELECT {fields_str}
+                        FROM {escaped_index}
+                        WHERE MATCH(?)
+                        ORDER BY weight DESC
+                        LIMIT ?
+                    """
+
+                    logger.debug(f"Executing Sphinx query with fields: {fields_str}")
+                    # Use parameters for MATCH and LIMIT values
+                    cursor.execute(sql, (escaped_query, limit))
+                    sphinx_results = cursor.fetchall()
+
+                    # Convert to standard format
+                    results: List[Dict[str, Any]] = []
+                    for row in sphinx_results:
+                        result: Dict[str, Any] = {
+                            "id": row.get("id"),
+                            "topic_id": row.get("topic_id"),
+                            "post_id": row.get("post_id"),
+                            "board_id": row.get("board_id"),
+                            "weight": row.get("weight", 0),
+                            "content_in_index": self.content_in_index,
+                            "needs_content_fetch": not self.content_in_index,
+                            "attrs": {
+                                "topic_id": row.get("topic_id"),
+                                "post_id": row.get("post_id"),
+                                "board_id": row.get("board_id"),
+                            },
+                        }
+
+                        # Add content fields if available in index
+                        if self.content_in_index:
+                            for field in ["content", "body", "message"]:
+                                if field in row:
+                                    result["content"] = row[field]
+                                    break
+
+                            for field in ["subject", "title", "topic_title"]:
+                                if field in row:
+                                    result["subject"] = row[field]
+                                    break
+
+                        results.append(result)
+
+                    logger.info(f"Sphinx search returned {len(results)} results")
+                    if results and not self.content_in_index:
+                        logger.info(
+                            "Results contain only IDs - content will need to be fetched from SMF database"
+                        )
+
+                    return results
 
         except Exception as e:
             logger.error(f"Error executing Sphinx search: {e}")
@@ -607,37 +812,35 @@ searchd
         if not PYMYSQL_AVAILABLE:
             return {"status": "error", "message": "PyMySQL not available"}
 
-        connection = self._get_connection()
-        if not connection:
-            return {"status": "error", "message": "Cannot connect to Sphinx"}
-
         try:
-            if PYMYSQL_AVAILABLE and pymysql is not None:
-                with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                    cursor.execute("SHOW STATUS")
-                    status_rows = cursor.fetchall()
-
-                    status = {}
-                    for row in status_rows:
-                        status[row["Variable_name"]] = row["Value"]
-
-                    return {
-                        "status": "ok",
-                        "sphinx_status": status,
-                        "index_name": self.index_name,
-                    }
-            else:
-                return {"status": "error", "message": "PyMySQL not available"}
+            with self._pooled_connection() as connection:
+                if not connection:
+                    return {"status": "error", "message": "Cannot connect to Sphinx"}
+
+                if PYMYSQL_AVAILABLE and pymysql is not None:
+                    with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                        cursor.execute("SHOW STATUS")
+                        status_rows = cursor.fetchall()
+
+                        status = {}
+                        for row in status_rows:
+                            status[row["Variable_name"]] = row["Value"]
+
+                        return {
+                            "status": "ok",
+                            "sphinx_status": status,
+                            "index_name": self.index_name,
+                        }
+                else:
+                    return {"status": "error", "message": "PyMySQL not available"}
 
         except Exception as e:
             logger.error(f"Error getting Sphinx status: {e}")
             return {"status": "error", "message": str(e)}
 
     def close(self) -> None:
-        """Close Sphinx connection."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close all pooled Sphinx connections."""
+        self._pool.close_all()
 
     def _validate_index_name(self, index_name: str) -> bool:
         """
@@ -649,22 +852,12 @@ searchd
         Returns:
             True if valid, False otherwise
         """
-        import re
-
         # Allow only alphanumeric characters, underscores, and dots
-        if not re.match(r"^[a-zA-Z0-9_\.]+$", index_name):
+        if not _INDEX_NAME_RE.match(index_name):
             return False
 
         # Check against whitelist of allowed index names
-        allowed_indexes = [
-            "sphinx_main",
-            "sphinx_delta",
-            "forum_posts",
-            "smf_posts",
-            "main",
-            "delta",
-        ]
-        return index_name in allowed_indexes or index_name.startswith("sphinx_")
+        return index_name in _ALLOWED_INDEXES or index_name.startswith("sphinx_")
 
     def _escape_identifier(self, identifier: str) -> str:
         """
@@ -690,30 +883,12 @@ searchd
         Returns:
             True if valid, False otherwise
         """
-        import re
-
         # Allow only alphanumeric characters and underscores
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", field_name):
+        if not _FIELD_NAME_RE.match(field_name):
             return False
 
         # Check against whitelist of known safe fields
-        allowed_fields = [
-            "id",
-            "topic_id",
-            "post_id",
-            "board_id",
-            "weight",
-            "content",
-            "body",
-            "message",
-            "subject",
-            "title",
-            "topic_title",
-            "poster_time",
-            "poster_name",
-            "board_name",
-        ]
-        return field_name in allowed_fields
+        return field_name in _ALLOWED_FIELDS
 
     def _validate_search_query(self, query: str) -> bool:
         """
@@ -729,29 +904,13 @@ searchd
             return False
 
         # Check for basic SQL injection attempts
-        dangerous_patterns = [
-            ";",
-            "--",
-            "/*",
-            "*/",
-            "union",
-            "select",
-            "insert",
-            "update",
-            "delete",
-            "drop",
-            "create",
-            "alter",
-            "exec",
-        ]
-
-        query_lower = query.lower()
-        for pattern in dangerous_patterns:
-            if pattern in query_lower:
-                logger.warning(
-                    f"Potentially dangerous pattern '{pattern}' detected in query"
-                )
-                return False
+        match = _DANGEROUS_QUERY_RE.search(query)
+        if match:
+            logger.warning(
+                f"Potentially dangerous pattern '{match.group(0).lower()}' "
+                "detected in query"
+            )
+            return False
 
         # Limit query length
         if len(query) > 1000:
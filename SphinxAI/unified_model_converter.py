@@ -10,13 +10,14 @@ and LLM models to their respective OpenVINO formats:
 
 import argparse
 import configparser
+import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import torch
@@ -24,6 +25,14 @@ from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# NNCF settings for INT4 LLM weights recommended by OpenVINO GenAI: groups
+# of 128 weights share a scale, 80% of layers go to INT4 and the rest INT8
+INT4_GROUP_SIZE = 128
+INT4_RATIO = 0.8
+# Subdirectory of a GenAI model holding its INT8 weight copy; must match
+# core.constants.GENAI_INT8_SUBDIR, where GenAIHandler looks for it
+GENAI_INT8_SUBDIR = "int8"
+
 
 class UnifiedModelConverter:
     """Unified converter for both embedding and LLM models."""
@@ -183,6 +192,7 @@ class UnifiedModelConverter:
                 ov_model.save_pretrained(output_path / "openvino_ir")
 
                 logger.info(f"✅ Embedding model {model_key} converted successfully")
+                self._compress_embedding_model(model_key, ov_model)
                 return True
 
             except ImportError:
@@ -195,6 +205,43 @@ class UnifiedModelConverter:
             logger.error(f"❌ Failed to convert embedding model {model_key}: {e}")
             return False
 
+    def _compress_embedding_model(self, model_key: str, ov_model: Any) -> bool:
+        """
+        Write an NNCF INT8 weight-compressed copy of an embedding model.
+
+        Args:
+            model_key: Key from embedding_models dict
+            ov_model: Exported OVModelForFeatureExtraction
+
+        Returns:
+            True if successful
+        """
+        try:
+            import nncf
+        except ImportError:
+            logger.warning("NNCF not available, skipping embedding compression")
+            return False
+
+        output_path = self.output_dir / "compressed" / model_key
+        try:
+            ov_model.model = nncf.compress_weights(
+                ov_model.model, mode=nncf.CompressWeightsMode.INT8_ASYM
+            )
+            ov_model.save_pretrained(output_path)
+        except Exception as e:
+            logger.error(f"❌ Failed to compress embedding model {model_key}: {e}")
+            return False
+
+        logger.info(f"✅ Embedding model {model_key} compressed to INT8: {output_path}")
+        return True
+
+    def compressed_embedding_models(self) -> List[Path]:
+        """List embedding models with an NNCF compressed copy on disk."""
+        return sorted(
+            path.parent
+            for path in (self.output_dir / "compressed").glob("*/openvino_model.xml")
+        )
+
     def convert_llm_model(
         self, model_key: str, trust_remote_code: bool = True, force: bool = False
     ) -> bool:
@@ -242,8 +289,12 @@ class UnifiedModelConverter:
                 model_name,
                 "--weight-format",
                 weight_format,
-                str(output_path),
             ]
+            if weight_format == "int4":
+                cmd.extend(
+                    ["--group-size", str(INT4_GROUP_SIZE), "--ratio", str(INT4_RATIO)]
+                )
+            cmd.append(str(output_path))
 
             if trust_remote_code:
                 cmd.append("--trust-remote-code")
@@ -274,6 +325,53 @@ class UnifiedModelConverter:
             logger.error(f"❌ Failed to convert LLM model {model_key}: {e}")
             return False
 
+    def compress_llm_model(self, model_path: str, force: bool = False) -> bool:
+        """
+        Write an INT8 weight-compressed copy of an uncompressed GenAI model.
+
+        Models converted by convert_llm_model already have int4/int8 weights;
+        this is for models exported without a weight format. GenAIHandler
+        runs the copy when quantize_llm is enabled.
+
+        Args:
+            model_path: Exported OpenVINO GenAI model directory
+            force: Recreate the copy even if it exists
+
+        Returns:
+            True if successful or nothing needed compressing
+        """
+        source_path = Path(model_path)
+        try:
+            with open(source_path / "openvino_config.json", encoding="utf-8") as f:
+                if json.load(f).get("quantization_config"):
+                    logger.info(f"LLM model weights already compressed: {model_path}")
+                    return True
+        except (OSError, ValueError):
+            pass
+
+        int8_path = source_path / GENAI_INT8_SUBDIR
+        if (int8_path / "openvino_model.xml").exists() and not force:
+            logger.info(f"INT8 copy already exists: {int8_path}")
+            return True
+
+        try:
+            from optimum.intel import OVModelForCausalLM
+
+            logger.info(f"Compressing LLM model weights to INT8: {int8_path}")
+            model = OVModelForCausalLM.from_pretrained(source_path, load_in_8bit=True)
+            model.save_pretrained(int8_path)
+            # Tokenizer models and configs are needed next to the weights
+            for path in source_path.iterdir():
+                if path.is_file() and not (int8_path / path.name).exists():
+                    shutil.copy2(path, int8_path / path.name)
+        except Exception as e:
+            logger.error(f"❌ Failed to compress LLM model {model_path}: {e}")
+            shutil.rmtree(int8_path, ignore_errors=True)
+            return False
+
+        logger.info(f"✅ LLM model compressed to INT8: {int8_path}")
+        return True
+
     def _verify_genai_conversion(self, output_path: Path) -> bool:
         """Verify GenAI model conversion."""
         required_files = ["openvino_model.xml", "openvino_model.bin"]
@@ -332,6 +430,11 @@ def main():
     parser.add_argument("--output-dir", default="models", help="Output directory")
     parser.add_argument("--embedding-model", help="Convert specific embedding model")
     parser.add_argument("--llm-model", help="Convert specific LLM model")
+    parser.add_argument(
+        "--compress-llm",
+        metavar="MODEL_DIR",
+        help="Create INT8 weight copy of an uncompressed GenAI model",
+    )
     parser.add_argument(
         "--all-embeddings", action="store_true", help="Convert all embedding models"
     )
@@ -372,6 +475,9 @@ def main():
     if args.llm_model:
         success &= converter.convert_llm_model(args.llm_model, force=args.force)
 
+    if args.compress_llm:
+        success &= converter.compress_llm_model(args.compress_llm, args.force)
+
     if args.all_embeddings or args.all:
         results = converter.convert_all_embedding_models(args.force)
         success &= all(results.values())
@@ -387,6 +493,7 @@ def main():
         [
             args.embedding_model,
             args.llm_model,
+            args.compress_llm,
             args.all_embeddings,
             args.all_llms,
             args.all,
@@ -48,6 +48,7 @@ class SphinxAICache:
         "stats": "stats:",
         "suggestions": "suggestions:",
         "embeddings": "embeddings:",
+        "index": "index:",
     }
 
     def __init__(self, config_path: Optional[str] = None):
@@ -258,6 +259,84 @@ class SphinxAICache:
             self.logger.error(f"Failed to retrieve cached search results: {e}")
             return None
 
+    def cache_search_response(
+        self,
+        query: str,
+        options: Dict[str, Any],
+        response: Dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        Cache complete search API response
+
+        Args:
+            query: Search query
+            options: Search options of the request
+            response: API response dictionary
+            ttl: Time to live in seconds, defaults to the response_ttl setting
+
+        Returns:
+            bool: Success status
+        """
+        if not self.is_available():
+            return False
+
+        cache_key = self._get_response_cache_key(query, options)
+
+        try:
+            ttl = ttl or self.config.get("response_ttl", 300)
+            return self.redis_client.setex(  # type: ignore
+                cache_key, ttl, json.dumps(response, ensure_ascii=False, default=str)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to cache search response: {e}")
+            return False
+
+    def get_cached_search_response(
+        self, query: str, options: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached search API response
+
+        Args:
+            query: Search query
+            options: Search options of the request
+
+        Returns:
+            Optional[Dict]: Cached response or None if not found
+        """
+        if not self.is_available():
+            return None
+
+        cache_key = self._get_response_cache_key(query, options)
+
+        try:
+            cached = self.redis_client.get(cache_key)  # type: ignore
+            if cached is None:
+                self.record_cache_miss()
+                return None
+
+            self.record_cache_hit()
+            return json.loads(cached)  # type: ignore
+
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.error(f"Failed to retrieve cached search response: {e}")
+            return None
+
+    def _get_response_cache_key(self, query: str, options: Dict[str, Any]) -> str:
+        """Generate cache key for a search API request"""
+        key_data = json.dumps(
+            {
+                "query": query,
+                "options": options,
+                "version": self._get_search_version(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        key_hash = hashlib.blake2b(key_data.encode("utf-8"), digest_size=16)
+        return f"{self.config['prefix']}{self.KEY_PREFIXES['search']}{key_hash.hexdigest()}"
+
     def cache_embeddings(
         self,
         text: str,
@@ -382,6 +461,67 @@ class SphinxAICache:
             self.logger.error(f"Failed to retrieve cached model metadata: {e}")
             return None
 
+    def cache_index_fields(
+        self,
+        index_key: str,
+        fields: List[str],
+        content_in_index: bool,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        Cache fields detected in a Sphinx index
+
+        Args:
+            index_key: Sphinx host, port and index name identifying the index
+            fields: Field names available in the index
+            content_in_index: Whether post content is stored in the index
+            ttl: Time to live in seconds
+
+        Returns:
+            bool: Success status
+        """
+        if not self.is_available():
+            return False
+
+        cache_key = self._get_cache_key("index", index_key)
+        ttl = ttl or 3600  # 1 hour for index metadata
+
+        try:
+            return self.redis_client.setex(  # type: ignore
+                cache_key,
+                ttl,
+                json.dumps({"fields": fields, "content_in_index": content_in_index}),
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to cache index fields: {e}")
+            return False
+
+    def get_cached_index_fields(self, index_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve fields detected in a Sphinx index
+
+        Args:
+            index_key: Sphinx host, port and index name identifying the index
+
+        Returns:
+            Optional[Dict]: Cached fields and content_in_index, or None if not found
+        """
+        if not self.is_available():
+            return None
+
+        cache_key = self._get_cache_key("index", index_key)
+
+        try:
+            cached = self.redis_client.get(cache_key)  # type: ignore
+            if cached is None:
+                return None
+
+            return json.loads(cached)  # type: ignore
+
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.error(f"Failed to retrieve cached index fields: {e}")
+            return None
+
     def update_search_stats(
         self, query: str, result_count: int, response_time: float
     ) -> bool:
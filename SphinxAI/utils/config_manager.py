@@ -73,6 +73,7 @@ class ConfigManager:
             "database": cache_section.getint("database", 0),
             "prefix": cache_section.get("prefix", "sphinxai:"),
             "ttl": cache_section.getint("ttl", 3600),
+            "response_ttl": cache_section.getint("response_ttl", 300),
         }
 
         # Handle password
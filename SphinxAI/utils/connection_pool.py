@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Connection pooling for the Sphinx MySQL-protocol handlers.
+
+Opening a connection to searchd costs a TCP handshake and a MySQL protocol
+handshake, which for short full-text queries is a large part of the request
+time. ConnectionPool keeps a bounded number of idle connections for reuse;
+connections are created on demand, so concurrent requests never wait for
+one another.
+
+searchd and MySQL close connections left idle past client_timeout or
+wait_timeout, which the client only notices on the next query. Connections
+idle for longer than ping_after seconds are therefore pinged before reuse.
+"""
+
+import logging
+import queue
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """Bounded pool of idle, reusable DB-API connections."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_idle: int = 8,
+        ping_after: float = 30.0,
+    ):
+        """
+        Initialize connection pool.
+
+        Args:
+            factory: Function opening a new connection
+            max_idle: Maximum number of idle connections kept open
+            ping_after: Seconds a connection may be idle before it is pinged
+        """
+        self._factory = factory
+        self._ping_after = ping_after
+        # Most recently used first, so rarely needed connections can time out.
+        # Entries are (connection, monotonic time it was released).
+        self._idle: "queue.LifoQueue[Tuple[Any, float]]" = queue.LifoQueue(
+            maxsize=max_idle
+        )
+
+    def acquire(self) -> Any:
+        """
+        Check out an idle connection, opening a new one if none is usable.
+
+        Returns:
+            Open connection
+        """
+        while True:
+            try:
+                connection, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self._factory()
+
+            if getattr(connection, "open", True) and self._is_alive(
+                connection, time.monotonic() - released_at
+            ):
+                return connection
+            self.discard(connection)
+
+    def _is_alive(self, connection: Any, idle_for: float) -> bool:
+        """
+        Check an idle connection was not closed by the server.
+
+        Args:
+            connection: Idle connection
+            idle_for: Seconds since the connection was released
+
+        Returns:
+            False if the connection should be discarded
+        """
+        if idle_for < self._ping_after or not hasattr(connection, "ping"):
+            return True
+
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.debug(f"Discarding stale pooled connection: {e}")
+            return False
+
+    def release(self, connection: Any) -> None:
+        """
+        Return a connection to the pool, closing it when the pool is full.
+
+        Args:
+            connection: Connection from acquire()
+        """
+        if not getattr(connection, "open", True):
+            return
+
+        try:
+            self._idle.put_nowait((connection, time.monotonic()))
+        except queue.Full:
+            self.discard(connection)
+
+    def discard(self, connection: Any) -> None:
+        """
+        Close a connection instead of returning it to the pool.
+
+        Args:
+            connection: Connection from acquire()
+        """
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Use a pooled connection for the duration of a with block.
+
+        Connections are discarded rather than reused when the block raises,
+        as they may be left mid-result or broken.
+
+        Yields:
+            Open connection
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            self.discard(connection)
+            raise
+        self.release(connection)
+
+    def close_all(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self.discard(self._idle.get_nowait()[0])
+            except queue.Empty:
+                return
+
+    def __len__(self) -> int:
+        return self._idle.qsize()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Embedding storage utilities for the Sphinx AI Search system.
+
+Content embeddings are stored as symmetric per-row int8 vectors with a
+float32 scale, which quarters the memory moved during similarity search
+compared to float32 storage. EmbeddingDiskCache keeps float32 embeddings
+on disk keyed by content hash, so unchanged posts are not re-encoded.
+"""
+
+import base64
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+# Largest magnitude representable by symmetric int8 quantization
+INT8_MAX = 127
+
+
+def quantize_int8(
+    embeddings: NDArray[np.float32],
+) -> Tuple[NDArray[np.int8], NDArray[np.float32]]:
+    """
+    Quantize embeddings to int8 with per-row max-abs calibration.
+
+    Args:
+        embeddings: Float embeddings, a single vector or one row per item
+
+    Returns:
+        Tuple of (quantized rows, per-row scales) such that
+        ``quantized * scales[:, None]`` approximates the input
+    """
+    rows = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    scales = np.abs(rows).max(axis=1) / INT8_MAX
+    # All-zero rows quantize to zeros with any non-zero scale
+    scales[scales == 0] = 1.0
+    quantized = np.rint(rows / scales[:, None]).astype(np.int8)
+    return np.ascontiguousarray(quantized), scales.astype(np.float32)
+
+
+def embeddings_to_bytes(embeddings: NDArray[np.float32]) -> bytes:
+    """
+    Pack embeddings as raw float16 bytes.
+
+    Args:
+        embeddings: Float embeddings, a single vector or one row per item
+
+    Returns:
+        Row-major float16 bytes, half the size of float32 storage
+    """
+    return np.ascontiguousarray(embeddings, dtype=np.float16).tobytes()
+
+
+def encode_embedding_b64(embedding: NDArray[np.float32]) -> Dict[str, Any]:
+    """
+    Encode an embedding for JSON transport as base64 float16 bytes.
+
+    Args:
+        embedding: Float embedding vector
+
+    Returns:
+        Dictionary with the base64 payload (``embedding_b16``) and ``dim``
+    """
+    vector = np.ravel(embedding)
+    return {
+        "embedding_b16": base64.b64encode(embeddings_to_bytes(vector)).decode("ascii"),
+        "dim": int(vector.shape[0]),
+    }
+
+
+def decode_embedding_b64(encoded: Dict[str, Any]) -> NDArray[np.float16]:
+    """
+    Decode an embedding produced by encode_embedding_b64.
+
+    Args:
+        encoded: Dictionary from encode_embedding_b64
+
+    Returns:
+        Read-only float16 view of the decoded bytes
+    """
+    vector = np.frombuffer(base64.b64decode(encoded["embedding_b16"]), dtype=np.float16)
+    if vector.shape[0] != encoded["dim"]:
+        raise ValueError(
+            f"Embedding has {vector.shape[0]} values, expected {encoded['dim']}"
+        )
+    return vector
+
+
+def pack_int8_embedding(quantized: NDArray[np.int8], scale: float) -> Dict[str, Any]:
+    """
+    Pack one quantized embedding row for storage in a result dictionary.
+
+    The row is base64-encoded like encode_embedding_b64, so result
+    dictionaries stay JSON serializable.
+
+    Args:
+        quantized: Quantized row from quantize_int8
+        scale: Scale of the row from quantize_int8
+
+    Returns:
+        Dictionary with the base64 int8 bytes (``q``) and the scale (``s``)
+    """
+    raw = np.ascontiguousarray(quantized, dtype=np.int8).tobytes()
+    return {"q": base64.b64encode(raw).decode("ascii"), "s": float(scale)}
+
+
+def unpack_int8_embeddings(
+    packed: List[Dict[str, Any]],
+) -> Tuple[NDArray[np.int8], NDArray[np.float32]]:
+    """
+    Stack embeddings packed with pack_int8_embedding without dequantizing.
+
+    Args:
+        packed: Packed embeddings of equal dimension
+
+    Returns:
+        Tuple of (quantized rows, per-row scales) for int8_similarity
+    """
+    if not packed:
+        return np.empty((0, 0), dtype=np.int8), np.empty(0, dtype=np.float32)
+
+    raw = b"".join(base64.b64decode(entry["q"]) for entry in packed)
+    quantized = np.frombuffer(raw, dtype=np.int8)
+    scales = np.array([entry["s"] for entry in packed], dtype=np.float32)
+    return quantized.reshape(len(packed), -1), scales
+
+
+def dequantize_int8(
+    quantized: NDArray[np.int8], scales: NDArray[np.float32]
+) -> NDArray[np.float32]:
+    """
+    Reconstruct float embeddings from int8 rows.
+
+    Args:
+        quantized: Quantized rows from quantize_int8
+        scales: Per-row scales from quantize_int8
+
+    Returns:
+        Approximate float32 embeddings, one row per item
+    """
+    rows = np.atleast_2d(quantized).astype(np.float32)
+    return rows * np.asarray(scales, dtype=np.float32).reshape(-1, 1)
+
+
+def int8_similarity(
+    query_embedding: NDArray[np.float32],
+    content_embeddings: NDArray[np.int8],
+    content_scales: NDArray[np.float32],
+) -> NDArray[np.float32]:
+    """
+    Calculate dot-product similarity against int8 content embeddings.
+
+    The query is quantized the same way as the content, products are
+    accumulated in int32 and rescaled by the outer product of the scales.
+
+    Args:
+        query_embedding: Float query embedding
+        content_embeddings: Quantized content rows from quantize_int8
+        content_scales: Per-row scales from quantize_int8
+
+    Returns:
+        Similarity scores, one per content row
+    """
+    query_q, query_scale = quantize_int8(np.ravel(query_embedding))
+    dots = np.einsum("ij,j->i", content_embeddings, query_q[0], dtype=np.int32)
+    return (dots * (content_scales * query_scale[0])).astype(np.float32)
+
+
+class EmbeddingDiskCache:
+    """
+    Content-hash keyed embedding store backed by a memory-mapped file.
+
+    Embeddings are appended as float32 rows to ``embeddings.f32``; the
+    ``index.txt`` sidecar holds the dimension on its first line followed by
+    the content hash of each row, one per line, so writes only append.
+    """
+
+    DATA_FILE = "embeddings.f32"
+    INDEX_FILE = "index.txt"
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize embedding disk cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.data_path = self.cache_dir / self.DATA_FILE
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self.dimension: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._data: Optional[NDArray[np.float32]] = None
+        # _lock guards _rows/_data for readers; _write_lock serializes writers
+        # so file I/O happens without blocking lookups
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def content_key(text: str) -> str:
+        """Get cache key for (normalized) content text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, keys: List[str]) -> List[Optional[NDArray[np.float32]]]:
+        """
+        Look up embeddings for content keys.
+
+        Args:
+            keys: Content keys from content_key
+
+        Returns:
+            Embedding for each key, or None for cache misses
+        """
+        hits: List[Optional[NDArray[np.float32]]] = []
+        with self._lock:
+            data = self._data
+            for key in keys:
+                row = self._rows.get(key)
+                hits.append(None if row is None or data is None else data[row])
+        return hits
+
+    def put_many(self, keys: List[str], embeddings: NDArray[np.float32]) -> None:
+        """
+        Store embeddings for content keys.
+
+        Args:
+            keys: Content keys from content_key
+            embeddings: Embeddings, one row per key
+        """
+        rows = np.ascontiguousarray(np.atleast_2d(embeddings), dtype=np.float32)
+        with self._write_lock:
+            if self.dimension is not None and rows.shape[1] != self.dimension:
+                logger.warning(
+                    f"Embedding dimension {rows.shape[1]} does not match cache "
+                    f"dimension {self.dimension}, not caching"
+                )
+                return
+
+            new_keys: Dict[str, int] = {}
+            for position, key in enumerate(keys):
+                if key not in self._rows and key not in new_keys:
+                    new_keys[key] = position
+            if not new_keys:
+                return
+
+            # Start new files when the cache is empty so rows left behind by
+            # an inconsistent cache are discarded
+            fresh = not self._rows
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.data_path, "wb" if fresh else "ab") as f:
+                    f.write(rows[list(new_keys.values())].tobytes())
+                self._append_index(list(new_keys), rows.shape[1], fresh)
+                data = self._map_data(len(self._rows) + len(new_keys), rows.shape[1])
+            except OSError as e:
+                logger.error(f"Failed to write embedding cache: {e}")
+                return
+
+            # Publish rows and the larger mapping together
+            with self._lock:
+                self.dimension = rows.shape[1]
+                for key in new_keys:
+                    self._rows[key] = len(self._rows)
+                self._data = data
+
+    def _load(self) -> None:
+        """Load index sidecar and map existing embeddings."""
+        if not self.index_path.exists() or not self.data_path.exists():
+            return
+
+        try:
+            lines = self.index_path.read_text(encoding="utf-8").splitlines()
+            dimension = int(lines[0])
+            keys = lines[1:]
+            if self.data_path.stat().st_size != len(keys) * dimension * 4:
+                logger.warning("Embedding cache is inconsistent, starting empty")
+                return
+
+            self._data = self._map_data(len(keys), dimension)
+            self._rows = {key: row for row, key in enumerate(keys)}
+            self.dimension = dimension
+            logger.info(f"Embedding cache loaded: {len(self._rows)} entries")
+        except (OSError, ValueError, IndexError) as e:
+            logger.warning(f"Failed to load embedding cache: {e}")
+            self._rows = {}
+            self._data = None
+            self.dimension = None
+
+    def _map_data(self, count: int, dimension: int) -> Optional[NDArray[np.float32]]:
+        """Memory-map the first count rows of the embeddings file."""
+        if not count:
+            return None
+
+        return np.memmap(
+            self.data_path, dtype=np.float32, mode="r", shape=(count, dimension)
+        )
+
+    def _append_index(self, keys: List[str], dimension: int, fresh: bool) -> None:
+        """Append keys to the index sidecar, starting a new one if fresh."""
+        with open(self.index_path, "w" if fresh else "a", encoding="utf-8") as f:
+            if fresh:
+                f.write(f"{dimension}\n")
+            f.write("".join(f"{key}\n" for key in keys))
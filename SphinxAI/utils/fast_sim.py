@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Fast similarity scoring and top-k selection over cached embeddings.
+
+Cached embeddings are L2-normalized float32 rows, so cosine similarity is a
+plain dot product. With Numba installed, scoring and top-k selection are
+fused in one JIT-compiled pass over the matrix with rows scored in
+parallel; otherwise a NumPy matvec with argpartition is used.
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core.interfaces import _as_contig_f32
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None  # type: ignore
+
+
+if NUMBA_AVAILABLE:
+
+    # No "ninf"/"nnan" fast-math flags: top-k slots start at -inf
+    @numba.njit(cache=True, parallel=True, fastmath={"reassoc", "contract"})
+    def _cosine_topk_numba(query, matrix, k):
+        rows, dim = matrix.shape
+        scores = np.empty(rows, dtype=np.float32)
+        for i in numba.prange(rows):
+            acc = np.float32(0.0)
+            for j in range(dim):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+
+        # Single pass keeping the k best scores sorted in descending order
+        top_indices = np.full(k, -1, dtype=np.int32)
+        top_scores = np.full(k, -np.inf, dtype=np.float32)
+        for i in range(rows):
+            score = scores[i]
+            if not score > top_scores[k - 1]:
+                continue
+            pos = k - 1
+            while pos > 0 and top_scores[pos - 1] < score:
+                top_scores[pos] = top_scores[pos - 1]
+                top_indices[pos] = top_indices[pos - 1]
+                pos -= 1
+            top_scores[pos] = score
+            top_indices[pos] = i
+        return top_indices, top_scores
+
+
+def cosine_topk(
+    query_embedding: NDArray[np.float32], embeddings: NDArray[np.float32], k: int
+) -> Tuple[NDArray[np.int32], NDArray[np.float32]]:
+    """
+    Find the k embeddings most similar to the query.
+
+    Args:
+        query_embedding: L2-normalized query embedding
+        embeddings: L2-normalized embeddings, one row per item
+        k: Number of results
+
+    Returns:
+        Tuple of (row indices, similarities), most similar first
+    """
+    query = _as_contig_f32(np.ravel(query_embedding))
+    matrix = _as_contig_f32(np.atleast_2d(embeddings))
+    k = min(k, matrix.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+    if NUMBA_AVAILABLE:
+        try:
+            indices, scores = _cosine_topk_numba(query, matrix, k)
+            # NaN scores never enter the top-k slots
+            valid = indices >= 0
+            return indices[valid], scores[valid]
+        except Exception as e:
+            logger.warning(f"Numba similarity kernel failed, using NumPy: {e}")
+
+    scores = matrix @ query
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    ranked = candidates[np.argsort(scores[candidates])[::-1]]
+    return ranked.astype(np.int32), scores[ranked]
+
+
+def warmup() -> None:
+    """Compile the Numba kernel ahead of the first query."""
+    if not NUMBA_AVAILABLE:
+        return
+
+    try:
+        cosine_topk(np.ones(2, dtype=np.float32), np.eye(2, dtype=np.float32), 1)
+    except Exception as e:
+        logger.warning(f"Failed to warm up similarity kernel: {e}")
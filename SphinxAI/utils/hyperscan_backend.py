@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Optional Hyperscan backend for forum content cleaning.
+
+This module compiles the forum noise patterns (BBCode, HTML tags, URLs and
+e-mail addresses) into a single Hyperscan database, so all of them are
+located in one scan over the text by a multi-pattern automaton. Callers
+fall back to COMBINED_NOISE_REGEX when Hyperscan is not installed or the
+scan fails.
+
+Patterns are compiled in UCP mode, so \s and \w cover Unicode as in re.
+Hyperscan does not support \b in that mode, and without it \b treats Polish
+letters as word boundaries, so patterns using \b (e-mail addresses) are
+matched with re instead and their spans merged in.
+"""
+
+import logging
+import re
+import threading
+from typing import Any, List, Optional, Tuple
+
+from ..core.constants import NOISE_PATTERN_NAMES, REGEX_PATTERNS
+
+logger = logging.getLogger(__name__)
+
+# Noise patterns scanned by Hyperscan, and those relying on \b left to re
+HYPERSCAN_PATTERN_NAMES: Tuple[str, ...] = tuple(
+    name for name in NOISE_PATTERN_NAMES if r"\b" not in REGEX_PATTERNS[name]
+)
+_WORD_BOUNDARY_NOISE_REGEX: Optional["re.Pattern[str]"] = (
+    re.compile(
+        "|".join(
+            f"(?:{REGEX_PATTERNS[name]})"
+            for name in NOISE_PATTERN_NAMES
+            if name not in HYPERSCAN_PATTERN_NAMES
+        )
+    )
+    if len(HYPERSCAN_PATTERN_NAMES) < len(NOISE_PATTERN_NAMES)
+    else None
+)
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None  # type: ignore
+
+
+class _NoiseDatabase:
+    """Lazily compiled Hyperscan database with per-thread scratch space."""
+
+    _database: Optional[Any] = None
+    _failed = False
+    _local = threading.local()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> Optional[Any]:
+        """Get compiled database, or None if Hyperscan cannot be used."""
+        if cls._database is None and not cls._failed and HYPERSCAN_AVAILABLE:
+            with cls._lock:
+                if cls._database is None and not cls._failed:
+                    cls._database = cls._compile()
+                    cls._failed = cls._database is None
+        return cls._database
+
+    @classmethod
+    def scratch(cls, database: Any) -> Any:
+        """Get scratch space for the current thread."""
+        scratch = getattr(cls._local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(database)
+            cls._local.scratch = scratch
+        return scratch
+
+    @staticmethod
+    def _compile() -> Optional[Any]:
+        """Compile the \\b-free noise patterns into one block-mode database."""
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[
+                    REGEX_PATTERNS[name].encode("utf-8")
+                    for name in HYPERSCAN_PATTERN_NAMES
+                ],
+                ids=list(range(len(HYPERSCAN_PATTERN_NAMES))),
+                elements=len(HYPERSCAN_PATTERN_NAMES),
+                flags=(
+                    hyperscan.HS_FLAG_SOM_LEFTMOST
+                    | hyperscan.HS_FLAG_UTF8
+                    | hyperscan.HS_FLAG_UCP
+                ),
+            )
+            logger.info("Hyperscan noise pattern database compiled")
+            return database
+        except Exception as e:
+            logger.warning(f"Hyperscan compilation failed, using re fallback: {e}")
+            return None
+
+
+def is_available() -> bool:
+    """Check if the Hyperscan backend can be used."""
+    return _NoiseDatabase.get() is not None
+
+
+def strip_noise(text: str) -> Optional[str]:
+    """
+    Remove BBCode, HTML tags, URLs and e-mails in a single scan.
+
+    Args:
+        text: Raw forum content
+
+    Returns:
+        Text with all noise spans removed, or None if the backend is unavailable
+    """
+    database = _NoiseDatabase.get()
+    if database is None:
+        return None
+
+    data = text.encode("utf-8")
+    spans: List[Tuple[int, int]] = []
+
+    def on_match(
+        pattern_id: int, start: int, end: int, flags: int, context: Any
+    ) -> None:
+        spans.append((start, end))
+
+    try:
+        database.scan(
+            data,
+            match_event_handler=on_match,
+            scratch=_NoiseDatabase.scratch(database),
+        )
+    except Exception as e:
+        logger.error(f"Hyperscan scan failed: {e}")
+        return None
+
+    if _WORD_BOUNDARY_NOISE_REGEX is not None:
+        spans.extend(_byte_spans(text, _WORD_BOUNDARY_NOISE_REGEX))
+
+    if not spans:
+        return text
+
+    # Hyperscan reports every match; merge overlapping spans and cut them out
+    spans.sort()
+    cleaned = bytearray()
+    position = 0
+    for start, end in spans:
+        if start > position:
+            cleaned += data[position:start]
+        position = max(position, end)
+    cleaned += data[position:]
+
+    return cleaned.decode("utf-8", errors="ignore")
+
+
+def _byte_spans(text: str, pattern: "re.Pattern[str]") -> List[Tuple[int, int]]:
+    """Find pattern matches in text as UTF-8 byte offsets."""
+    matches = [match.span() for match in pattern.finditer(text)]
+    if not matches or text.isascii():
+        return matches
+
+    def to_bytes(position: int) -> int:
+        return len(text[:position].encode("utf-8"))
+
+    return [(to_bytes(start), to_bytes(end)) for start, end in matches]
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+In-process semantic caches for search responses and generated summaries.
+
+SemanticCache lookups go through two tiers: an exact LRU keyed by a hash of
+the normalized query and search options, then a semantic tier that returns
+the cached result of a near-duplicate query when the cosine similarity of the
+query embeddings exceeds a threshold. GenerativeCache answers compound
+queries by combining cached summaries of several related queries.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .fast_sim import cosine_topk
+
+logger = logging.getLogger(__name__)
+
+# Embedding function, e.g. AIHandler.generate_embeddings
+Embedder = Callable[[List[str]], Optional[NDArray[np.float32]]]
+
+
+class _CacheEntry:
+    """Cached value with the context needed for semantic matching."""
+
+    __slots__ = ("namespace", "embedding", "value", "expires_at")
+
+    def __init__(
+        self,
+        namespace: Hashable,
+        embedding: Optional[NDArray[np.float32]],
+        value: Any,
+        expires_at: float,
+    ):
+        self.namespace = namespace
+        self.embedding = embedding
+        self.value = value
+        self.expires_at = expires_at
+
+
+class SemanticCache:
+    """Two-tier (exact + semantic) LRU cache with TTL expiry."""
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        similarity_threshold: float = 0.85,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embedder: Function returning L2-normalized query embeddings;
+                the semantic tier is disabled when None
+            max_entries: Maximum number of cached entries
+            ttl: Entry lifetime in seconds
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.embedder = embedder
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, NDArray[np.float32]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query: str, namespace: Hashable) -> str:
+        """
+        Build exact-tier key for a query.
+
+        Args:
+            query: Search query
+            namespace: Options that must match for a hit (search type, etc.)
+
+        Returns:
+            Hex digest of the normalized query and namespace
+        """
+        # Diacritics are kept: folding would make e.g. "łoś" and "los" collide
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha1(f"{namespace!r}|{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, query: str, namespace: Hashable = None) -> Optional[Any]:
+        """
+        Look up cached value for a query in both tiers.
+
+        Args:
+            query: Search query
+            namespace: Options that must match for a hit
+
+        Returns:
+            Copy of the cached value, or None on miss
+        """
+        value = self.get_exact(query, namespace)
+        if value is None:
+            value = self.get_similar(query, namespace)
+        return value
+
+    def get_exact(self, query: str, namespace: Hashable = None) -> Optional[Any]:
+        """
+        Look up cached value for a query in the exact tier only.
+
+        Cheap enough to run before any other work; a miss is not counted
+        until get_similar() misses too.
+
+        Args:
+            query: Search query
+            namespace: Options that must match for a hit
+
+        Returns:
+            Copy of the cached value, or None on miss
+        """
+        key = self.make_key(query, namespace)
+
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry.value)
+
+    def can_match_similar(self, namespace: Hashable = None) -> bool:
+        """
+        Check whether get_similar() would embed the query.
+
+        Args:
+            namespace: Options that must match for a hit
+
+        Returns:
+            True if an embedder is set and an entry in namespace has an
+            embedding to compare against
+        """
+        if self.embedder is None:
+            return False
+        with self._lock:
+            return any(
+                candidate.namespace == namespace and candidate.embedding is not None
+                for candidate in self._entries.values()
+            )
+
+    def get_similar(self, query: str, namespace: Hashable = None) -> Optional[Any]:
+        """
+        Look up cached value of a near-duplicate query (semantic tier).
+
+        Args:
+            query: Search query
+            namespace: Options that must match for a hit
+
+        Returns:
+            Copy of the cached value, or None on miss
+        """
+        if not self.can_match_similar(namespace):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        embedding = self._embed(self.make_key(query, namespace), query)
+        if embedding is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            match = self._find_similar(embedding, namespace)
+            if match is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(match[0])
+            self.semantic_hits += 1
+            logger.debug(f"Semantic cache hit (similarity {match[2]:.3f})")
+            return copy.deepcopy(match[1].value)
+
+    def set(self, query: str, value: Any, namespace: Hashable = None) -> None:
+        """
+        Store value for a query.
+
+        Args:
+            query: Search query
+            value: Value to cache
+            namespace: Options that must match for a hit
+        """
+        key = self.make_key(query, namespace)
+        embedding = self._embed(key, query) if self.embedder is not None else None
+
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                namespace, embedding, copy.deepcopy(value), time.monotonic() + self.ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, key: str, query: str) -> Optional[NDArray[np.float32]]:
+        """Get query embedding, reusing the one computed for a recent lookup."""
+        with self._lock:
+            embedding = self._embeddings.get(key)
+        if embedding is not None:
+            return embedding
+
+        try:
+            embeddings = self.embedder([query]) if self.embedder else None
+        except Exception as e:
+            logger.warning(f"Failed to embed query for semantic cache: {e}")
+            return None
+        if embeddings is None or len(embeddings) == 0:
+            return None
+
+        embedding = np.ascontiguousarray(embeddings[0], dtype=np.float32)
+        with self._lock:
+            self._embeddings[key] = embedding
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+        return embedding
+
+    def _find_similar(
+        self, embedding: NDArray[np.float32], namespace: Hashable
+    ) -> Optional[Tuple[str, _CacheEntry, float]]:
+        """Find the most similar cached entry above the threshold."""
+        candidates = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.namespace == namespace and entry.embedding is not None
+        ]
+        if not candidates:
+            return None
+
+        matrix = np.stack([entry.embedding for _, entry in candidates])
+        indices, similarities = cosine_topk(embedding, matrix, 1)
+        if len(indices) == 0 or similarities[0] <= self.similarity_threshold:
+            return None
+
+        key, entry = candidates[int(indices[0])]
+        return key, entry, float(similarities[0])
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries past their TTL."""
+        expired = [
+            key for key, entry in self._entries.items() if entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+
+
+class GenerativeCache:
+    """
+    Generative cache combining cached summaries of related queries.
+
+    A lookup hits when the cached queries similar to the new one (each above
+    ``single_threshold``) together reach ``combined_threshold``; their
+    summaries are then merged instead of generating a new one. Storing a
+    query that duplicates a cached one (above ``duplicate_threshold``)
+    replaces its summary, so a repeated query never adds up with itself.
+    """
+
+    MERGED_SUMMARY_PREFIX = "Na podstawie podobnych wyszukiwań: "
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        single_threshold: float = 0.6,
+        combined_threshold: float = 1.2,
+        duplicate_threshold: float = 0.98,
+        max_merged: int = 3,
+    ):
+        """
+        Initialize generative cache.
+
+        Args:
+            embedder: Function returning L2-normalized query embeddings
+            max_entries: Maximum number of cached summaries
+            ttl: Summary lifetime in seconds
+            single_threshold: Minimum similarity of a contributing entry
+            combined_threshold: Minimum summed similarity for a hit
+            duplicate_threshold: Minimum similarity for a stored query to
+                replace a cached one instead of adding an entry
+            max_merged: Maximum number of summaries merged into a response
+        """
+        self.embedder = embedder
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.single_threshold = single_threshold
+        self.combined_threshold = combined_threshold
+        self.duplicate_threshold = duplicate_threshold
+        self.max_merged = max_merged
+        self._summaries: List[str] = []
+        self._expires_at: List[float] = []
+        self._embeddings: Optional[NDArray[np.float32]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, query: str) -> Optional[NDArray[np.float32]]:
+        """
+        Embed query for lookup and storage.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Query embedding, or None if embedding failed
+        """
+        try:
+            embeddings = self.embedder([query])
+        except Exception as e:
+            logger.warning(f"Failed to embed query for generative cache: {e}")
+            return None
+        if embeddings is None or len(embeddings) == 0:
+            return None
+        return np.ascontiguousarray(embeddings[0], dtype=np.float32)
+
+    def lookup(self, query_embedding: NDArray[np.float32]) -> Optional[str]:
+        """
+        Synthesize summary from cached summaries of related queries.
+
+        Args:
+            query_embedding: Embedding from embed()
+
+        Returns:
+            Merged summary, or None on miss
+        """
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            if self._embeddings is None:
+                self.misses += 1
+                return None
+
+            similarities = self._embeddings @ query_embedding
+            related = np.flatnonzero(similarities > self.single_threshold)
+            related_scores = similarities[related]
+            if related_scores.sum() <= self.combined_threshold:
+                self.misses += 1
+                return None
+
+            # Select the most similar entries without sorting all of them
+            if len(related) > self.max_merged:
+                best = np.argpartition(related_scores, -self.max_merged)
+                best = best[-self.max_merged :]
+                related, related_scores = related[best], related_scores[best]
+
+            # Most similar first
+            ranked = related[np.argsort(related_scores)[::-1]]
+            summaries = [self._summaries[i] for i in ranked]
+            self.hits += 1
+
+        return self.MERGED_SUMMARY_PREFIX + " ".join(summaries)
+
+    def set(self, query_embedding: NDArray[np.float32], summary: str) -> None:
+        """
+        Store generated summary for a query.
+
+        Args:
+            query_embedding: Embedding from embed()
+            summary: Generated summary
+        """
+        row = np.ascontiguousarray(query_embedding, dtype=np.float32)
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+
+            if self._embeddings is not None:
+                similarities = self._embeddings @ row
+                duplicate = int(np.argmax(similarities))
+                if similarities[duplicate] >= self.duplicate_threshold:
+                    # Same query: refresh its entry rather than adding one
+                    self._embeddings[duplicate] = row
+                    self._summaries[duplicate] = summary
+                    self._expires_at[duplicate] = now + self.ttl
+                    return
+
+            if self._embeddings is None:
+                self._embeddings = row[np.newaxis, :]
+            else:
+                self._embeddings = np.concatenate(
+                    [self._embeddings, row[np.newaxis, :]]
+                )
+            self._summaries.append(summary)
+            self._expires_at.append(now + self.ttl)
+
+            # Drop the oldest entries beyond capacity
+            overflow = len(self._summaries) - self.max_entries
+            if overflow > 0:
+                self._keep(list(range(overflow, len(self._summaries))))
+
+    def clear(self) -> None:
+        """Remove all cached summaries."""
+        with self._lock:
+            self._summaries = []
+            self._expires_at = []
+            self._embeddings = None
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop summaries past their TTL."""
+        kept = [i for i, expires_at in enumerate(self._expires_at) if expires_at > now]
+        if len(kept) < len(self._summaries):
+            self._keep(kept)
+
+    def _keep(self, kept: List[int]) -> None:
+        """Keep only the entries at the given positions, in order."""
+        self._summaries = [self._summaries[i] for i in kept]
+        self._expires_at = [self._expires_at[i] for i in kept]
+        if self._embeddings is not None and kept:
+            self._embeddings = self._embeddings[kept]
+        else:
+            self._embeddings = None
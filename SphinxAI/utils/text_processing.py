@@ -8,17 +8,36 @@ stopword removal, diacritics normalization, and text cleaning.
 
 import logging
 import re
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, List, Mapping, Optional
+
+import numpy as np
+from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
+# Optional single-pass cleaning backend
+try:
+    from . import hyperscan_backend
+except ImportError:
+    hyperscan_backend = None  # type: ignore
+
 # Import constants from core module
 try:
-    from ..core.constants import POLISH_DIACRITICS_MAP, POLISH_STOPWORDS, REGEX_PATTERNS
+    from ..core.constants import (
+        COMBINED_NOISE_REGEX,
+        COMPILED_REGEX_PATTERNS,
+        POLISH_CHARS,
+        POLISH_DIACRITICS_BYTES_MAP,
+        POLISH_DIACRITICS_TRANS,
+        POLISH_STOPWORDS,
+    )
 except ImportError:
     # Fallback if core module is not available
-    POLISH_STOPWORDS = set()
-    POLISH_DIACRITICS_MAP = {}
+    POLISH_STOPWORDS = frozenset()
+    POLISH_DIACRITICS_TRANS = {}
+    POLISH_CHARS = frozenset("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ")
+    POLISH_DIACRITICS_BYTES_MAP = {}
     REGEX_PATTERNS = {
         "url": r'https?://[^\s<>"{}|\\^`[\]]+',
         "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
@@ -27,12 +46,28 @@ except ImportError:
         "whitespace": r"\s+",
         "non_alphanum": r"[^\w\s]",
     }
+    COMPILED_REGEX_PATTERNS = {
+        name: re.compile(pattern) for name, pattern in REGEX_PATTERNS.items()
+    }
+    COMBINED_NOISE_REGEX = re.compile(
+        "|".join(
+            f"(?:{REGEX_PATTERNS[name]})"
+            for name in ("bbcode", "html_tags", "url", "email")
+        )
+    )
+
+
+# Single-pass matcher for the 2-byte UTF-8 sequences of Polish letters
+_POLISH_DIACRITICS_BYTES_PATTERN = re.compile(
+    b"|".join(re.escape(sequence) for sequence in POLISH_DIACRITICS_BYTES_MAP)
+    or b"(?!)"
+)
 
 
 class PolishTextProcessor:
     """Polish text processing utilities following Single Responsibility Principle."""
 
-    def __init__(self, stopwords: Optional[Set[str]] = None):
+    def __init__(self, stopwords: Optional[AbstractSet[str]] = None):
         """
         Initialize text processor.
 
@@ -40,16 +75,24 @@ class PolishTextProcessor:
             stopwords: Custom stopwords set, uses default if None
         """
         self.stopwords = stopwords or POLISH_STOPWORDS
+        # Stopwords as they appear in preprocess_text output (lowercase,
+        # diacritics folded), so normalized text needs no per-word lower()
+        self.normalized_stopwords: FrozenSet[str] = frozenset(
+            self.normalize_diacritics(word.lower()) for word in self.stopwords
+        ) | frozenset(word.lower() for word in self.stopwords)
+        self._vocabulary: Optional[Mapping[str, int]] = None
+        self._stopword_ids: Optional[NDArray[np.int32]] = None
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns for better performance."""
-        self.url_pattern = re.compile(REGEX_PATTERNS["url"])
-        self.email_pattern = re.compile(REGEX_PATTERNS["email"])
-        self.bbcode_pattern = re.compile(REGEX_PATTERNS["bbcode"])
-        self.html_pattern = re.compile(REGEX_PATTERNS["html_tags"])
-        self.whitespace_pattern = re.compile(REGEX_PATTERNS["whitespace"])
-        self.non_alphanum_pattern = re.compile(REGEX_PATTERNS["non_alphanum"])
+        """Bind the module-level precompiled regex patterns."""
+        self.url_pattern = COMPILED_REGEX_PATTERNS["url"]
+        self.email_pattern = COMPILED_REGEX_PATTERNS["email"]
+        self.bbcode_pattern = COMPILED_REGEX_PATTERNS["bbcode"]
+        self.html_pattern = COMPILED_REGEX_PATTERNS["html_tags"]
+        self.noise_pattern = COMBINED_NOISE_REGEX
+        self.whitespace_pattern = COMPILED_REGEX_PATTERNS["whitespace"]
+        self.non_alphanum_pattern = COMPILED_REGEX_PATTERNS["non_alphanum"]
 
     def normalize_diacritics(self, text: str) -> str:
         """
@@ -64,11 +107,7 @@ class PolishTextProcessor:
         if not text:
             return ""
 
-        result = text
-        for polish_char, latin_char in POLISH_DIACRITICS_MAP.items():
-            result = result.replace(polish_char, latin_char)
-
-        return result
+        return text.translate(POLISH_DIACRITICS_TRANS)
 
     def remove_stopwords(self, words: List[str]) -> List[str]:
         """
@@ -82,6 +121,78 @@ class PolishTextProcessor:
         """
         return [word for word in words if word.lower() not in self.stopwords]
 
+    def remove_stopwords_normalized(self, text: str) -> str:
+        """
+        Remove stopwords from text already passed through preprocess_text.
+
+        Args:
+            text: Normalized text (lowercase, diacritics folded)
+
+        Returns:
+            Text without stopwords, words separated by single spaces
+        """
+        stopwords = self.normalized_stopwords
+        return " ".join([word for word in text.split() if word not in stopwords])
+
+    def tokenize_normalized(self, text: str) -> List[str]:
+        """
+        Normalize text and split it into words without stopwords.
+
+        Produces the words of remove_stopwords_normalized(preprocess_text(text))
+        with one noise-stripping pass and no intermediate whitespace
+        collapsing, as split() already handles runs of whitespace.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Normalized words without stopwords
+        """
+        if not text:
+            return []
+
+        stopwords = self.normalized_stopwords
+        words = self.normalize_diacritics(self._strip_noise(text)).lower().split()
+        return [word for word in words if word not in stopwords]
+
+    def set_vocabulary(self, vocabulary: Mapping[str, int]) -> None:
+        """
+        Set tokenizer vocabulary used to map stopwords to token ids.
+
+        Args:
+            vocabulary: Token to id mapping of the active tokenizer
+        """
+        self._vocabulary = vocabulary
+        self._stopword_ids = None
+
+    @property
+    def stopword_ids(self) -> NDArray[np.int32]:
+        """Sorted token ids of stopwords, built lazily from the vocabulary."""
+        if self._stopword_ids is None:
+            vocabulary = self._vocabulary or {}
+            # Word-initial tokens carry a SentencePiece or byte-level BPE marker
+            ids = {
+                vocabulary[token]
+                for word in self.stopwords
+                for token in (word, f"\u2581{word}", f"\u0120{word}")
+                if token in vocabulary
+            }
+            self._stopword_ids = np.array(sorted(ids), dtype=np.int32)
+        return self._stopword_ids
+
+    def remove_stopword_ids(self, ids: NDArray[np.int32]) -> NDArray[np.int32]:
+        """
+        Remove stopword token ids from a tokenized text.
+
+        Args:
+            ids: Token ids
+
+        Returns:
+            Token ids without stopwords
+        """
+        ids = np.asarray(ids)
+        return ids[np.isin(ids, self.stopword_ids, invert=True)]
+
     def clean_forum_content(self, text: str) -> str:
         """
         Clean forum content by removing BBCode, HTML, URLs, etc.
@@ -95,21 +206,21 @@ class PolishTextProcessor:
         if not text:
             return ""
 
-        # Remove BBCode
-        text = self.bbcode_pattern.sub("", text)
-
-        # Remove HTML tags
-        text = self.html_pattern.sub("", text)
-
-        # Remove URLs and emails
-        text = self.url_pattern.sub("", text)
-        text = self.email_pattern.sub("", text)
-
         # Normalize whitespace
-        text = self.whitespace_pattern.sub(" ", text)
+        text = self.whitespace_pattern.sub(" ", self._strip_noise(text))
 
         return text.strip()
 
+    def _strip_noise(self, text: str) -> str:
+        """Remove BBCode, HTML tags, URLs and e-mails."""
+        # Single Hyperscan pass when available
+        stripped = hyperscan_backend.strip_noise(text) if hyperscan_backend else None
+        if stripped is not None:
+            return stripped
+
+        # Remove BBCode, HTML tags, URLs and emails in one pass
+        return self.noise_pattern.sub("", text)
+
     def preprocess_text(self, text: str, normalize_diacritics: bool = True) -> str:
         """
         Complete text preprocessing pipeline.
@@ -270,7 +381,9 @@ class TextChunker:
         return end
 
 
-def create_text_processor(stopwords: Optional[Set[str]] = None) -> PolishTextProcessor:
+def create_text_processor(
+    stopwords: Optional[AbstractSet[str]] = None,
+) -> PolishTextProcessor:
     """
     Factory function to create text processor instance.
 
@@ -318,6 +431,18 @@ def get_default_processor() -> PolishTextProcessor:
     return _DefaultProcessor.get_instance()
 
 
+# Longest text memoized by normalize_polish_text; queries repeat across
+# requests, while long post bodies are rarely normalized twice
+NORMALIZE_CACHE_MAX_LENGTH = 256
+
+
+@lru_cache(maxsize=4096)
+def _normalize_polish_text_cached(text: str) -> str:
+    """Memoized normalize_polish_text for short texts."""
+    processor = get_default_processor()
+    return processor.preprocess_text(text, normalize_diacritics=True)
+
+
 def normalize_polish_text(text: str) -> str:
     """
     Normalize Polish text using default processor.
@@ -328,6 +453,9 @@ def normalize_polish_text(text: str) -> str:
     Returns:
         Normalized text
     """
+    if text and len(text) <= NORMALIZE_CACHE_MAX_LENGTH:
+        return _normalize_polish_text_cached(text)
+
     processor = get_default_processor()
     return processor.preprocess_text(text, normalize_diacritics=True)
 
@@ -346,6 +474,72 @@ def remove_stopwords(words: List[str]) -> List[str]:
     return processor.remove_stopwords(words)
 
 
+def remove_stopwords_normalized(text: str) -> str:
+    """
+    Remove Polish stopwords from normalized text.
+
+    Args:
+        text: Output of normalize_polish_text
+
+    Returns:
+        Text without stopwords
+    """
+    processor = get_default_processor()
+    return processor.remove_stopwords_normalized(text)
+
+
+def tokenize_normalized(text: str) -> List[str]:
+    """
+    Normalize raw text and split it into words without stopwords.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized words without stopwords
+    """
+    processor = get_default_processor()
+    return processor.tokenize_normalized(text)
+
+
+@lru_cache(maxsize=16384)
+def _clean_cached(text: str) -> str:
+    """Memoized clean_for_embedding for short texts."""
+    return " ".join(get_default_processor().tokenize_normalized(text))
+
+
+def clean_for_embedding(text: str) -> str:
+    """
+    Normalize raw text and drop stopwords, e.g. before embedding.
+
+    Short texts such as queries are memoized like in normalize_polish_text.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized words without stopwords, separated by single spaces
+    """
+    if text and len(text) <= NORMALIZE_CACHE_MAX_LENGTH:
+        return _clean_cached(text)
+
+    return " ".join(get_default_processor().tokenize_normalized(text))
+
+
+def clean_for_embedding_many(texts: List[str]) -> List[str]:
+    """
+    Clean a batch of texts for embedding, processing each distinct text once.
+
+    Args:
+        texts: Raw texts
+
+    Returns:
+        Cleaned texts, in input order
+    """
+    cleaned = {text: clean_for_embedding(text) for text in dict.fromkeys(texts)}
+    return [cleaned[text] for text in texts]
+
+
 def clean_forum_content(text: str) -> str:
     """
     Clean forum content by removing BBCode, HTML, URLs, etc.
@@ -358,3 +552,37 @@ def clean_forum_content(text: str) -> str:
     """
     processor = get_default_processor()
     return processor.clean_forum_content(text)
+
+
+def has_polish_chars(text: str) -> bool:
+    """
+    Check if text contains Polish diacritic characters.
+
+    Args:
+        text: Input text
+
+    Returns:
+        True if any Polish diacritic character is present
+    """
+    return not POLISH_CHARS.isdisjoint(text)
+
+
+def normalize_diacritics_fast(text_bytes: bytes) -> bytes:
+    """
+    Normalize Polish diacritics in UTF-8 encoded text without decoding.
+
+    ASCII-only input is returned as is after a C-level check; otherwise the
+    Polish letter sequences are replaced in one pass over the bytes.
+
+    Args:
+        text_bytes: UTF-8 encoded text
+
+    Returns:
+        UTF-8 encoded text with normalized characters
+    """
+    if text_bytes.isascii():
+        return text_bytes
+
+    return _POLISH_DIACRITICS_BYTES_PATTERN.sub(
+        lambda match: POLISH_DIACRITICS_BYTES_MAP[match.group()], text_bytes
+    )
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Top-k selection helpers for ranking search results.
+
+Selecting the k best of N results with a bounded heap costs O(N log k)
+instead of the O(N log N) of a full sort, and keeps only k items alive.
+"""
+
+import heapq
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def topk(items: Iterable[T], k: int, key: Callable[[T], float]) -> List[T]:
+    """
+    Select the k items with the highest key, best first.
+
+    Items with equal keys keep their input order, matching
+    ``sorted(items, key=key, reverse=True)[:k]``.
+
+    Args:
+        items: Items to rank
+        k: Number of items to return
+        key: Function returning the ranking score of an item
+
+    Returns:
+        Up to k items in descending key order
+    """
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, items, key=key)
@@ -186,6 +186,40 @@ class TestSphinxAICache:
 
         assert result is False
 
+    def test_search_response_roundtrip(self):
+        """Test search responses are cached under one key per request"""
+        from .conftest import setup_mock_cache_with_redis
+
+        cache, mock_redis_client = setup_mock_cache_with_redis()
+        response = {"success": True, "data": {"query": "nóż"}, "errors": []}
+
+        assert cache.cache_search_response("nóż", {"type": "hybrid"}, response)
+        key, ttl, payload = mock_redis_client.setex.call_args[0]
+        mock_redis_client.get.return_value = payload
+
+        assert ttl == 300
+        assert key.startswith("test_search:")
+        assert cache.get_cached_search_response("nóż", {"type": "hybrid"}) == response
+        mock_redis_client.get.assert_called_once_with(key)
+
+    def test_index_fields_roundtrip(self):
+        """Test detected Sphinx index fields are cached per index"""
+        from .conftest import setup_mock_cache_with_redis
+
+        cache, mock_redis_client = setup_mock_cache_with_redis()
+        fields = ["id", "subject", "content"]
+
+        assert cache.cache_index_fields("localhost:9306:smf_posts", fields, True)
+        key, ttl, payload = mock_redis_client.setex.call_args[0]
+        mock_redis_client.get.return_value = payload
+
+        assert ttl == 3600
+        assert cache.get_cached_index_fields("localhost:9306:smf_posts") == {
+            "fields": fields,
+            "content_in_index": True,
+        }
+        mock_redis_client.get.assert_called_once_with(key)
+
     def test_get_cached_search_results_hit(self):
         """Test successful cache hit for search results"""
         cached_data = {
@@ -0,0 +1,69 @@
+"""
+Unit tests for SphinxAI connection pooling
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.utils.connection_pool import ConnectionPool
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool class"""
+
+    def test_connections_are_reused(self):
+        """Test released connections are handed out again instead of reopened"""
+        factory = Mock(side_effect=lambda: Mock(open=True))
+        pool = ConnectionPool(factory, max_idle=1)
+
+        with pool.connection() as first:
+            with pool.connection() as second:
+                assert first is not second
+        with pool.connection() as reused:
+            assert reused is second
+
+        assert factory.call_count == 2
+        first.close.assert_called_once()
+        assert len(pool) == 1
+
+    def test_broken_connections_are_discarded(self):
+        """Test connections are not reused after an error or once closed"""
+        factory = Mock(side_effect=lambda: Mock(open=True))
+        pool = ConnectionPool(factory)
+
+        with pytest.raises(RuntimeError):
+            with pool.connection() as failed:
+                raise RuntimeError("lost connection")
+        failed.close.assert_called_once()
+        assert len(pool) == 0
+
+        stale = pool.acquire()
+        pool.release(stale)
+        stale.open = False
+
+        assert pool.acquire() is not stale
+        assert factory.call_count == 3
+
+    def test_stale_connections_are_replaced(self):
+        """Test idle connections closed by the server are not handed out"""
+        factory = Mock(side_effect=lambda: Mock(open=True))
+        pool = ConnectionPool(factory, ping_after=0)
+
+        stale = pool.acquire()
+        pool.release(stale)
+        stale.ping.side_effect = ConnectionError("server has gone away")
+
+        fresh = pool.acquire()
+        assert fresh is not stale
+        stale.ping.assert_called_once_with(reconnect=False)
+        stale.close.assert_called_once()
+
+        pool.release(fresh)
+        assert pool.acquire() is fresh
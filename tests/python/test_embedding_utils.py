@@ -0,0 +1,161 @@
+"""
+Unit tests for SphinxAI embedding storage utilities
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.utils.embedding_utils import (
+    EmbeddingDiskCache,
+    decode_embedding_b64,
+    dequantize_int8,
+    encode_embedding_b64,
+    int8_similarity,
+    pack_int8_embedding,
+    quantize_int8,
+    unpack_int8_embeddings,
+)
+
+
+def _normalized(rows):
+    rows = np.asarray(rows, dtype=np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+class TestInt8Embeddings:
+    """Test cases for int8 embedding quantization"""
+
+    def test_quantize_int8_roundtrip(self):
+        """Test quantized rows reconstruct the input within one step"""
+        embeddings = _normalized(np.random.default_rng(0).normal(size=(8, 32)))
+        quantized, scales = quantize_int8(embeddings)
+
+        assert quantized.dtype == np.int8
+        assert scales.dtype == np.float32
+        assert np.abs(quantized).max() == 127
+        restored = quantized * scales[:, None]
+        assert np.all(np.abs(restored - embeddings) <= scales[:, None])
+
+    def test_quantize_int8_zero_row(self):
+        """Test all-zero rows do not produce NaN scales"""
+        quantized, scales = quantize_int8(np.zeros((2, 4), dtype=np.float32))
+
+        assert not quantized.any()
+        assert np.all(np.isfinite(scales))
+
+    def test_int8_similarity_matches_float(self):
+        """Test int8 similarity ranks content like the float32 dot product"""
+        rng = np.random.default_rng(1)
+        content = _normalized(rng.normal(size=(16, 64)))
+        query = _normalized(rng.normal(size=(1, 64)))[0]
+        quantized, scales = quantize_int8(content)
+
+        scores = int8_similarity(query, quantized, scales)
+
+        np.testing.assert_allclose(scores, content @ query, atol=0.02)
+        assert np.argmax(scores) == np.argmax(content @ query)
+
+    def test_pack_int8_embedding_roundtrip(self):
+        """Test packed result embeddings unpack to the quantized rows"""
+        embeddings = _normalized(np.random.default_rng(2).normal(size=(3, 16)))
+        quantized, scales = quantize_int8(embeddings)
+
+        packed = [pack_int8_embedding(quantized[i], scales[i]) for i in range(3)]
+        rows, row_scales = unpack_int8_embeddings(json.loads(json.dumps(packed)))
+
+        np.testing.assert_array_equal(rows, quantized)
+        np.testing.assert_array_equal(row_scales, scales)
+        restored = dequantize_int8(rows, row_scales)
+        assert np.all(np.abs(restored - embeddings) <= scales[:, None])
+
+    def test_embedding_b64_roundtrip(self):
+        """Test base64 float16 transport decodes to the embedding"""
+        embedding = _normalized(np.random.default_rng(3).normal(size=(1, 24)))[0]
+
+        encoded = encode_embedding_b64(embedding)
+        decoded = decode_embedding_b64(encoded)
+
+        assert encoded["dim"] == 24
+        assert decoded.dtype == np.float16
+        np.testing.assert_allclose(decoded, embedding, atol=1e-3)
+
+
+class TestEmbeddingDiskCache:
+    """Test cases for EmbeddingDiskCache class"""
+
+    def test_put_and_get(self):
+        """Test stored embeddings are returned and misses are None"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = EmbeddingDiskCache(temp_dir)
+            keys = [cache.content_key("noz kuchenny"), cache.content_key("osełka")]
+            embeddings = _normalized([[1.0, 2.0, 3.0], [3.0, 2.0, 1.0]])
+
+            cache.put_many(keys, embeddings)
+            hits = cache.get_many(keys + [cache.content_key("brak")])
+
+            np.testing.assert_array_equal(hits[0], embeddings[0])
+            np.testing.assert_array_equal(hits[1], embeddings[1])
+            assert hits[2] is None
+            assert len(cache) == 2
+
+    def test_persistence(self):
+        """Test embeddings survive reopening the cache directory"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = EmbeddingDiskCache(temp_dir)
+            key = cache.content_key("noz")
+            cache.put_many([key], _normalized([[0.0, 1.0]]))
+            cache.put_many(
+                [key, cache.content_key("ostrze")],
+                _normalized([[0.0, 1.0], [1.0, 0.0]]),
+            )
+
+            reopened = EmbeddingDiskCache(temp_dir)
+
+            assert len(reopened) == 2
+            np.testing.assert_array_equal(reopened.get_many([key])[0], [0.0, 1.0])
+
+    def test_index_is_appended(self):
+        """Test writes append new keys instead of rewriting the index"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = EmbeddingDiskCache(temp_dir)
+            first, second = cache.content_key("noz"), cache.content_key("ostrze")
+            cache.put_many([first], _normalized([[0.0, 1.0]]))
+            before = cache.index_path.read_text(encoding="utf-8")
+            cache.put_many([first, second], _normalized([[0.0, 1.0], [1.0, 0.0]]))
+
+            after = cache.index_path.read_text(encoding="utf-8")
+
+            assert before == f"2\n{first}\n"
+            assert after == f"{before}{second}\n"
+
+    def test_reads_during_writes(self):
+        """Test lookups racing with writes see rows and data consistently"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = EmbeddingDiskCache(temp_dir)
+            keys = [cache.content_key(f"post {i}") for i in range(200)]
+            errors = []
+
+            def write():
+                for key in keys:
+                    cache.put_many([key], _normalized([[1.0, 2.0]]))
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            while writer.is_alive():
+                try:
+                    cache.get_many(keys)
+                except Exception as e:
+                    errors.append(e)
+            writer.join()
+
+            assert errors == []
+            assert all(hit is not None for hit in cache.get_many(keys))
@@ -0,0 +1,57 @@
+"""
+Unit tests for SphinxAI top-k selection helpers
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.utils.fast_sim import cosine_topk
+from SphinxAI.utils.topk import topk
+
+
+class TestCosineTopK:
+    """Test cases for cosine_topk function"""
+
+    def test_matches_full_sort(self):
+        """Test top-k matches sorting all dot products"""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(50, 16)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        query = embeddings[7]
+
+        indices, scores = cosine_topk(query, embeddings, 5)
+
+        expected = np.argsort(embeddings @ query)[::-1][:5]
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_allclose(scores, (embeddings @ query)[expected], rtol=1e-5)
+        assert indices[0] == 7
+
+    def test_k_larger_than_rows(self):
+        """Test k is clamped to the number of rows and k=0 is empty"""
+        embeddings = np.eye(3, dtype=np.float32)
+
+        indices, scores = cosine_topk(embeddings[1], embeddings, 10)
+        empty_indices, empty_scores = cosine_topk(embeddings[1], embeddings, 0)
+
+        assert len(indices) == 3 and indices[0] == 1
+        assert scores[0] == 1.0
+        assert len(empty_indices) == 0 and len(empty_scores) == 0
+
+
+class TestTopK:
+    """Test cases for topk function"""
+
+    def test_matches_sorted_with_ties(self):
+        """Test top-k matches a stable descending sort"""
+        items = [("a", 0.5), ("b", 0.9), ("c", 0.5), ("d", 0.1), ("e", 0.9)]
+
+        selected = topk(items, 3, key=lambda item: item[1])
+
+        assert selected == sorted(items, key=lambda item: item[1], reverse=True)[:3]
+        assert topk(items, 0, key=lambda item: item[1]) == []
@@ -0,0 +1,128 @@
+"""
+Unit tests for SphinxAI GenAI handler
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.core.constants import GENAI_INT8_SUBDIR, PROMPT_BUCKET_CHARS
+from SphinxAI.handlers.genai_handler import GenAIHandler
+from SphinxAI.utils.embedding_utils import decode_embedding_b64
+
+
+class EchoPipeline:
+    """LLM pipeline stand-in whose generate echoes its prompts"""
+
+    def __init__(self):
+        self.batches = []
+
+    def generate(self, prompts, config):
+        self.batches.append(list(prompts))
+        return SimpleNamespace(texts=[f" {prompt} " for prompt in prompts])
+
+
+def make_handler(**kwargs):
+    """Create handler with an echo pipeline instead of a loaded model"""
+    handler = GenAIHandler(**kwargs)
+    handler.pipe = EchoPipeline()
+    return handler
+
+
+class TestGenerateBatch:
+    """Test cases for GenAIHandler.generate_batch"""
+
+    PROMPTS = [
+        "a" * (PROMPT_BUCKET_CHARS * 2),
+        "krótki",
+        "b" * PROMPT_BUCKET_CHARS,
+        "drugi krótki",
+    ]
+
+    def test_outputs_follow_prompt_order_across_buckets(self):
+        """Test length buckets are generated shortest first, returned in order"""
+        handler = make_handler(enable_prefix_caching=False)
+
+        outputs = handler.generate_batch(self.PROMPTS)
+
+        assert outputs == self.PROMPTS
+        assert handler.pipe.batches == [
+            ["krótki", "drugi krótki"],
+            [self.PROMPTS[2]],
+            [self.PROMPTS[0]],
+        ]
+
+    def test_prefix_caching_uses_one_batch(self):
+        """Test continuous batching sends all prompts in one call"""
+        handler = make_handler(enable_prefix_caching=True)
+
+        outputs = handler.generate_batch(self.PROMPTS)
+
+        assert outputs == self.PROMPTS
+        assert handler.pipe.batches == [self.PROMPTS]
+
+    def test_without_model(self):
+        """Test every prompt gets the unavailable message without a pipeline"""
+        handler = GenAIHandler()
+
+        assert handler.generate_batch(["a", "b"]) == ["Model not available"] * 2
+        assert handler.generate_batch([]) == []
+
+
+class TestResolvePipelinePath:
+    """Test cases for GenAIHandler._resolve_pipeline_path"""
+
+    def test_int8_copy_is_preferred(self):
+        """Test the converter's INT8 copy is used when it exists"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model_path = Path(temp_dir)
+            int8_path = model_path / GENAI_INT8_SUBDIR
+            int8_path.mkdir()
+            (int8_path / "openvino_model.xml").touch()
+
+            assert GenAIHandler()._resolve_pipeline_path(model_path) == int8_path
+            handler = GenAIHandler(quantize_llm=False)
+            assert handler._resolve_pipeline_path(model_path) == model_path
+
+    def test_int8_copy_is_skipped(self):
+        """Test compressed exports and missing copies use the model as is"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model_path = Path(temp_dir)
+            handler = GenAIHandler()
+            assert handler._resolve_pipeline_path(model_path) == model_path
+
+            (model_path / GENAI_INT8_SUBDIR).mkdir()
+            (model_path / GENAI_INT8_SUBDIR / "openvino_model.xml").touch()
+            config = {"quantization_config": {"bits": 4}}
+            (model_path / "openvino_config.json").write_text(json.dumps(config))
+            assert handler._resolve_pipeline_path(model_path) == model_path
+
+
+class TestProcessQuery:
+    """Test cases for GenAIHandler.process_query"""
+
+    def test_embedding_is_base64_encoded(self):
+        """Test the query embedding is returned as base64 float16 payload"""
+        handler = GenAIHandler()
+        embedding = np.array([0.6, 0.8, 0.0], dtype=np.float32)
+        handler._encode_prepared = Mock(return_value=embedding[np.newaxis])
+        handler.enhance_query = Mock(return_value="nóż kuchenny ostry")
+
+        result = handler.process_query("Nóż kuchenny")
+
+        assert set(result["embedding"]) == {"embedding_b16", "dim"}
+        assert result["embedding"]["dim"] == 3
+        np.testing.assert_allclose(
+            decode_embedding_b64(result["embedding"]), embedding, atol=1e-3
+        )
+        json.dumps(result)
@@ -0,0 +1,35 @@
+"""
+Unit tests for SphinxAI result data classes
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.core.interfaces import ProcessingResult, SearchResult
+
+
+class TestResultDataClasses:
+    """Test cases for SearchResult and ProcessingResult"""
+
+    def test_none_defaults_become_empty(self):
+        """Test metadata=None and errors=None give empty containers"""
+        result = SearchResult("1", "Nóż", "Treść", "index.php", metadata=None)
+
+        assert result.metadata == {}
+        assert result.to_dict()["metadata"] == {}
+        assert ProcessingResult(True, errors=None).errors == []
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs kw_only fields")
+    def test_optional_fields_are_keyword_only(self):
+        """Test relevance_score, ai_summary and metadata cannot be positional"""
+        with pytest.raises(TypeError):
+            SearchResult("1", "Nóż", "Treść", "index.php", 0.5)
+
+        result = SearchResult("1", "Nóż", "Treść", "index.php", relevance_score=0.5)
+        assert result.relevance_score == 0.5
@@ -0,0 +1,157 @@
+"""
+Unit tests for SphinxAI search coordinator
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import Mock
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.core.interfaces import SearchResult
+from SphinxAI.core.search_coordinator import SearchCoordinator
+
+ROWS = [
+    {"id": str(i), "title": f"Temat {i}", "content": f"Treść {i}", "weight": weight}
+    for i, weight in enumerate([1.0, 5.0, 3.0, 4.0, 2.0])
+]
+
+
+def make_sphinx_handler():
+    """Create Sphinx handler mock returning ROWS"""
+    handler = Mock(spec=["search", "get_status"])
+    handler.search.return_value = [dict(row) for row in ROWS]
+    return handler
+
+
+def make_genai_handler():
+    """Create GenAI handler mock with batched and streamed summaries"""
+    handler = Mock(
+        spec=["generate_summaries", "generate_summary", "generate_forum_summary"]
+    )
+    handler.generate_summaries.side_effect = lambda queries, contents: [
+        f"S: {content}" for content in contents
+    ]
+    handler.generate_forum_summary.return_value = "Podsumowanie forum"
+    return handler
+
+
+class TestSearchCoordinator:
+    """Test cases for SearchCoordinator class"""
+
+    def test_ranks_before_summarizing(self):
+        """Test only the top max_results are summarized, in ranked order"""
+        genai = make_genai_handler()
+        coordinator = SearchCoordinator(
+            make_sphinx_handler(), genai_handler=genai, max_results=2
+        )
+
+        result = coordinator.search("temat")
+
+        genai.generate_summaries.assert_called_once_with(
+            ["temat", "temat"], ["Temat 1 Treść 1", "Temat 3 Treść 3"]
+        )
+        assert [r["id"] for r in result.data["results"]] == ["1", "3"]
+        assert result.data["results"][0]["ai_summary"] == "S: Temat 1 Treść 1"
+        assert result.data["total_results"] == 5
+
+    def test_simple_forum_summary_counts_all_matches(self):
+        """Test the fallback forum summary reports the full result count"""
+        coordinator = SearchCoordinator(make_sphinx_handler(), max_results=2)
+
+        result = coordinator.search("temat", {"use_ai_summary": False})
+
+        assert result.data["forum_summary"].startswith("Znaleziono 5 wyników")
+        assert result.message == "Found 5 results"
+
+    def test_cache_hit_and_miss(self):
+        """Test repeated searches are served from cache unless disabled"""
+        sphinx = make_sphinx_handler()
+        coordinator = SearchCoordinator(sphinx, max_results=2)
+
+        first = coordinator.search("temat")
+        cached = asyncio.run(coordinator.search_async("temat"))
+        assert sphinx.search.call_count == 1
+        assert cached.to_dict() == first.to_dict()
+
+        asyncio.run(coordinator.search_async("temat", {"use_cache": False}))
+        coordinator.search("inny temat")
+        assert sphinx.search.call_count == 3
+        assert coordinator.response_cache.hits == 1
+
+    def test_attach_summaries_falls_back_per_item(self):
+        """Test items the batch left empty get the non-GenAI summary"""
+        genai = make_genai_handler()
+        genai.generate_summaries.side_effect = None
+        genai.generate_summaries.return_value = ["Wsadowe", ""]
+        ai = Mock(spec=["generate_summary"])
+        ai.generate_summary.return_value = "Tradycyjne"
+        coordinator = SearchCoordinator(Mock(), ai_handler=ai, genai_handler=genai)
+        results = [
+            SearchResult("1", "A", "Treść A", ""),
+            SearchResult("2", "", "B", ""),
+        ]
+
+        coordinator._attach_summaries("zapytanie", results, True, True)
+
+        assert [r.ai_summary for r in results] == ["Wsadowe", "Tradycyjne"]
+        ai.generate_summary.assert_called_once_with("zapytanie", "B")
+        genai.generate_summary.assert_not_called()
+
+    def test_attach_summaries_retries_failed_batch_per_item(self):
+        """Test a failing batch call falls back to per-item GenAI summaries"""
+        genai = make_genai_handler()
+        genai.generate_summaries.side_effect = RuntimeError("batch failed")
+        genai.generate_summary.side_effect = lambda query, content: f"P: {content}"
+        coordinator = SearchCoordinator(Mock(), genai_handler=genai)
+        results = [
+            SearchResult("1", "A", "Treść A", ""),
+            SearchResult("2", "", "B", ""),
+        ]
+
+        coordinator._attach_summaries("zapytanie", results, True, True)
+
+        assert [r.ai_summary for r in results] == ["P: A Treść A", "P: B"]
+
+    def test_search_stream_event_order(self):
+        """Test streamed summary chunks arrive in order, result by result"""
+
+        def summarize_stream(content, query, on_chunk):
+            for word in content.split():
+                on_chunk(word)
+            return content
+
+        genai = make_genai_handler()
+        genai.summarize_content_stream = summarize_stream
+        coordinator = SearchCoordinator(
+            make_sphinx_handler(), genai_handler=genai, max_results=2
+        )
+
+        async def collect():
+            return [event async for event in coordinator.search_stream("temat")]
+
+        events = asyncio.run(collect())
+
+        summary_events = [
+            (event["event"], event["index"], event["text"])
+            for event in events
+            if event["event"].startswith("summary")
+        ]
+        assert events[0]["event"] == "results"
+        assert summary_events == [
+            ("summary_chunk", 0, "Temat"),
+            ("summary_chunk", 0, "1"),
+            ("summary_chunk", 0, "Treść"),
+            ("summary_chunk", 0, "1"),
+            ("summary", 0, "Temat 1 Treść 1"),
+            ("summary_chunk", 1, "Temat"),
+            ("summary_chunk", 1, "3"),
+            ("summary_chunk", 1, "Treść"),
+            ("summary_chunk", 1, "3"),
+            ("summary", 1, "Temat 3 Treść 3"),
+        ]
+        assert [event["event"] for event in events[-2:]] == ["forum_summary", "done"]
+        assert events[-1]["data"]["results"][1]["ai_summary"] == "Temat 3 Treść 3"
@@ -0,0 +1,137 @@
+"""
+Unit tests for SphinxAI semantic response cache
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.utils.semantic_cache import GenerativeCache, SemanticCache
+
+# Fixed unit embeddings standing in for a sentence transformer
+EMBEDDINGS = {
+    "najlepszy noz kuchenny": [1.0, 0.0, 0.0],
+    "polecany noz do kuchni": [0.96, 0.28, 0.0],
+    "ostrzenie siekiery": [0.0, 0.0, 1.0],
+    "noz kuchenny i jego ostrzenie": [0.75, 0.0, 0.66],
+}
+
+
+def fake_embedder(texts):
+    return np.array([EMBEDDINGS[text] for text in texts], dtype=np.float32)
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache class"""
+
+    def test_exact_hit_ignores_case_and_whitespace(self):
+        """Test exact tier matches the normalized query"""
+        cache = SemanticCache()
+        cache.set("Najlepszy  nóż", "result", namespace="hybrid")
+
+        assert cache.get("najlepszy NÓŻ", namespace="hybrid") == "result"
+        assert cache.get("najlepszy nóż", namespace="sphinx") is None
+        assert cache.hits == 1
+
+    def test_exact_hit_keeps_diacritics(self):
+        """Test queries differing only in diacritics get separate entries"""
+        cache = SemanticCache()
+        cache.set("łoś", "elk")
+
+        assert SemanticCache.make_key("łoś", None) != SemanticCache.make_key(
+            "los", None
+        )
+        assert cache.get("los") is None
+        assert cache.get("Łoś") == "elk"
+
+    def test_get_returns_copy(self):
+        """Test callers mutating a hit do not change the cached value"""
+        cache = SemanticCache()
+        value = {"results": [1, 2]}
+        cache.set("nóż", value)
+        value["results"].append(3)
+
+        cache.get("nóż")["results"].clear()
+
+        assert cache.get("nóż") == {"results": [1, 2]}
+
+    def test_semantic_hit(self):
+        """Test near-duplicate queries are served from the semantic tier"""
+        cache = SemanticCache(embedder=fake_embedder, similarity_threshold=0.85)
+        cache.set("najlepszy noz kuchenny", "result")
+
+        assert cache.get("polecany noz do kuchni") == "result"
+        assert cache.get("ostrzenie siekiery") is None
+        assert cache.semantic_hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction_and_ttl(self):
+        """Test entries are evicted by capacity and expire by TTL"""
+        cache = SemanticCache(max_entries=1)
+        cache.set("pierwsze", 1)
+        cache.set("drugie", 2)
+
+        assert cache.get("pierwsze") is None
+        assert cache.get("drugie") == 2
+
+        expired = SemanticCache(ttl=0)
+        expired.set("zapytanie", 1)
+        assert expired.get("zapytanie") is None
+
+
+class TestGenerativeCache:
+    """Test cases for GenerativeCache class"""
+
+    def test_combines_related_summaries(self):
+        """Test compound query is answered from several cached summaries"""
+        cache = GenerativeCache(fake_embedder)
+        cache.set(cache.embed("najlepszy noz kuchenny"), "Noże kuchenne.")
+        cache.set(cache.embed("ostrzenie siekiery"), "Ostrzenie.")
+
+        merged = cache.lookup(cache.embed("noz kuchenny i jego ostrzenie"))
+
+        assert merged == GenerativeCache.MERGED_SUMMARY_PREFIX + (
+            "Noże kuchenne. Ostrzenie."
+        )
+
+    def test_single_related_summary_is_miss(self):
+        """Test one related entry below the combined threshold is a miss"""
+        cache = GenerativeCache(fake_embedder)
+        cache.set(cache.embed("najlepszy noz kuchenny"), "Noże kuchenne.")
+
+        assert cache.lookup(cache.embed("polecany noz do kuchni")) is None
+        assert cache.misses == 1
+
+    def test_repeated_query_replaces_its_summary(self):
+        """Test a repeated query never adds up with its own old summaries"""
+        cache = GenerativeCache(fake_embedder)
+        embedding = cache.embed("najlepszy noz kuchenny")
+
+        for attempt in range(3):
+            assert cache.lookup(embedding) is None
+            cache.set(embedding, f"Podsumowanie {attempt}")
+
+        assert len(cache) == 1
+        cache.set(cache.embed("ostrzenie siekiery"), "Ostrzenie.")
+        cache.set(cache.embed("polecany noz do kuchni"), "Noże do kuchni.")
+        assert cache.lookup(cache.embed("noz kuchenny i jego ostrzenie")) == (
+            GenerativeCache.MERGED_SUMMARY_PREFIX
+            + "Podsumowanie 2 Noże do kuchni. Ostrzenie."
+        )
+
+    def test_ttl_and_clear(self):
+        """Test summaries expire by TTL and are dropped by clear()"""
+        expired = GenerativeCache(fake_embedder, ttl=0)
+        expired.set(expired.embed("najlepszy noz kuchenny"), "Noże kuchenne.")
+        assert expired.lookup(expired.embed("najlepszy noz kuchenny")) is None
+        assert len(expired) == 0
+
+        cache = GenerativeCache(fake_embedder)
+        cache.set(cache.embed("najlepszy noz kuchenny"), "Noże kuchenne.")
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,184 @@
+"""
+Unit tests for SphinxAI Sphinx search handler
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.core.interfaces import ProcessingResult
+from SphinxAI.core.search_coordinator import SearchAPIHandler, SearchCoordinator
+from SphinxAI.handlers import sphinx_handler
+from SphinxAI.handlers.sphinx_handler import (
+    AsyncSphinxSearchHandler,
+    PendingSearch,
+    SphinxSearchHandler,
+)
+from SphinxAI.utils.connection_pool import ConnectionPool
+
+ROW = (7, 1.5, "Nóż", 3, 7, 1, "Kuchnia", 2, 10, "Treść")
+
+
+def make_handler(connection):
+    """Create handler whose pool hands out the given connection"""
+    with patch.object(sphinx_handler, "PYMYSQL_AVAILABLE", True):
+        handler = SphinxSearchHandler(index_name="smf_posts")
+    handler._pool = ConnectionPool(Mock(return_value=connection))
+    return handler
+
+
+class TestPendingSearch:
+    """Test cases for PendingSearch class"""
+
+    def test_fetch_reads_result_and_releases_connection(self):
+        """Test the pipelined result is read with pymysql's private API"""
+        connection = Mock(open=True)
+        connection._result.rows = (ROW,)
+        handler = make_handler(connection)
+        pending = PendingSearch(handler, handler._pool.acquire())
+
+        results = pending.fetch()
+        pending.cancel()
+
+        connection._read_query_result.assert_called_once_with()
+        assert results[0]["id"] == "7"
+        assert results[0]["content"] == "Treść"
+        assert results[0]["url"] == "index.php?topic=3.msg7#msg7"
+        assert len(handler._pool) == 1
+
+    def test_read_errors_discard_connection(self):
+        """Test a failed read raises from fetch and is ignored by cancel"""
+        connection = Mock(open=True)
+        connection._read_query_result.side_effect = ConnectionError("gone away")
+        handler = make_handler(connection)
+
+        with pytest.raises(ConnectionError):
+            PendingSearch(handler, handler._pool.acquire()).fetch()
+        PendingSearch(handler, handler._pool.acquire()).cancel()
+
+        assert connection.close.call_count == 2
+        assert len(handler._pool) == 0
+
+
+class TestSendSearch:
+    """Test cases for pipelined Sphinx searches"""
+
+    def test_failed_send_falls_back_to_search(self):
+        """Test the coordinator searches normally when sending fails"""
+        pytest.importorskip("pymysql")
+        connection = Mock(open=True)
+        connection._execute_command.side_effect = ConnectionError("gone away")
+        handler = make_handler(connection)
+
+        assert handler.send_search("nóż kuchenny") is None
+        connection.close.assert_called_once()
+
+    def test_pending_search_is_finished_on_error(self):
+        """Test the connection is returned when the cache lookup raises"""
+        handler = make_handler(Mock(open=True))
+        pending = Mock()
+        handler.send_search = Mock(return_value=pending)
+        coordinator = SearchCoordinator(handler)
+        coordinator.response_cache = Mock()
+        coordinator.response_cache.get_exact.return_value = None
+        coordinator.response_cache.can_match_similar.return_value = True
+        coordinator.response_cache.get_similar.side_effect = RuntimeError("down")
+
+        result = coordinator.search("nóż kuchenny")
+
+        assert not result.success
+        pending.cancel.assert_called_once_with()
+        pending.fetch.assert_not_called()
+
+    def test_exact_cache_hit_skips_sphinx(self):
+        """Test exact cache hits are served without sending a search"""
+        handler = make_handler(Mock(open=True))
+        handler.send_search = Mock()
+        handler.search_many = Mock()
+        coordinator = SearchCoordinator(handler)
+        namespace = ("hybrid", coordinator.max_results, True, True)
+        cached = ProcessingResult(success=True, message="Found 1 results")
+        coordinator.response_cache.set("nóż kuchenny", cached, namespace)
+
+        result = coordinator.search("Nóż  kuchenny")
+
+        assert result.message == "Found 1 results"
+        handler.send_search.assert_not_called()
+        handler.search_many.assert_not_called()
+
+    def test_failed_fetch_retries_search(self):
+        """Test a pipelined search that cannot be read is sent again"""
+        handler = make_handler(Mock(open=True))
+        handler.send_search = Mock(return_value=Mock())
+        handler.send_search.return_value.fetch.side_effect = ConnectionError()
+        handler.search_many = Mock(return_value=[[]])
+        coordinator = SearchCoordinator(handler)
+
+        result = coordinator.search("nóż kuchenny", {"use_cache": False})
+
+        handler.search_many.assert_called_once_with([("nóż kuchenny", 20)])
+        assert result.message == "No results found"
+
+    def test_trivial_query_is_rejected_without_search(self):
+        """Test trivial queries get the API validation error from search()"""
+        handler = make_handler(Mock(open=True))
+        handler.send_search = Mock()
+        coordinator = SearchCoordinator(handler)
+
+        result = coordinator.search("a")
+        validation = SearchAPIHandler(coordinator)._validate_request({"query": "a"})
+
+        assert not result.success
+        assert result.to_dict() == validation.to_dict()
+        handler.send_search.assert_not_called()
+
+
+class TestAsyncSphinxSearchHandler:
+    """Test cases for AsyncSphinxSearchHandler class"""
+
+    @staticmethod
+    def make_async_handler(**kwargs):
+        """Create async handler without opening any connection"""
+        with patch.multiple(
+            sphinx_handler, PYMYSQL_AVAILABLE=True, AIOMYSQL_AVAILABLE=True
+        ):
+            return AsyncSphinxSearchHandler(index_name="smf_posts", **kwargs)
+
+    def test_lazy_content_skips_content_column(self):
+        """Test the async path selects content only when it is not hydrated"""
+        handler = self.make_async_handler(content_db={"database": "smf"})
+        cursor = AsyncMock()
+        cursor.fetchall.return_value = (ROW[:-1],)
+        connection = MagicMock()
+        connection.cursor.return_value.__aenter__.return_value = cursor
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = connection
+        handler._get_async_pool = AsyncMock(return_value=pool)
+        handler.hydrate_content = Mock()
+        coordinator = SearchCoordinator(handler)
+
+        asyncio.run(coordinator.search_async("nóż kuchenny", {"use_cache": False}))
+
+        sql = cursor.execute.call_args[0][0]
+        assert sql == handler._search_sql[False]
+        handler.hydrate_content.assert_called_once()
+
+    def test_stale_pool_is_closed(self):
+        """Test the pool of a finished event loop has its sockets shut down"""
+        connection = Mock()
+        stale_pool = Mock(_free=[connection], _used=set())
+        stale_loop = asyncio.new_event_loop()
+        stale_loop.close()
+
+        AsyncSphinxSearchHandler._close_stale_pool(stale_pool, stale_loop)
+
+        stale_pool.close.assert_called_once_with()
+        sock = connection._writer.transport.get_extra_info.return_value
+        sock.shutdown.assert_called_once()
@@ -0,0 +1,27 @@
+"""
+Unit tests for SphinxAI Sphinx integration helpers
+"""
+
+import os
+import sys
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.sphinx_integration import _fold_polish_diacritics
+
+
+class TestFoldPolishDiacritics:
+    """Test cases for _fold_polish_diacritics function"""
+
+    def test_folds_polish_text(self):
+        """Test Polish letters, including Ł, are folded to ASCII"""
+        assert _fold_polish_diacritics("Zażółć gęślą jaźń Łódź") == (
+            "Zazolc gesla jazn Lodz"
+        )
+
+    def test_folds_each_character_independently(self):
+        """Test unfoldable characters do not stop other letters from folding"""
+        assert _fold_polish_diacritics("café łódź 😀") == "cafe lodz 😀"
+        assert _fold_polish_diacritics("ﬁ straße Ñandú") == "ﬁ straße Nandu"
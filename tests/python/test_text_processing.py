@@ -0,0 +1,123 @@
+"""
+Unit tests for SphinxAI Polish text processing utilities
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+# Add the project root to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# SphinxAI imports after path setup
+from SphinxAI.core.constants import (
+    POLISH_DIACRITICS_MAP,
+    POLISH_DIACRITICS_TRANS,
+    POLISH_STOPWORDS,
+)
+from SphinxAI.utils.text_processing import (
+    PolishTextProcessor,
+    has_polish_chars,
+    normalize_diacritics_fast,
+)
+
+
+class TestPolishTextProcessor:
+    """Test cases for PolishTextProcessor class"""
+
+    def test_normalize_diacritics(self):
+        """Test Polish diacritics are mapped to Latin characters"""
+        processor = PolishTextProcessor()
+
+        assert (
+            processor.normalize_diacritics("Zażółć gęślą jaźń") == "Zazolc gesla jazn"
+        )
+        assert processor.normalize_diacritics("ŁÓDŹ") == "LODZ"
+        assert processor.normalize_diacritics("") == ""
+
+    def test_translation_table_matches_map(self):
+        """Test translation table covers every entry of the diacritics map"""
+        for polish_char, latin_char in POLISH_DIACRITICS_MAP.items():
+            assert polish_char.translate(POLISH_DIACRITICS_TRANS) == latin_char
+
+    def test_remove_stopwords(self):
+        """Test stopwords are filtered case-insensitively"""
+        processor = PolishTextProcessor()
+
+        assert processor.remove_stopwords(["Nóż", "i", "W", "kuchni"]) == [
+            "Nóż",
+            "kuchni",
+        ]
+        assert isinstance(POLISH_STOPWORDS, frozenset)
+
+    def test_remove_stopwords_normalized(self):
+        """Test stopwords are matched in diacritics-folded normalized text"""
+        processor = PolishTextProcessor()
+        normalized = processor.preprocess_text("Nóż będzie już w kuchni")
+
+        assert processor.remove_stopwords_normalized(normalized) == "noz kuchni"
+
+    def test_tokenize_normalized(self):
+        """Test fused tokenization matches preprocessing plus stopword removal"""
+        processor = PolishTextProcessor()
+        raw = "[b]Nóż[/b]  będzie\tjuż <i>w</i> KUCHNI, https://example.com ok"
+        expected = processor.remove_stopwords_normalized(processor.preprocess_text(raw))
+
+        assert processor.tokenize_normalized(raw) == expected.split()
+        assert processor.tokenize_normalized("") == []
+
+    def test_clean_forum_content(self):
+        """Test BBCode, HTML, URLs and e-mails are stripped from content"""
+        processor = PolishTextProcessor()
+        raw = "[b]Nóż[/b] <i>ostry</i>  https://example.com/a?b=1 kontakt a@b.pl"
+
+        assert processor.clean_forum_content(raw) == "Nóż ostry kontakt"
+
+        # Regex fallback must produce the same result as the Hyperscan backend
+        with patch("SphinxAI.utils.text_processing.hyperscan_backend", None):
+            assert processor.clean_forum_content(raw) == "Nóż ostry kontakt"
+
+    def test_hyperscan_matches_regex_on_polish_text(self):
+        """Test both noise backends agree on non-ASCII Polish content"""
+        pytest.importorskip("hyperscan")
+        processor = PolishTextProcessor()
+        samples = [
+            "kontakt: żółw@poczta.pl, łukasz@wp.pl",
+            "pisz na jan@wp.pl lub [b]ząb[/b] <i>łódź</i> https://ząb.pl/ś?x=1\xa0koniec",
+            "[url=https://a.pl]łącze[/url] żółć<br/> [quote\xa0author=ł]x[/quote]",
+        ]
+
+        expected = [processor.clean_forum_content(text) for text in samples]
+        with patch("SphinxAI.utils.text_processing.hyperscan_backend", None):
+            fallback = [processor.clean_forum_content(text) for text in samples]
+
+        assert expected == fallback
+        assert expected[0] == "kontakt: żółw@poczta.pl, łukasz@wp.pl"
+
+    def test_has_polish_chars(self):
+        """Test detection of Polish diacritic characters"""
+        assert has_polish_chars("Zażółć")
+        assert has_polish_chars("ŁÓDŹ")
+        assert not has_polish_chars("Zazolc gesla jazn")
+        assert not has_polish_chars("")
+
+    def test_remove_stopword_ids(self):
+        """Test stopword token ids are filtered using the vocabulary"""
+        processor = PolishTextProcessor()
+        processor.set_vocabulary({"\u2581i": 5, "w": 7, "\u2581noz": 11, "ostry": 13})
+
+        ids = np.array([11, 5, 13, 7, 5], dtype=np.int32)
+
+        np.testing.assert_array_equal(processor.remove_stopword_ids(ids), [11, 13])
+
+    def test_normalize_diacritics_fast(self):
+        """Test bytes-level normalization matches the str translation"""
+        text = "Zażółć gęślą jaźń, ŁÓDŹ i café"
+
+        assert normalize_diacritics_fast(text.encode("utf-8")) == text.translate(
+            POLISH_DIACRITICS_TRANS
+        ).encode("utf-8")
+        assert normalize_diacritics_fast(b"plain ascii") == b"plain ascii"
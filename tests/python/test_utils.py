@@ -52,6 +52,13 @@ class TestSphinxAIImports:
             # Constants module might not exist yet
             pass
 
+    def test_precompiled_prompts_match_format(self):
+        """Test precompiled prompt functions render like str.format"""
+        fields = {"query": "nóż", "content": "Ostry {nóż}", "context": "Forum"}
+        for name, template in constants.ENHANCED_POLISH_PROMPTS.items():
+            render = constants.ENHANCED_POLISH_PROMPT_FNS[name]
+            assert render(**fields) == template.format(**fields)
+
 
 class TestSphinxAIIntegration:
     """Integration tests for SphinxAI components"""